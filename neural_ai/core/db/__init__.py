@@ -6,7 +6,7 @@ factory-t az aszinkron adatbázis műveletekhez.
 
 from .factory import DatabaseFactory
 from .implementations.model_base import Base
-from .implementations.models import DynamicConfig, LogEntry
+from .implementations.models import DeadLetterEntry, DynamicConfig, LogEntry
 from .implementations.sqlalchemy_session import (
     DatabaseManager,
     close_db,
@@ -22,6 +22,7 @@ from .implementations.sqlalchemy_session import (
 __all__ = [
     # Modellek
     "Base",
+    "DeadLetterEntry",
     "DynamicConfig",
     "LogEntry",
     # Session függvények
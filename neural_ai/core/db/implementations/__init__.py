@@ -4,7 +4,7 @@ Ez a modul tartalmazza az adatbázis műveletek konkrét implementációit.
 """
 
 from .model_base import Base
-from .models import DynamicConfig, LogEntry
+from .models import DeadLetterEntry, DynamicConfig, LogEntry
 from .sqlalchemy_session import (
     DatabaseManager,
     close_db,
@@ -20,6 +20,7 @@ from .sqlalchemy_session import (
 __all__ = [
     # Modellek
     "Base",
+    "DeadLetterEntry",
     "DynamicConfig",
     "LogEntry",
     # Session függvények
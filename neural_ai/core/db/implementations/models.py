@@ -1,12 +1,12 @@
 """Adatbázis modellek a Neural AI Next rendszerhez.
 
 Ez a modul definiálja az összes adatbázis táblát és modellt a rendszerben,
-beleértve a DynamicConfig és LogEntry modelleket.
+beleértve a DynamicConfig, LogEntry és DeadLetterEntry modelleket.
 """
 
 from typing import Any
 
-from sqlalchemy import Boolean, Index, String, Text
+from sqlalchemy import Boolean, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -154,3 +154,72 @@ class LogEntry(Base):
         """
         msg = self.message[:50]
         return f"<LogEntry(level='{self.level}', logger='{self.logger_name}', message='{msg}...')>"
+
+
+class DeadLetterEntry(Base):
+    """Kézbesíthetetlen eseményeket (dead letter) tároló modell.
+
+    Az EventBus ide menti a callback-ben hibát okozó és a nem dekódolható
+    eseményeket, hogy később újra a buszra küldhetők legyenek.
+
+    Attributes:
+        letter_id: A bejegyzés egyedi azonosítója.
+        event_type: Az esemény típusa.
+        reason: A hiba helye ('callback' vagy 'decode').
+        subscriber: A hibát okozó feliratkozó neve (callback hibánál).
+        codec_id: A payload codec-jének azonosítója (0 = régi JSON formátum).
+        payload: A kódolt esemény.
+        exception_type: A kivétel típusa.
+        exception_message: A kivétel üzenete.
+        traceback: A traceback információ.
+    """
+
+    __tablename__ = "dead_letter_entries"
+
+    letter_id: Mapped[str] = mapped_column(
+        String(32), unique=True, nullable=False, index=True, doc="A bejegyzés egyedi azonosítója"
+    )
+
+    event_type: Mapped[str] = mapped_column(
+        String(100), nullable=False, index=True, doc="Az esemény típusa"
+    )
+
+    reason: Mapped[str] = mapped_column(
+        String(20), nullable=False, doc="A hiba helye ('callback' vagy 'decode')"
+    )
+
+    subscriber: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, doc="A hibát okozó feliratkozó neve"
+    )
+
+    codec_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, doc="A payload codec-jének azonosítója"
+    )
+
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, doc="A kódolt esemény")
+
+    exception_type: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, doc="A kivétel típusa"
+    )
+
+    exception_message: Mapped[str | None] = mapped_column(
+        Text, nullable=True, doc="A kivétel üzenete"
+    )
+
+    traceback: Mapped[str | None] = mapped_column(
+        Text, nullable=True, doc="A traceback információ"
+    )
+
+    # Indexek
+    __table_args__ = (Index("idx_dead_letter_entries_type_created", "event_type", "created_at"),)
+
+    def __repr__(self) -> str:
+        """Modell string reprezentációja.
+
+        Returns:
+            A modell rövid string reprezentációja.
+        """
+        return (
+            f"<DeadLetterEntry(event_type='{self.event_type}', reason='{self.reason}', "
+            f"subscriber='{self.subscriber}')>"
+        )
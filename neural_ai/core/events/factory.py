@@ -19,8 +19,7 @@ if TYPE_CHECKING:
 class EventBusFactory:
     """EventBus factory osztály.
 
-    Ez az osztály felelős az EventBus példányok létrehozásáért.
-    Jelenleg csak a ZeroMQ-s implementációt támogatja, de a jövőben
+    Ez az osztály felelős az EventBus példányok létrehozásáért. A jövőben
     más implementációk is hozzáadhatók (pl. Redis, Kafka, stb.).
     """
 
@@ -35,8 +34,14 @@ class EventBusFactory:
             EventBusInterface: Az EventBus példány
 
         Note:
-            Jelenleg csak a ZeroMQ-s implementációt támogatja.
+            use_inproc esetén InProcessEventBus jön létre (lásd
+            EventBusConfig.use_inproc).
         """
+        if config is not None and config.use_inproc:
+            from neural_ai.core.events.implementations.inprocess_bus import InProcessEventBus
+
+            return InProcessEventBus(config)
+
         from neural_ai.core.events.implementations.zeromq_bus import EventBus
 
         return EventBus(config)
@@ -81,5 +86,23 @@ class EventBusFactory:
             pub_port=data.get("pub_port", 5555),
             sub_port=data.get("sub_port", 5556),
             use_inproc=data.get("use_inproc", False),
+            codec=data.get("codec", "json"),
+            codec_overrides=data.get("codec_overrides", {}),
+            batch_max_size=data.get("batch_max_size", 1000),
+            batch_max_delay=data.get("batch_max_delay"),
+            subscriber_queue_size=data.get("subscriber_queue_size", 10000),
+            overflow_policy=data.get("overflow_policy", "block"),
+            trusted_producers=data.get("trusted_producers", False),
+            broker_mode=data.get("broker_mode", False),
+            broker_host=data.get("broker_host", "127.0.0.1"),
+            metrics_enabled=data.get("metrics_enabled", True),
+            metrics_port=data.get("metrics_port"),
+            metrics_host=data.get("metrics_host", "127.0.0.1"),
+            dead_letter_enabled=data.get("dead_letter_enabled", False),
+            dead_letter_sink=data.get("dead_letter_sink", "database"),
+            dead_letter_path=data.get("dead_letter_path", "logs/dead_letters.jsonl"),
+            dead_letter_buffer_size=data.get("dead_letter_buffer_size", 10000),
+            dead_letter_batch_size=data.get("dead_letter_batch_size", 500),
+            dead_letter_flush_interval=data.get("dead_letter_flush_interval", 1.0),
         )
         return EventBusFactory.create(bus_config)
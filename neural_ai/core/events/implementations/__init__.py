@@ -3,9 +3,87 @@
 Ez a csomag tartalmazza az EventBus különböző implementációit.
 """
 
+from neural_ai.core.events.implementations.base_bus import BaseEventBus
+from neural_ai.core.events.implementations.broker import EventBroker
+from neural_ai.core.events.implementations.codecs import (
+    EventCodec,
+    JsonEventCodec,
+    MarketDataBinaryCodec,
+    MessageHeader,
+    MsgpackEventCodec,
+)
+from neural_ai.core.events.implementations.columnar import BatchFormat, ColumnarSubscription
+from neural_ai.core.events.implementations.consumer_pool import (
+    ShardedConsumerPool,
+    ShardStats,
+    shard_for,
+)
+from neural_ai.core.events.implementations.dead_letter import (
+    DatabaseDeadLetterSink,
+    DeadLetter,
+    DeadLetterQueue,
+    DeadLetterSink,
+    DeadLetterStats,
+    FileDeadLetterSink,
+    redrive_dead_letters,
+)
+from neural_ai.core.events.implementations.inprocess_bus import InProcessEventBus
+from neural_ai.core.events.implementations.journal import (
+    EventJournal,
+    JournalReader,
+    JournalRecord,
+)
+from neural_ai.core.events.implementations.metrics import (
+    EventBusMetrics,
+    Histogram,
+    MetricsServer,
+    render_prometheus,
+)
+from neural_ai.core.events.implementations.registry import EventRegistry, default_registry
+from neural_ai.core.events.implementations.subscription import (
+    OverflowPolicy,
+    SubscriberStats,
+    Subscription,
+    SubscriptionManager,
+    symbol_key,
+)
 from neural_ai.core.events.implementations.zeromq_bus import EventBus, EventBusConfig
 
 __all__ = [
+    "BaseEventBus",
+    "BatchFormat",
+    "ColumnarSubscription",
+    "DatabaseDeadLetterSink",
+    "DeadLetter",
+    "DeadLetterQueue",
+    "DeadLetterSink",
+    "DeadLetterStats",
+    "EventBroker",
     "EventBus",
     "EventBusConfig",
+    "EventBusMetrics",
+    "EventCodec",
+    "EventJournal",
+    "EventRegistry",
+    "FileDeadLetterSink",
+    "Histogram",
+    "InProcessEventBus",
+    "JournalReader",
+    "JournalRecord",
+    "JsonEventCodec",
+    "MarketDataBinaryCodec",
+    "MessageHeader",
+    "MetricsServer",
+    "MsgpackEventCodec",
+    "OverflowPolicy",
+    "ShardStats",
+    "ShardedConsumerPool",
+    "SubscriberStats",
+    "Subscription",
+    "SubscriptionManager",
+    "default_registry",
+    "redrive_dead_letters",
+    "render_prometheus",
+    "shard_for",
+    "symbol_key",
 ]
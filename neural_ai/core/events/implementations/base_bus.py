@@ -0,0 +1,332 @@
+"""Az EventBus implementációk közös, transport-független része.
+
+A feliratkozások (SubscriptionManager), az eseménytípus regiszter, a
+metrikák és a dead-letter sor kezelése nem függ attól, hogyan jut el az
+esemény a feliratkozókhoz. A BaseEventBus ezt a felületet egyszer valósítja
+meg; az implementációk (ZeroMQ-s EventBus, InProcessEventBus) csak az
+indítást, a leállítást, a közzétételt és a fogadást adják hozzá.
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import logging
+from collections.abc import Callable, Hashable
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Self
+
+from neural_ai.core.events.implementations.dead_letter import DeadLetterQueue, DeadLetterStats
+from neural_ai.core.events.implementations.metrics import (
+    EventBusMetrics,
+    MetricsServer,
+    render_prometheus,
+)
+from neural_ai.core.events.implementations.registry import EventRegistry, default_registry
+from neural_ai.core.events.implementations.subscription import (
+    OverflowPolicy,
+    SubscriberStats,
+    SubscriptionManager,
+)
+from neural_ai.core.events.interfaces.event_bus_interface import (
+    EventBusConfig,
+    EventBusInterface,
+    EventCallback,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+class BaseEventBus(EventBusInterface):
+    """Feliratkozások, metrikák és dead-letter sor az EventBus implementációkhoz.
+
+    Az alosztályok a start()/stop() metódusban a _start_services() és a
+    _stop_services() hívásával indítják és állítják le a közös részeket; a
+    transport-szintű témakör szűrést a _topic_added() és _topic_removed()
+    felülírásával kapcsolhatják a feliratkozásokhoz.
+
+    Attributes:
+        config: Az EventBus konfigurációja
+        _subscribers: A feliratkozások eseménytípusonként
+        _running: Futási állapot jelzője
+    """
+
+    def __init__(self, config: EventBusConfig | None = None) -> None:
+        """Inicializálja a közös részeket.
+
+        Args:
+            config: EventBus konfiguráció (opcionális)
+
+        Raises:
+            EventBusError: Ha a feliratkozói sor beállításai érvénytelenek
+        """
+        self._config = config or EventBusConfig()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._running = False
+
+        # A publisher és a subscriber ugyanazt az eseménytípus regisztert használja
+        self._registry: EventRegistry = default_registry()
+
+        self._metrics = EventBusMetrics() if self._config.metrics_enabled else None
+        self._metrics_server: MetricsServer | None = None
+
+        # A callback hibák és a dekódolási hibák dead-letter sora (opcionális)
+        self._dead_letters = (
+            DeadLetterQueue.from_config(self._config, self._logger, self._metrics)
+            if self._config.dead_letter_enabled
+            else None
+        )
+
+        # Minden callback saját korlátos sort és worker task-ot kap, így a
+        # fogadó ciklust nem akasztják meg a lassú feliratkozók
+        self._subscribers = SubscriptionManager.from_config(
+            self._config, self._logger, self._metrics, self._dead_letters
+        )
+
+    @property
+    def config(self) -> EventBusConfig:
+        """Visszaadja az EventBus konfigurációját."""
+        return self._config
+
+    @property
+    def registry(self) -> EventRegistry:
+        """Az eseménytípus regiszter."""
+        return self._registry
+
+    def register_event_type(self, event_type: str, model: type["BaseModel"]) -> None:
+        """Saját eseménytípus regisztrálása a beépítettek mellé.
+
+        Args:
+            event_type: Az eseménytípus neve (a topic)
+            model: Az eseményt leíró Pydantic modell
+
+        Raises:
+            EventBusError: Ha az eseménytípus már más modellhez van rendelve
+        """
+        self._registry.register(event_type, model)
+
+    async def _start_services(self) -> None:
+        """A közös részek indítása.
+
+        Elindulnak a feliratkozók worker task-jai, a dead-letter sor és
+        (ha be van állítva) a metrika végpont.
+        """
+        self._subscribers.start()
+        if self._dead_letters is not None:
+            self._dead_letters.start()
+        if self._metrics is not None and self._config.metrics_port is not None:
+            self._metrics_server = MetricsServer(
+                self.render_metrics, self._config.metrics_host, self._config.metrics_port
+            )
+            await self._metrics_server.start()
+
+    async def _stop_services(self) -> None:
+        """A _start_services() által indított részek leállítása."""
+        self._subscribers.stop()
+        if self._dead_letters is not None:
+            await self._dead_letters.stop()
+        if self._metrics_server is not None:
+            await self._metrics_server.stop()
+            self._metrics_server = None
+
+    def _topic_added(self, event_type: str) -> None:
+        """Az eseménytípus első feliratkozója után hívódik (transport szűréshez).
+
+        Args:
+            event_type: Az eseménytípus
+        """
+
+    def _topic_removed(self, event_type: str) -> None:
+        """Az eseménytípus utolsó feliratkozója után hívódik (transport szűréshez).
+
+        Args:
+            event_type: Az eseménytípus
+        """
+
+    def subscribe(
+        self,
+        event_type: str,
+        callback: EventCallback,
+        *,
+        max_queue_size: int | None = None,
+        overflow: OverflowPolicy | str | None = None,
+        conflate_key: Callable[["BaseModel"], Hashable] | None = None,
+        name: str | None = None,
+        conflate_by_symbol: bool = False,
+    ) -> None:
+        """Feliratkozás eseménytípusra.
+
+        Args:
+            event_type: Az esemény típusa, amire feliratkozunk
+            callback: A callback függvény, amely az eseményt fogadja
+            max_queue_size: A feliratkozó sorának kapacitása
+                (alapértelmezett: config.subscriber_queue_size)
+            overflow: Teli sor kezelése (alapértelmezett: config.overflow_policy)
+            conflate_key: 'conflate' szabálynál a kulcs, amely szerint csak a
+                legfrissebb várakozó esemény marad meg (alapértelmezett: egyetlen)
+            name: A feliratkozó neve a metrikákban (alapértelmezett: a callback neve)
+            conflate_by_symbol: Amíg a callback foglalt, szimbólumonként csak a
+                legfrissebb esemény vár (pl. dashboard, risk); a felülírások
+                száma a get_subscriber_stats() conflated_by_key mezőjében látszik
+
+        Raises:
+            SubscriberError: Ha a sor mérete vagy a szabály érvénytelen, vagy
+                conflate_by_symbol mellett más szabály vagy kulcs van megadva
+
+        Note:
+            A callback-nek aszinkronnak kell lennie (async def), és nem
+            módosíthatja a kapott eseményt (folyamaton belül az objektum meg
+            van osztva a feliratkozók között).
+        """
+        subscription, first = self._subscribers.add(
+            event_type,
+            callback,
+            max_queue_size=max_queue_size,
+            overflow=overflow,
+            conflate_key=conflate_key,
+            name=name,
+            conflate_by_symbol=conflate_by_symbol,
+        )
+        if first:
+            self._topic_added(event_type)
+        self._logger.info(f"Feliratkozás létrehozva: {event_type} ({subscription.name})")
+
+    def subscribe_batches(
+        self,
+        event_type: str,
+        callback: Callable[[Any], Any],
+        *,
+        max_batch_size: int = 1000,
+        max_batch_delay: float = 0.05,
+        batch_format: str = "arrow",
+        max_queue_size: int | None = None,
+        overflow: OverflowPolicy | str | None = None,
+        name: str | None = None,
+        conflate_by_symbol: bool = False,
+    ) -> None:
+        """Kötegelt, oszlopos feliratkozás vektorizált feldolgozáshoz.
+
+        A callback eseményenként helyett kötegenként egyszer hívódik, egy
+        pyarrow.RecordBatch vagy polars.DataFrame objektummal (market_data
+        esetén symbol, timestamp, bid, ask, volume, source oszlopokkal).
+        Leiratkozás az unsubscribe() metódussal.
+
+        Args:
+            event_type: Az esemény típusa (jelenleg 'market_data')
+            callback: Az aszinkron callback, amely a köteget kapja
+            max_batch_size: Egy köteg maximális eseményszáma
+            max_batch_delay: Az első esemény legnagyobb várakozása a kötegben
+                másodpercben (ennyi idő után a részleges köteg is kimegy)
+            batch_format: 'arrow' (pyarrow.RecordBatch) vagy 'polars' (polars.DataFrame)
+            max_queue_size: A feliratkozó sorának kapacitása
+                (alapértelmezett: config.subscriber_queue_size)
+            overflow: Teli sor kezelése (alapértelmezett: config.overflow_policy)
+            name: A feliratkozó neve a metrikákban (alapértelmezett: a callback neve)
+            conflate_by_symbol: Egy kötegbe szimbólumonként csak a legfrissebb
+                esemény kerül
+
+        Raises:
+            SubscriberError: Ha az eseménytípus nem kötegelhető, a paraméterek
+                érvénytelenek, vagy conflate_by_symbol mellett más szabály van megadva
+            ImportError: Ha a pyarrow vagy a polars nincs telepítve
+        """
+        subscription, first = self._subscribers.add_batches(
+            event_type,
+            callback,
+            max_batch_size=max_batch_size,
+            max_batch_delay=max_batch_delay,
+            batch_format=batch_format,
+            max_queue_size=max_queue_size,
+            overflow=overflow,
+            name=name,
+            conflate_by_symbol=conflate_by_symbol,
+        )
+        if first:
+            self._topic_added(event_type)
+        self._logger.info(
+            f"Kötegelt feliratkozás létrehozva: {event_type} ({subscription.name})"
+        )
+
+    def unsubscribe(self, event_type: str, callback: EventCallback) -> None:
+        """Leiratkozás eseménytípusról.
+
+        Args:
+            event_type: Az esemény típusa
+            callback: A callback függvény, amelyet eltávolítunk
+        """
+        subscription, last = self._subscribers.remove(event_type, callback)
+        if subscription is not None:
+            self._logger.info(f"Leiratkozás: {event_type} ({subscription.name})")
+        if last:
+            self._topic_removed(event_type)
+
+    def get_subscriber_stats(self, event_type: str | None = None) -> list[SubscriberStats]:
+        """A feliratkozók metrikái (sorhossz, késés, eldobott események).
+
+        A last_lag_seconds / max_lag_seconds és a queue_size mutatja, melyik
+        feliratkozó marad le a többitől.
+
+        Args:
+            event_type: Csak ennek az eseménytípusnak a feliratkozói (None = mind)
+
+        Returns:
+            list[SubscriberStats]: Feliratkozónként egy pillanatkép
+        """
+        return self._subscribers.stats(event_type)
+
+    @property
+    def dead_letters(self) -> DeadLetterQueue | None:
+        """A dead-letter sor (None, ha dead_letter_enabled ki van kapcsolva)."""
+        return self._dead_letters
+
+    def get_dead_letter_stats(self) -> DeadLetterStats | None:
+        """A dead-letter sor metrikái.
+
+        Returns:
+            DeadLetterStats | None: Pillanatkép, vagy None, ha a sor ki van kapcsolva
+        """
+        return self._dead_letters.stats() if self._dead_letters is not None else None
+
+    def get_metrics(self) -> dict[str, Any]:
+        """A busz metrikáinak pillanatképe (pull API).
+
+        Returns:
+            dict[str, Any]: Eseménytípusonkénti számlálók ('counters'),
+            hisztogramok ('histograms') és a feliratkozók metrikái ('subscribers')
+        """
+        snapshot = self._metrics.snapshot() if self._metrics is not None else {}
+        snapshot["subscribers"] = [asdict(stats) for stats in self.get_subscriber_stats()]
+        return snapshot
+
+    def render_metrics(self) -> str:
+        """A busz metrikái Prometheus szöveges formátumban.
+
+        Returns:
+            str: A Prometheus exposition szöveg
+        """
+        snapshot = self._metrics.snapshot() if self._metrics is not None else {}
+        return render_prometheus(snapshot, self.get_subscriber_stats())
+
+    async def __aenter__(self) -> Self:
+        """Aszinkron context manager.
+
+        Returns:
+            A busz példány
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Aszinkron context manager lezárás.
+
+        Args:
+            exc_type: A kivétel típusa (ha volt kivétel)
+            exc_val: A kivétel objektum (ha volt kivétel)
+            exc_tb: A traceback objektum (ha volt kivétel)
+        """
+        await self.stop()
@@ -0,0 +1,186 @@
+"""XPUB/XSUB broker a több publisher - több subscriber topológiához.
+
+Broker módban az EventBus-ok nem bind-olnak saját PUB socketet, hanem
+csatlakoznak a brokerhez: a publisher-ek a pub_port-ra (XSUB), a
+subscriber-ek a sub_port-ra (XPUB). A broker a subscriber-ek témakör
+feliratkozásait továbbítja a publisher-ek felé, így a ZeroMQ szűrés
+továbbra is a küldő oldalon történik.
+
+A továbbítás a libzmq proxy-jában (C kód, GIL nélkül) fut egy háttérszálon,
+vezérlése egy inproc PAIR socketen keresztül történik.
+
+A modulban található:
+    - EventBroker: A proxy indítása, futtatása és leállítása
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import itertools
+import logging
+import threading
+from typing import Any
+
+from neural_ai.core.events.exceptions import EventBusError
+from neural_ai.core.events.interfaces.event_bus_interface import EventBusConfig
+
+_broker_ids = itertools.count()
+
+
+class EventBroker:
+    """XPUB/XSUB proxy az EventBus broker módjához.
+
+    Attributes:
+        frontend_url: A publisher-ek által használt XSUB végpont
+        backend_url: A subscriber-ek által használt XPUB végpont
+    """
+
+    def __init__(
+        self,
+        config: EventBusConfig | None = None,
+        frontend_url: str | None = None,
+        backend_url: str | None = None,
+    ) -> None:
+        """Inicializálja az EventBroker-t.
+
+        Args:
+            config: EventBus konfiguráció (a pub_port és sub_port miatt)
+            frontend_url: XSUB végpont (alapértelmezett: tcp://*:{pub_port})
+            backend_url: XPUB végpont (alapértelmezett: tcp://*:{sub_port})
+
+        Raises:
+            ImportError: Ha a pyzmq nincs telepítve
+        """
+        try:
+            import zmq
+        except ImportError as e:
+            raise ImportError("ZeroMQ nincs telepítve. Telepítsd: pip install pyzmq") from e
+
+        config = config or EventBusConfig()
+        self._zmq = zmq
+        self.frontend_url = frontend_url or f"tcp://*:{config.pub_port}"
+        self.backend_url = backend_url or f"tcp://*:{config.sub_port}"
+        self._control_url = f"inproc://eventbus_broker_control_{next(_broker_ids)}"
+        self._context: Any = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def running(self) -> bool:
+        """Fut-e a proxy."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """A proxy indítása háttérszálon; visszatér, amint a socketek bind-oltak.
+
+        Raises:
+            EventBusError: Ha a socketek nem bind-olhatók (pl. foglalt port)
+        """
+        if self.running:
+            return
+
+        self._context = self._zmq.Context()
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="eventbus-broker", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            self._context.term()
+            self._context = None
+            raise EventBusError(f"A broker nem indítható: {self._error}") from self._error
+
+        self._logger.info(f"Broker elindítva: {self.frontend_url} -> {self.backend_url}")
+
+    def _run(self) -> None:
+        """A proxy szál: socketek létrehozása és a továbbítás futtatása."""
+        zmq = self._zmq
+        frontend = self._context.socket(zmq.XSUB)
+        backend = self._context.socket(zmq.XPUB)
+        control = self._context.socket(zmq.PAIR)
+        try:
+            try:
+                frontend.bind(self.frontend_url)
+                backend.bind(self.backend_url)
+                control.bind(self._control_url)
+            except zmq.ZMQError as e:
+                self._error = e
+                return
+            finally:
+                self._ready.set()
+
+            # Blokkol, amíg a vezérlő socketen TERMINATE nem érkezik
+            zmq.proxy_steerable(frontend, backend, None, control)
+        except zmq.ContextTerminated:
+            pass
+        except Exception as e:
+            self._logger.error(f"Hiba a broker futása közben: {e}", exc_info=True)
+        finally:
+            for socket in (frontend, backend, control):
+                socket.close(linger=0)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """A proxy leállítása és a socketek lezárása.
+
+        Args:
+            timeout: A szál leállására várakozás felső korlátja másodpercben
+        """
+        if self._thread is None:
+            return
+
+        control = self._context.socket(self._zmq.PAIR)
+        try:
+            control.connect(self._control_url)
+            control.send(b"TERMINATE")
+        finally:
+            control.close(linger=0)
+
+        self._thread.join(timeout)
+        self._thread = None
+        self._context.term()
+        self._context = None
+        self._logger.info("Broker leállítva")
+
+    def run_forever(self) -> None:
+        """A proxy futtatása az aktuális szálon a megszakításig (önálló folyamathoz).
+
+        Raises:
+            EventBusError: Ha a socketek nem bind-olhatók
+        """
+        self.start()
+        try:
+            while self._thread is not None and self._thread.is_alive():
+                self._thread.join(1.0)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def __enter__(self) -> "EventBroker":
+        """Context manager: a proxy indítása.
+
+        Returns:
+            Az EventBroker példány
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Context manager lezárás: a proxy leállítása.
+
+        Args:
+            exc_type: A kivétel típusa (ha volt kivétel)
+            exc_val: A kivétel objektum (ha volt kivétel)
+            exc_tb: A traceback objektum (ha volt kivétel)
+        """
+        self.stop()
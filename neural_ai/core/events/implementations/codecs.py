@@ -0,0 +1,361 @@
+"""Esemény codec-ek és a ZeroMQ üzenetek fejléce.
+
+Egy buszüzenet legalább három ZeroMQ frame-ből áll:
+
+    [topic, header, payload, payload, ...]
+
+A topic az eseménytípus (a ZeroMQ prefix szűréséhez), a header egy fix méretű
+bináris fejléc (verzió, codec azonosító, flag-ek, közzétételi idő), a payload
+pedig az esemény a header-ben megjelölt codec-kel kódolva. Kötegelt küldésnél
+(FLAG_BATCH) ugyanannak az eseménytípusnak több payload frame-je utazik egyetlen
+üzenetben. A fogadó mindig a
+header szerinti codec-kel dekódol, így a publisher-ek szabadon választhatnak
+codec-et, a subscriber-ek pedig minden regisztrált codec-et értenek.
+
+A modulban található:
+    - MessageHeader: A fejléc kódolása és dekódolása
+    - EventCodec: Absztrakt alaposztály a codec-ekhez
+    - JsonEventCodec: Pydantic model_dump_json alapú codec (alapértelmezett)
+    - MsgpackEventCodec: msgpack alapú codec (opcionális függőség)
+    - MarketDataBinaryCodec: Fix bináris elrendezés a MarketDataEvent-hez
+    - get_codec: Codec példányosítása név alapján
+    - available_codecs: Az összes telepített codec azonosító szerint
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from neural_ai.core.events.exceptions import EventBusError
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from neural_ai.core.events.implementations.registry import EventRegistry
+
+
+WIRE_VERSION = 1
+
+# Az üzenet több eseményt tartalmaz (publish_many vagy automatikus kötegelés)
+FLAG_BATCH = 0x0001
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class MessageHeader:
+    """A buszüzenetek fix méretű fejléce.
+
+    Attributes:
+        codec_id: A payload codec-jének azonosítója
+        flags: Üzenetszintű flag-ek
+        published_ns: A közzététel ideje (ns, Unix epoch)
+        version: A wire formátum verziója
+    """
+
+    codec_id: int
+    flags: int = 0
+    published_ns: int = 0
+    version: int = WIRE_VERSION
+
+    # verzió (u8), codec azonosító (u8), flag-ek (u16), közzétételi idő (i64)
+    _STRUCT: ClassVar[struct.Struct] = struct.Struct("<BBHq")
+    SIZE: ClassVar[int] = _STRUCT.size
+
+    def pack(self) -> bytes:
+        """A fejléc kódolása.
+
+        Returns:
+            bytes: A kódolt fejléc
+        """
+        return self._STRUCT.pack(self.version, self.codec_id, self.flags, self.published_ns)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "MessageHeader":
+        """A fejléc dekódolása.
+
+        Args:
+            data: A fejléc frame tartalma
+
+        Returns:
+            MessageHeader: A dekódolt fejléc
+
+        Raises:
+            EventBusError: Ha a fejléc mérete vagy verziója nem megfelelő
+        """
+        if len(data) != cls.SIZE:
+            raise EventBusError(f"Érvénytelen üzenetfejléc méret: {len(data)} bájt")
+        version, codec_id, flags, published_ns = cls._STRUCT.unpack(data)
+        if version != WIRE_VERSION:
+            raise EventBusError(f"Nem támogatott wire verzió: {version}")
+        return cls(codec_id=codec_id, flags=flags, published_ns=published_ns, version=version)
+
+
+class EventCodec(ABC):
+    """Absztrakt alaposztály az esemény codec-ekhez.
+
+    Attributes:
+        codec_id: A codec azonosítója a fejlécben (egyedi, 1-255)
+        name: A codec neve a konfigurációban
+        event_types: A codec által kezelt eseménytípusok (None = bármelyik)
+    """
+
+    codec_id: int = 0
+    name: str = ""
+    event_types: frozenset[str] | None = None
+
+    @abstractmethod
+    def encode(self, event: "BaseModel") -> bytes:
+        """Esemény kódolása.
+
+        Args:
+            event: A kódolandó esemény
+
+        Returns:
+            bytes: A payload
+        """
+
+    @abstractmethod
+    def decode(self, payload: bytes) -> dict[str, Any]:
+        """Payload dekódolása az esemény mezőivé.
+
+        Args:
+            payload: A kódolt esemény
+
+        Returns:
+            dict[str, Any]: Az esemény mezői
+        """
+
+    def decode_event(
+        self,
+        event_type: str,
+        payload: bytes,
+        registry: "EventRegistry",
+        trusted: bool = False,
+    ) -> "BaseModel":
+        """Payload dekódolása a regisztrált esemény modellbe.
+
+        Args:
+            event_type: Az eseménytípus
+            payload: A kódolt esemény
+            registry: Az eseménytípus regiszter
+            trusted: True esetén validáció nélkül (model_construct)
+
+        Returns:
+            BaseModel: Az esemény
+
+        Raises:
+            EventBusError: Ha az eseménytípus nincs regisztrálva
+            pydantic.ValidationError: Ha az adatok érvénytelenek
+        """
+        data = self.decode(payload)
+        if trusted:
+            return registry.construct(event_type, data)
+        return registry.validate(event_type, data)
+
+    def supports(self, event_type: str) -> bool:
+        """Ellenőrzi, hogy a codec kezeli-e az eseménytípust.
+
+        Args:
+            event_type: Az eseménytípus
+
+        Returns:
+            bool: True, ha a codec használható az eseménytípushoz
+        """
+        return self.event_types is None or event_type in self.event_types
+
+
+class JsonEventCodec(EventCodec):
+    """JSON codec: az esemény egyetlen model_dump_json() hívással kódolódik."""
+
+    codec_id = 1
+    name = "json"
+
+    def encode(self, event: "BaseModel") -> bytes:
+        """Esemény kódolása JSON-ba."""
+        return event.model_dump_json().encode("utf-8")
+
+    def decode(self, payload: bytes) -> dict[str, Any]:
+        """JSON payload dekódolása."""
+        return json.loads(payload)
+
+    def decode_event(
+        self,
+        event_type: str,
+        payload: bytes,
+        registry: "EventRegistry",
+        trusted: bool = False,
+    ) -> "BaseModel":
+        """JSON payload validálása közvetlenül a bájtokból (köztes dict nélkül)."""
+        if trusted:
+            return super().decode_event(event_type, payload, registry, trusted=True)
+        return registry.validate_json(event_type, payload)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """A msgpack által natívan nem ismert típusok átalakítása.
+
+    Args:
+        obj: Az átalakítandó objektum
+
+    Returns:
+        Any: msgpack-kompatibilis érték
+
+    Raises:
+        TypeError: Ha az objektum nem alakítható át
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+class MsgpackEventCodec(EventCodec):
+    """msgpack codec: tömörebb és gyorsabb a JSON-nál, séma nélkül."""
+
+    codec_id = 2
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        """Inicializálja a MsgpackEventCodec-et.
+
+        Raises:
+            ImportError: Ha a msgpack nincs telepítve
+        """
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("A msgpack nincs telepítve. Telepítsd: pip install msgpack") from e
+
+        self._packer = msgpack.Packer(default=_msgpack_default)
+        self._unpackb = msgpack.unpackb
+
+    def encode(self, event: "BaseModel") -> bytes:
+        """Esemény kódolása msgpack-kel."""
+        return self._packer.pack(event.model_dump())
+
+    def decode(self, payload: bytes) -> dict[str, Any]:
+        """msgpack payload dekódolása."""
+        return self._unpackb(payload)
+
+
+class MarketDataBinaryCodec(EventCodec):
+    """Fix bináris elrendezés a market_data eseményekhez.
+
+    Elrendezés (little-endian):
+        i64 timestamp (µs, Unix epoch), f64 bid, f64 ask, i64 volume,
+        u8 flag-ek, u8 szimbólum hossz, u8 forrás hossz,
+        majd a szimbólum és a forrás UTF-8 bájtjai.
+
+    A naiv időbélyegek UTC-ként kerülnek kódolásra, és dekódolás után is
+    naivak maradnak.
+    """
+
+    codec_id = 3
+    name = "binary"
+    event_types = frozenset({"market_data"})
+
+    _STRUCT = struct.Struct("<qddqBBB")
+    _HAS_VOLUME = 0x01
+    _TZ_AWARE = 0x02
+
+    def encode(self, event: "BaseModel") -> bytes:
+        """MarketDataEvent kódolása a fix elrendezésbe."""
+        data = event.__dict__
+        timestamp: datetime = data["timestamp"]
+        flags = 0
+        if timestamp.tzinfo is None:
+            micros = (timestamp - _EPOCH) // _MICROSECOND
+        else:
+            micros = (timestamp - _EPOCH_UTC) // _MICROSECOND
+            flags |= self._TZ_AWARE
+
+        volume = data.get("volume")
+        if volume is not None:
+            flags |= self._HAS_VOLUME
+
+        symbol = data["symbol"].encode("utf-8")
+        source = data["source"].encode("utf-8")
+        return (
+            self._STRUCT.pack(
+                micros,
+                data["bid"],
+                data["ask"],
+                volume or 0,
+                flags,
+                len(symbol),
+                len(source),
+            )
+            + symbol
+            + source
+        )
+
+    def decode(self, payload: bytes) -> dict[str, Any]:
+        """Fix elrendezésű payload dekódolása."""
+        micros, bid, ask, volume, flags, symbol_len, source_len = self._STRUCT.unpack_from(
+            payload
+        )
+        offset = self._STRUCT.size
+        symbol = payload[offset : offset + symbol_len].decode("utf-8")
+        offset += symbol_len
+        source = payload[offset : offset + source_len].decode("utf-8")
+
+        epoch = _EPOCH_UTC if flags & self._TZ_AWARE else _EPOCH
+        return {
+            "symbol": symbol,
+            "timestamp": epoch + micros * _MICROSECOND,
+            "bid": bid,
+            "ask": ask,
+            "volume": volume if flags & self._HAS_VOLUME else None,
+            "source": source,
+        }
+
+
+_CODECS: dict[str, type[EventCodec]] = {
+    JsonEventCodec.name: JsonEventCodec,
+    MsgpackEventCodec.name: MsgpackEventCodec,
+    MarketDataBinaryCodec.name: MarketDataBinaryCodec,
+}
+
+
+def get_codec(name: str) -> EventCodec:
+    """Codec példányosítása név alapján.
+
+    Args:
+        name: A codec neve ('json', 'msgpack' vagy 'binary')
+
+    Returns:
+        EventCodec: A codec példány
+
+    Raises:
+        EventBusError: Ha a codec ismeretlen vagy a függősége nincs telepítve
+    """
+    if name not in _CODECS:
+        raise EventBusError(f"Ismeretlen esemény codec: {name}. Támogatott: {list(_CODECS)}")
+    try:
+        return _CODECS[name]()
+    except ImportError as e:
+        raise EventBusError(f"A(z) {name} codec nem használható: {e}") from e
+
+
+def available_codecs() -> dict[int, EventCodec]:
+    """Az összes használható (telepített függőségű) codec azonosító szerint.
+
+    Returns:
+        dict[int, EventCodec]: codec_id -> codec példány
+    """
+    codecs: dict[int, EventCodec] = {}
+    for codec_class in _CODECS.values():
+        try:
+            codec = codec_class()
+        except ImportError:
+            continue
+        codecs[codec.codec_id] = codec
+    return codecs
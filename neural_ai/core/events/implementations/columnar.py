@@ -0,0 +1,378 @@
+"""Oszlopos, mikro-kötegelt kézbesítés vektorizált feliratkozóknak.
+
+A ColumnarSubscription worker-e nem eseményenként hívja a callback-et:
+egy idő- vagy méretablakon át gyűjti a sorba került eseményeket, azokat
+oszlopokba rendezi, és kötegenként egyszer adja át egy Arrow RecordBatch
+vagy Polars DataFrame formájában. Így az eseményenkénti Python overhead
+(callback hívás, attribútum elérés a stratégiában) a köteg egészére oszlik.
+
+A sor, a túlcsordulási szabályok és a metrikák a normál feliratkozókéval
+egyeznek; conflate szabálynál (pl. conflate_by_symbol) egy köteg kulcsonként
+(szimbólumonként) csak egy, az ablak alatt érkezett legfrissebb eseményt
+tartalmaz, akkor is, ha a kulcs a gyűjtés közben újra sorba került.
+
+Jelenleg a market_data eseménytípus oszlopai definiáltak
+(symbol, timestamp, bid, ask, volume, source).
+
+A modulban található:
+    - BatchFormat: A köteg formátuma (arrow, polars)
+    - ColumnarSubscription: Kötegelt, oszlopos feliratkozás
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Hashable
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from neural_ai.core.events.exceptions import SubscriberError
+from neural_ai.core.events.implementations.metrics import (
+    CALLBACK_ERRORS,
+    CALLBACK_SECONDS,
+    QUEUE_LAG_SECONDS,
+    EventBusMetrics,
+)
+from neural_ai.core.events.implementations.subscription import (
+    OverflowPolicy,
+    Subscription,
+    resolve_conflation,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from neural_ai.core.events.implementations.dead_letter import DeadLetterQueue
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Eseménytípusonként a köteg oszlopai
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "market_data": ("symbol", "timestamp", "bid", "ask", "volume", "source"),
+}
+
+
+class BatchFormat(str, Enum):
+    """A köteg formátuma.
+
+    Attributes:
+        ARROW: pyarrow.RecordBatch
+        POLARS: polars.DataFrame
+    """
+
+    ARROW = "arrow"
+    POLARS = "polars"
+
+
+def _market_data_columns(events: list["BaseModel"]) -> dict[str, list[Any]]:
+    """MarketDataEvent-ek oszlopokba rendezése.
+
+    Az időbélyeg µs-ban (Unix epoch, UTC) kerül az oszlopba; a naiv
+    időbélyegek UTC-ként értelmeződnek, ahogy a bináris codec-nél.
+
+    Args:
+        events: Az események
+
+    Returns:
+        dict[str, list[Any]]: Oszlopnév -> értékek
+    """
+    symbols: list[str] = []
+    timestamps: list[int] = []
+    bids: list[float] = []
+    asks: list[float] = []
+    volumes: list[int | None] = []
+    sources: list[str] = []
+    for event in events:
+        data = event.__dict__
+        timestamp: datetime = data["timestamp"]
+        epoch = _EPOCH if timestamp.tzinfo is None else _EPOCH_UTC
+        symbols.append(data["symbol"])
+        timestamps.append((timestamp - epoch) // _MICROSECOND)
+        bids.append(data["bid"])
+        asks.append(data["ask"])
+        volumes.append(data["volume"])
+        sources.append(data["source"])
+    return {
+        "symbol": symbols,
+        "timestamp": timestamps,
+        "bid": bids,
+        "ask": asks,
+        "volume": volumes,
+        "source": sources,
+    }
+
+
+def _arrow_builder() -> Callable[[dict[str, list[Any]]], Any]:
+    """Arrow RecordBatch építő a market_data oszlopokhoz.
+
+    Returns:
+        Callable: Oszlopok -> pyarrow.RecordBatch
+
+    Raises:
+        ImportError: Ha a pyarrow nincs telepítve
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("A pyarrow nincs telepítve. Telepítsd: pip install pyarrow") from e
+
+    schema = pa.schema(
+        [
+            ("symbol", pa.string()),
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+            ("bid", pa.float64()),
+            ("ask", pa.float64()),
+            ("volume", pa.int64()),
+            ("source", pa.string()),
+        ]
+    )
+
+    def build(columns: dict[str, list[Any]]) -> Any:
+        return pa.RecordBatch.from_arrays(
+            [pa.array(columns[field.name], type=field.type) for field in schema],
+            schema=schema,
+        )
+
+    return build
+
+
+def _polars_builder() -> Callable[[dict[str, list[Any]]], Any]:
+    """Polars DataFrame építő a market_data oszlopokhoz.
+
+    Returns:
+        Callable: Oszlopok -> polars.DataFrame
+
+    Raises:
+        ImportError: Ha a polars nincs telepítve
+    """
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("A polars nincs telepítve. Telepítsd: pip install polars") from e
+
+    def build(columns: dict[str, list[Any]]) -> Any:
+        return pl.DataFrame(
+            [
+                pl.Series("symbol", columns["symbol"], dtype=pl.Utf8),
+                pl.Series("timestamp", columns["timestamp"], dtype=pl.Int64).cast(
+                    pl.Datetime("us", "UTC")
+                ),
+                pl.Series("bid", columns["bid"], dtype=pl.Float64),
+                pl.Series("ask", columns["ask"], dtype=pl.Float64),
+                pl.Series("volume", columns["volume"], dtype=pl.Int64),
+                pl.Series("source", columns["source"], dtype=pl.Utf8),
+            ]
+        )
+
+    return build
+
+
+class ColumnarSubscription(Subscription):
+    """Kötegelt feliratkozás: a callback oszlopos kötegeket kap.
+
+    A worker az első várakozó esemény után legfeljebb max_batch_delay
+    másodpercig vagy max_batch_size eseményig gyűjt, majd egyszer hívja a
+    callback-et a köteggel. Folyamatos forgalomnál a kötegek teli méretben,
+    várakozás nélkül állnak össze.
+
+    Attributes:
+        max_batch_size: Egy köteg maximális eseményszáma
+        max_batch_delay: Az első esemény legnagyobb várakozása a kötegben (s)
+        batch_format: A köteg formátuma
+    """
+
+    def __init__(
+        self,
+        event_type: str,
+        callback: Callable[[Any], Any],
+        max_batch_size: int = 1000,
+        max_batch_delay: float = 0.05,
+        batch_format: BatchFormat | str = BatchFormat.ARROW,
+        max_queue_size: int = 10000,
+        overflow: OverflowPolicy | str | None = None,
+        name: str | None = None,
+        logger: logging.Logger | None = None,
+        metrics: EventBusMetrics | None = None,
+        dead_letters: "DeadLetterQueue | None" = None,
+        conflate_by_symbol: bool = False,
+    ) -> None:
+        """Inicializálja a ColumnarSubscription-t.
+
+        Args:
+            event_type: Az eseménytípus (jelenleg 'market_data')
+            callback: Az aszinkron callback, amely a köteget kapja
+            max_batch_size: Egy köteg maximális eseményszáma
+            max_batch_delay: Az első esemény legnagyobb várakozása a kötegben (s)
+            batch_format: 'arrow' (pyarrow.RecordBatch) vagy 'polars' (polars.DataFrame)
+            max_queue_size: A sor kapacitása
+            overflow: A túlcsordulási szabály (None = block, conflate_by_symbol
+                mellett conflate)
+            name: A feliratkozó neve (alapértelmezett: a callback neve)
+            logger: Logger a callback hibákhoz
+            metrics: A busz metrikái
+            dead_letters: A hibás kötegek eseményeinek dead-letter sora
+            conflate_by_symbol: Egy kötegbe szimbólumonként csak a legfrissebb
+                esemény kerül (CONFLATE szabály symbol kulccsal)
+
+        Raises:
+            SubscriberError: Ha az eseménytípusnak nincsenek oszlopai, a köteg
+                paraméterei vagy a formátum érvénytelenek, vagy
+                conflate_by_symbol mellett más szabály van megadva
+            ImportError: Ha a formátum csomagja (pyarrow, polars) nincs telepítve
+        """
+        if event_type not in COLUMNS:
+            raise SubscriberError(
+                f"A(z) {event_type} eseménytípus nem kötegelhető oszloposan. "
+                f"Támogatott: {list(COLUMNS)}"
+            )
+        if max_batch_size <= 0:
+            raise SubscriberError(f"Érvénytelen max_batch_size: {max_batch_size}")
+        if max_batch_delay <= 0:
+            raise SubscriberError(f"Érvénytelen max_batch_delay: {max_batch_delay}")
+        try:
+            self.batch_format = BatchFormat(batch_format)
+        except ValueError as e:
+            raise SubscriberError(
+                f"Érvénytelen köteg formátum: {batch_format}. "
+                f"Támogatott: {[fmt.value for fmt in BatchFormat]}"
+            ) from e
+
+        overflow, conflate_key = resolve_conflation(overflow, None, conflate_by_symbol)
+        super().__init__(
+            event_type,
+            callback,
+            max_queue_size=max_queue_size,
+            overflow=overflow or OverflowPolicy.BLOCK,
+            conflate_key=conflate_key,
+            name=name,
+            logger=logger,
+            metrics=metrics,
+            dead_letters=dead_letters,
+        )
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self._build = (
+            _arrow_builder() if self.batch_format is BatchFormat.ARROW else _polars_builder()
+        )
+
+    def _take(self, limit: int) -> list[tuple["BaseModel", float]]:
+        """Legfeljebb limit várakozó esemény kivétele várakozás nélkül (nem CONFLATE sor).
+
+        Args:
+            limit: A kivehető események maximális száma
+
+        Returns:
+            list[tuple[BaseModel, float]]: (esemény, sorba kerülés ideje) párok
+        """
+        queue = self._queue
+        items = [queue.popleft() for _ in range(min(limit, len(queue)))]
+        self._not_full.set()
+        return items
+
+    async def _collect(self) -> list[tuple["BaseModel", float]]:
+        """Egy köteg összegyűjtése (várakozik az első eseményre).
+
+        CONFLATE szabálynál a kötegbe már kivett kulcs a gyűjtés alatt újra
+        sorba kerülhet; a köteg ilyenkor is kulcsonként egy eseményt tartalmaz:
+        a kulcs megtartja a helyét, csak az esemény frissül.
+
+        Returns:
+            list[tuple[BaseModel, float]]: A köteg eseményei sorrendben
+        """
+        first = await self._get()
+        if self.overflow is not OverflowPolicy.CONFLATE:
+            items = [first]
+            deadline = time.monotonic() + self.max_batch_delay
+            while True:
+                items.extend(self._take(self.max_batch_size - len(items)))
+                remaining = deadline - time.monotonic()
+                if len(items) >= self.max_batch_size or remaining <= 0:
+                    return items
+                # A sor most üres: várakozás újabb eseményre az ablak végéig
+                self._not_empty.clear()
+                try:
+                    await asyncio.wait_for(self._not_empty.wait(), timeout=remaining)
+                except TimeoutError:
+                    items.extend(self._take(self.max_batch_size - len(items)))
+                    return items
+
+        key_of = self._conflate_key
+        batch = {key_of(first[0]): first}
+        deadline = time.monotonic() + self.max_batch_delay
+        while True:
+            self._merge(batch)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                return list(batch.values())
+            self._not_empty.clear()
+            try:
+                await asyncio.wait_for(self._not_empty.wait(), timeout=remaining)
+            except TimeoutError:
+                self._merge(batch)
+                return list(batch.values())
+
+    def _merge(self, batch: dict[Hashable, tuple["BaseModel", float]]) -> None:
+        """A várakozó események összefésülése a gyűjtött köteggel (CONFLATE).
+
+        A kötegben már szereplő kulcsok eseménye frissül (a felülírás a
+        conflated számlálóba kerül), új kulcs csak max_batch_size-ig kerül
+        be; a többi a sorban marad a következő kötegnek.
+
+        Args:
+            batch: Kulcs -> (esemény, sorba kerülés ideje), beszúrási sorrendben
+        """
+        latest = self._latest
+        pending = list(latest)
+        for key in pending:
+            if key in batch:
+                batch[key] = latest.pop(key)
+                self._count_conflated(key)
+            elif len(batch) < self.max_batch_size:
+                batch[key] = latest.pop(key)
+
+    async def _run(self) -> None:
+        """A worker task: kötegek gyűjtése és átadása a callback-nek."""
+        stats = self._stats
+        metrics = self._metrics
+        while True:
+            items = await self._collect()
+            started = time.monotonic()
+            # A köteg legrégebbi eseményének várakozása
+            lag = started - items[0][1]
+            stats.last_lag_seconds = lag
+            if lag > stats.max_lag_seconds:
+                stats.max_lag_seconds = lag
+
+            events = [event for event, _ in items]
+            try:
+                await self.callback(self._build(_market_data_columns(events)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.errors += 1
+                if metrics is not None:
+                    metrics.inc(CALLBACK_ERRORS, self.event_type)
+                self._logger.error(
+                    f"Hiba a köteg callback végrehajtásakor ({self.name}, "
+                    f"{len(events)} esemény): {e}",
+                    exc_info=True,
+                )
+                if self._dead_letters is not None:
+                    for event in events:
+                        self._dead_letters.capture_callback_failure(
+                            self.event_type, self.name, event, e
+                        )
+            finally:
+                elapsed = time.monotonic() - started
+                stats.delivered += len(items)
+                stats.callback_seconds += elapsed
+                if metrics is not None:
+                    metrics.observe(CALLBACK_SECONDS, self.event_type, elapsed)
+                    metrics.observe(QUEUE_LAG_SECONDS, self.event_type, lag)
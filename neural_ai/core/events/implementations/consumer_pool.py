@@ -0,0 +1,396 @@
+"""Szimbólum szerint shardolt, többfolyamatos fogyasztó pool.
+
+A tick-enkénti stratégia kiértékelés CPU-igényes, egyetlen run_forever
+ciklus pedig egy magra korlátoz. A pool a buszról érkező eseményeket (pl.
+market_data) a szimbólum hash-e alapján N worker folyamat egyikébe küldi
+ZeroMQ PUSH/PULL socketeken. Egy szimbólum mindig ugyanahhoz a workerhez
+kerül, egyetlen socketen át, így a szimbólumonkénti sorrend megmarad.
+
+A workerek kimenetei (pl. SignalEvent-ek) egy közös PULL socketen jutnak
+vissza a fő folyamatba, ahonnan a pool közzéteszi őket a buszon.
+
+    busz --subscribe--> pool --PUSH[shard]--> worker(handler) --PUSH--> pool --publish--> busz
+
+A modulban található:
+    - shard_for: Stabil (folyamatfüggetlen) shard index egy kulcshoz
+    - ShardStats: Egy shard pillanatnyi metrikái
+    - ShardedConsumerPool: A pool indítása, az események szétosztása és a
+      kimenetek visszagyűjtése
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from neural_ai.core.events.exceptions import EventBusError
+from neural_ai.core.events.implementations.codecs import (
+    MessageHeader,
+    available_codecs,
+    get_codec,
+)
+from neural_ai.core.events.implementations.registry import default_registry
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from neural_ai.core.events.interfaces.event_bus_interface import EventBusInterface
+
+
+# Egy worker handler: eseményből (eseménytípus, kimeneti esemény) párok
+ShardHandler = Callable[["BaseModel"], Iterable[tuple[str, "BaseModel"]] | None]
+# A worker folyamatban hívódik a shard indexével; picklálhatónak kell lennie
+ShardHandlerFactory = Callable[[int], ShardHandler]
+
+# A workernek küldött leállítási jel (egyetlen üres frame)
+_STOP_FRAME = b""
+
+
+def shard_for(key: str, num_shards: int) -> int:
+    """Stabil shard index egy kulcshoz.
+
+    A beépített hash() folyamatonként véletlen sózású, ezért CRC32-t
+    használunk: ugyanaz a szimbólum minden futásban ugyanarra a shardra kerül.
+
+    Args:
+        key: A shard kulcs (pl. szimbólum)
+        num_shards: A shardok száma
+
+    Returns:
+        int: A shard indexe (0 .. num_shards-1)
+    """
+    return zlib.crc32(key.encode("utf-8")) % num_shards
+
+
+def _symbol_key(event: "BaseModel") -> str:
+    """Alapértelmezett shard kulcs: az esemény szimbóluma."""
+    return event.symbol  # type: ignore[attr-defined]
+
+
+@dataclass
+class ShardStats:
+    """Egy shard pillanatnyi metrikái.
+
+    Attributes:
+        shard: A shard indexe
+        pid: A worker folyamat azonosítója
+        alive: Fut-e a worker folyamat
+        routed: A workernek küldött események száma
+    """
+
+    shard: int
+    pid: int | None
+    alive: bool
+    routed: int = 0
+
+
+def _worker_main(
+    shard: int,
+    input_url: str,
+    output_url: str,
+    handler_factory: ShardHandlerFactory,
+    output_codec: str,
+) -> None:
+    """A worker folyamat fő ciklusa.
+
+    Args:
+        shard: A shard indexe
+        input_url: A shard bemeneti PUSH végpontja
+        output_url: A kimenetek PULL végpontja
+        handler_factory: A handler-t létrehozó függvény
+        output_codec: A kimeneti események codec-je
+    """
+    import zmq
+
+    logger = logging.getLogger(f"ShardedConsumerPool.worker{shard}")
+    registry = default_registry()
+    codecs = available_codecs()
+    codec = get_codec(output_codec)
+    handler = handler_factory(shard)
+
+    context = zmq.Context()
+    receiver = context.socket(zmq.PULL)
+    receiver.connect(input_url)
+    sender = context.socket(zmq.PUSH)
+    sender.connect(output_url)
+
+    try:
+        while True:
+            frames = receiver.recv_multipart()
+            if len(frames) == 1 and frames[0] == _STOP_FRAME:
+                break
+
+            event_type = frames[0].decode("utf-8")
+            header = MessageHeader.unpack(frames[1])
+            input_codec = codecs.get(header.codec_id)
+            if input_codec is None:
+                logger.error(f"Ismeretlen codec azonosító: {header.codec_id}")
+                continue
+
+            for payload in frames[2:]:
+                try:
+                    # A fő folyamat a buszról már validált eseményeket küld
+                    event = input_codec.decode_event(event_type, payload, registry, trusted=True)
+                    outputs = handler(event)
+                except Exception as e:
+                    logger.error(f"Hiba a(z) {event_type} esemény feldolgozásakor: {e}")
+                    continue
+
+                for output_type, output in outputs or ():
+                    output_header = MessageHeader(
+                        codec_id=codec.codec_id, published_ns=time.time_ns()
+                    ).pack()
+                    sender.send_multipart(
+                        [output_type.encode("utf-8"), output_header, codec.encode(output)]
+                    )
+    finally:
+        receiver.close(linger=0)
+        # A már elküldött kimenetek még kimennek a lezárás előtt
+        sender.close()
+        context.term()
+
+
+class ShardedConsumerPool:
+    """Szimbólum szerint shardolt, többfolyamatos fogyasztó pool.
+
+    Attributes:
+        event_type: A shardolt eseménytípus
+        num_workers: A worker folyamatok száma
+    """
+
+    def __init__(
+        self,
+        bus: "EventBusInterface",
+        handler_factory: ShardHandlerFactory,
+        num_workers: int | None = None,
+        event_type: str = "market_data",
+        shard_key: Callable[["BaseModel"], str] | None = None,
+        input_codec: str | None = None,
+        output_codec: str = "json",
+        high_water_mark: int = 10000,
+    ) -> None:
+        """Inicializálja a ShardedConsumerPool-t.
+
+        Args:
+            bus: Az EventBus, amelyről a pool fogyaszt és ahová a kimenetek kerülnek
+            handler_factory: Modulszintű (picklálható) függvény, amely a worker
+                folyamatban a shard indexéből létrehozza a handler-t. A handler
+                eseményenként (eseménytípus, esemény) párokat ad vissza, vagy None-t
+            num_workers: A worker folyamatok száma (alapértelmezett: CPU magok)
+            event_type: A shardolt eseménytípus
+            shard_key: Az eseményből a shard kulcs (alapértelmezett: symbol)
+            input_codec: A workereknek küldött események codec-je
+                (alapértelmezett: a busz codec-je az eseménytípushoz)
+            output_codec: A kimeneti események codec-je
+            high_water_mark: Shardonként a ZeroMQ-ban várakozó üzenetek felső
+                korlátja; fölötte a küldés vár (backpressure a busz felé)
+
+        Raises:
+            ImportError: Ha a pyzmq nincs telepítve
+            EventBusError: Ha a paraméterek érvénytelenek
+        """
+        try:
+            import zmq.asyncio
+
+            self._zmq = zmq
+            self._zmq_asyncio = zmq.asyncio
+        except ImportError as e:
+            raise ImportError("ZeroMQ nincs telepítve. Telepítsd: pip install pyzmq") from e
+
+        self.num_workers = (
+            num_workers if num_workers is not None else multiprocessing.cpu_count()
+        )
+        if self.num_workers <= 0:
+            raise EventBusError(f"Érvénytelen num_workers: {self.num_workers}")
+
+        config = bus.config
+        self.event_type = event_type
+        self._bus = bus
+        self._handler_factory = handler_factory
+        self._shard_key = shard_key or _symbol_key
+        self._input_codec = get_codec(
+            input_codec or config.codec_overrides.get(event_type, config.codec)
+        )
+        self._output_codec = output_codec
+        self._high_water_mark = high_water_mark
+        self._registry = default_registry()
+        self._codecs = available_codecs()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+        self._context: Any = None
+        self._senders: list[Any] = []
+        self._results: Any = None
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._routed: list[int] = []
+        self._collector: asyncio.Task[None] | None = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Fut-e a pool."""
+        return self._running
+
+    async def start(self) -> None:
+        """A worker folyamatok elindítása és feliratkozás a buszon."""
+        if self._running:
+            return
+
+        zmq = self._zmq
+        self._context = self._zmq_asyncio.Context()
+        self._results = self._context.socket(zmq.PULL)
+        output_port = self._results.bind_to_random_port("tcp://127.0.0.1")
+        output_url = f"tcp://127.0.0.1:{output_port}"
+
+        # spawn: a workerek nem öröklik a fő folyamat eseményhurkát és socketjeit
+        mp_context = multiprocessing.get_context("spawn")
+        for shard in range(self.num_workers):
+            sender = self._context.socket(zmq.PUSH)
+            sender.setsockopt(zmq.SNDHWM, self._high_water_mark)
+            input_port = sender.bind_to_random_port("tcp://127.0.0.1")
+            process = mp_context.Process(
+                target=_worker_main,
+                args=(
+                    shard,
+                    f"tcp://127.0.0.1:{input_port}",
+                    output_url,
+                    self._handler_factory,
+                    self._output_codec,
+                ),
+                name=f"consumer-pool-{self.event_type}-{shard}",
+                daemon=True,
+            )
+            process.start()
+            self._senders.append(sender)
+            self._processes.append(process)
+        self._routed = [0] * self.num_workers
+
+        self._collector = asyncio.create_task(self._collect())
+        self._running = True
+        self._bus.subscribe(self.event_type, self._route)
+        self._logger.info(
+            f"Consumer pool elindítva: {self.event_type}, {self.num_workers} worker"
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """A pool leállítása.
+
+        A workerek a leállítási jel előtt kapott összes eseményt feldolgozzák,
+        a kimeneteik még a buszra kerülnek.
+
+        Args:
+            timeout: A worker folyamatok leállására várakozás felső korlátja
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        self._bus.unsubscribe(self.event_type, self._route)
+
+        for sender in self._senders:
+            await sender.send_multipart([_STOP_FRAME])
+
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            await asyncio.to_thread(process.join, max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                self._logger.warning(f"A worker nem állt le időben: {process.name}")
+                process.terminate()
+
+        # A leállított workerek utolsó kimenetei még feldolgozásra kerülnek
+        if self._collector is not None:
+            self._collector.cancel()
+            self._collector = None
+        while await self._results.poll(timeout=100):
+            await self._handle_result(await self._results.recv_multipart())
+
+        for sender in self._senders:
+            sender.close(linger=0)
+        self._results.close(linger=0)
+        self._context.term()
+        self._senders = []
+        self._processes = []
+        self._results = None
+        self._context = None
+        self._logger.info("Consumer pool leállítva")
+
+    async def _route(self, event: "BaseModel") -> None:
+        """Esemény küldése a kulcsához tartozó shard workerének.
+
+        Args:
+            event: A buszról érkezett esemény
+        """
+        shard = shard_for(self._shard_key(event), self.num_workers)
+        header = MessageHeader(codec_id=self._input_codec.codec_id, published_ns=time.time_ns())
+        await self._senders[shard].send_multipart(
+            [self.event_type.encode("utf-8"), header.pack(), self._input_codec.encode(event)]
+        )
+        self._routed[shard] += 1
+
+    async def _collect(self) -> None:
+        """A workerek kimeneteinek fogadása és közzététele a buszon."""
+        while True:
+            frames = await self._results.recv_multipart()
+            await self._handle_result(frames)
+
+    async def _handle_result(self, frames: list[bytes]) -> None:
+        """Egy worker kimenet dekódolása és közzététele.
+
+        Args:
+            frames: Az üzenet frame-jei ([eseménytípus, header, payload])
+        """
+        try:
+            event_type = frames[0].decode("utf-8")
+            header = MessageHeader.unpack(frames[1])
+            codec = self._codecs[header.codec_id]
+            # A workerek a regisztrált modelleket validálva hozták létre
+            event = codec.decode_event(event_type, frames[2], self._registry, trusted=True)
+            await self._bus.publish(event_type, event)
+        except Exception as e:
+            self._logger.error(f"Hiba a worker kimenet közzétételekor: {e}", exc_info=True)
+
+    def stats(self) -> list[ShardStats]:
+        """A shardok metrikái.
+
+        Returns:
+            list[ShardStats]: Shardonként egy pillanatkép
+        """
+        return [
+            ShardStats(
+                shard=shard,
+                pid=process.pid,
+                alive=process.is_alive(),
+                routed=self._routed[shard],
+            )
+            for shard, process in enumerate(self._processes)
+        ]
+
+    async def __aenter__(self) -> "ShardedConsumerPool":
+        """Aszinkron context manager.
+
+        Returns:
+            A ShardedConsumerPool példány
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Aszinkron context manager lezárás.
+
+        Args:
+            exc_type: A kivétel típusa (ha volt kivétel)
+            exc_val: A kivétel objektum (ha volt kivétel)
+            exc_tb: A traceback objektum (ha volt kivétel)
+        """
+        await self.stop()
@@ -0,0 +1,676 @@
+"""Dead-letter sor a kézbesíthetetlen eseményekhez.
+
+A callback-ben hibát okozó és a nem dekódolható események nem vesznek el:
+a busz a nyers payload-ot, az eseménytípust, a feliratkozó nevét és a
+kivételt egy korlátos memóriabeli pufferbe teszi. A rögzítés egy deque
+művelet; a költséges lépések (a callback hibánál átadott esemény JSON
+kódolása, a traceback formázása) és a mentés egy háttér task-ban, kötegekben
+futnak, így a továbbítást nem lassítják.
+
+A kötegek az adatbázisba (DeadLetterEntry tábla) vagy egy JSON Lines fájlba
+kerülnek. A redrive_dead_letters() a mentett eseményeket újra a buszra küldi
+(vagy egy callback-nek adja át), az elküldötteket pedig törli.
+
+A modulban található:
+    - DeadLetter: Egy kézbesíthetetlen esemény
+    - DeadLetterStats: A dead-letter sor metrikái
+    - DeadLetterSink: Tároló interfész
+    - FileDeadLetterSink: JSON Lines fájl tároló
+    - DatabaseDeadLetterSink: Adatbázis tároló (SQLAlchemy)
+    - DeadLetterQueue: Puffer és háttérmentés
+    - redrive_dead_letters: Újraküldés a buszra
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+import traceback
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from neural_ai.core.events.exceptions import EventBusError
+from neural_ai.core.events.implementations.codecs import JsonEventCodec, available_codecs
+from neural_ai.core.events.implementations.metrics import DEAD_LETTERS, EventBusMetrics
+from neural_ai.core.events.implementations.registry import EventRegistry, default_registry
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from neural_ai.core.events.interfaces.event_bus_interface import (
+        EventBusConfig,
+        EventBusInterface,
+    )
+
+
+REASON_CALLBACK = "callback"
+REASON_DECODE = "decode"
+
+# A régi kétframe-es JSON üzenetek payload-jának codec azonosítója
+LEGACY_CODEC_ID = 0
+
+SINK_TYPES = ("database", "file")
+
+
+@dataclass(slots=True)
+class DeadLetter:
+    """Egy kézbesíthetetlen esemény.
+
+    Attributes:
+        event_type: Az esemény típusa
+        reason: A hiba helye ('callback' vagy 'decode')
+        subscriber: A hibát okozó feliratkozó neve (callback hibánál)
+        codec_id: A payload codec-jének azonosítója (0 = régi JSON formátum)
+        payload: A kódolt esemény
+        exception_type: A kivétel típusa
+        exception_message: A kivétel üzenete
+        traceback: A formázott traceback
+        created_at: A rögzítés ideje (Unix időbélyeg)
+        letter_id: Egyedi azonosító
+    """
+
+    event_type: str
+    reason: str
+    subscriber: str | None
+    codec_id: int
+    payload: bytes
+    exception_type: str
+    exception_message: str
+    traceback: str
+    created_at: float
+    letter_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-képes dict (a payload base64 kódolva).
+
+        Returns:
+            dict[str, Any]: A bejegyzés mezői
+        """
+        data = asdict(self)
+        data["payload"] = base64.b64encode(self.payload).decode("ascii")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DeadLetter":
+        """Létrehozás a to_dict() eredményéből.
+
+        Args:
+            data: A bejegyzés mezői
+
+        Returns:
+            DeadLetter: A bejegyzés
+        """
+        return cls(**{**data, "payload": base64.b64decode(data["payload"])})
+
+
+@dataclass
+class DeadLetterStats:
+    """A dead-letter sor metrikái.
+
+    Attributes:
+        captured: Rögzített események
+        flushed: Tárolóba mentett események
+        dropped: A teli puffer miatt eldobott események
+        flush_errors: Sikertelen mentések
+        buffered: A mentésre váró események
+    """
+
+    captured: int = 0
+    flushed: int = 0
+    dropped: int = 0
+    flush_errors: int = 0
+    buffered: int = 0
+
+
+class DeadLetterSink(ABC):
+    """Dead-letter tároló interfész."""
+
+    @abstractmethod
+    async def write(self, letters: list[DeadLetter]) -> None:
+        """Egy köteg mentése.
+
+        Args:
+            letters: A mentendő bejegyzések
+        """
+
+    @abstractmethod
+    async def read(
+        self, event_type: str | None = None, limit: int | None = None
+    ) -> list[DeadLetter]:
+        """Mentett bejegyzések a rögzítés sorrendjében.
+
+        Args:
+            event_type: Csak ez az eseménytípus (None = mind)
+            limit: Legfeljebb ennyi bejegyzés (None = mind)
+
+        Returns:
+            list[DeadLetter]: A bejegyzések
+        """
+
+    @abstractmethod
+    async def delete(self, letter_ids: list[str]) -> None:
+        """Bejegyzések törlése.
+
+        Args:
+            letter_ids: A törlendő bejegyzések azonosítói
+        """
+
+
+class FileDeadLetterSink(DeadLetterSink):
+    """JSON Lines fájl tároló (soronként egy bejegyzés).
+
+    A fájlműveletek egy worker szálban futnak, így az eseményhurkot nem
+    blokkolják.
+
+    Attributes:
+        path: A fájl útvonala
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Inicializálja a FileDeadLetterSink-et.
+
+        Args:
+            path: A fájl útvonala (a könyvtár létrejön, ha nem létezik)
+        """
+        self.path = Path(path)
+        self._lock = asyncio.Lock()
+
+    def _append(self, lines: list[str]) -> None:
+        """Sorok hozzáfűzése a fájlhoz."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load(self) -> list[DeadLetter]:
+        """Az összes bejegyzés beolvasása."""
+        if not self.path.exists():
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            return [DeadLetter.from_dict(json.loads(line)) for line in f if line.strip()]
+
+    def _rewrite(self, letter_ids: set[str]) -> None:
+        """A fájl újraírása a megadott bejegyzések nélkül (atomi csere)."""
+        kept = [letter for letter in self._load() if letter.letter_id not in letter_ids]
+        temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(letter.to_dict()) + "\n" for letter in kept)
+        os.replace(temporary, self.path)
+
+    async def write(self, letters: list[DeadLetter]) -> None:
+        """Egy köteg hozzáfűzése a fájlhoz.
+
+        Args:
+            letters: A mentendő bejegyzések
+        """
+        lines = [json.dumps(letter.to_dict()) + "\n" for letter in letters]
+        async with self._lock:
+            await asyncio.to_thread(self._append, lines)
+
+    async def read(
+        self, event_type: str | None = None, limit: int | None = None
+    ) -> list[DeadLetter]:
+        """Mentett bejegyzések a rögzítés sorrendjében.
+
+        Args:
+            event_type: Csak ez az eseménytípus (None = mind)
+            limit: Legfeljebb ennyi bejegyzés (None = mind)
+
+        Returns:
+            list[DeadLetter]: A bejegyzések
+        """
+        async with self._lock:
+            letters = await asyncio.to_thread(self._load)
+        if event_type is not None:
+            letters = [letter for letter in letters if letter.event_type == event_type]
+        return letters[:limit] if limit is not None else letters
+
+    async def delete(self, letter_ids: list[str]) -> None:
+        """Bejegyzések törlése (a fájl újraírásával).
+
+        Args:
+            letter_ids: A törlendő bejegyzések azonosítói
+        """
+        if not letter_ids:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._rewrite, set(letter_ids))
+
+
+class DatabaseDeadLetterSink(DeadLetterSink):
+    """Adatbázis tároló a DeadLetterEntry táblában.
+
+    Az adatbázis kapcsolatot a core.db modul session kezelője adja
+    (database.connection.url); a tábla az init_db() hívással jön létre.
+    """
+
+    async def write(self, letters: list[DeadLetter]) -> None:
+        """Egy köteg mentése egy tranzakcióban.
+
+        Args:
+            letters: A mentendő bejegyzések
+        """
+        from neural_ai.core.db.implementations.models import DeadLetterEntry
+        from neural_ai.core.db.implementations.sqlalchemy_session import get_db_session
+
+        async with get_db_session() as session:
+            session.add_all(
+                DeadLetterEntry(
+                    letter_id=letter.letter_id,
+                    event_type=letter.event_type,
+                    reason=letter.reason,
+                    subscriber=letter.subscriber,
+                    codec_id=letter.codec_id,
+                    payload=letter.payload,
+                    exception_type=letter.exception_type,
+                    exception_message=letter.exception_message,
+                    traceback=letter.traceback,
+                    created_at=datetime.fromtimestamp(letter.created_at, tz=UTC),
+                )
+                for letter in letters
+            )
+
+    async def read(
+        self, event_type: str | None = None, limit: int | None = None
+    ) -> list[DeadLetter]:
+        """Mentett bejegyzések a rögzítés sorrendjében.
+
+        Args:
+            event_type: Csak ez az eseménytípus (None = mind)
+            limit: Legfeljebb ennyi bejegyzés (None = mind)
+
+        Returns:
+            list[DeadLetter]: A bejegyzések
+        """
+        from sqlalchemy import select
+
+        from neural_ai.core.db.implementations.models import DeadLetterEntry
+        from neural_ai.core.db.implementations.sqlalchemy_session import get_db_session
+
+        query = select(DeadLetterEntry).order_by(DeadLetterEntry.id)
+        if event_type is not None:
+            query = query.where(DeadLetterEntry.event_type == event_type)
+        if limit is not None:
+            query = query.limit(limit)
+
+        async with get_db_session() as session:
+            entries = (await session.execute(query)).scalars().all()
+        return [
+            DeadLetter(
+                event_type=entry.event_type,
+                reason=entry.reason,
+                subscriber=entry.subscriber,
+                codec_id=entry.codec_id,
+                payload=entry.payload,
+                exception_type=entry.exception_type or "",
+                exception_message=entry.exception_message or "",
+                traceback=entry.traceback or "",
+                created_at=entry.created_at.timestamp(),
+                letter_id=entry.letter_id,
+            )
+            for entry in entries
+        ]
+
+    async def delete(self, letter_ids: list[str]) -> None:
+        """Bejegyzések törlése.
+
+        Args:
+            letter_ids: A törlendő bejegyzések azonosítói
+        """
+        if not letter_ids:
+            return
+        from sqlalchemy import delete
+
+        from neural_ai.core.db.implementations.models import DeadLetterEntry
+        from neural_ai.core.db.implementations.sqlalchemy_session import get_db_session
+
+        async with get_db_session() as session:
+            await session.execute(
+                delete(DeadLetterEntry).where(DeadLetterEntry.letter_id.in_(letter_ids))
+            )
+
+
+def create_sink(sink_type: str, path: str | Path | None = None) -> DeadLetterSink:
+    """Tároló létrehozása típus alapján.
+
+    Args:
+        sink_type: 'database' vagy 'file'
+        path: A fájl útvonala ('file' típusnál)
+
+    Returns:
+        DeadLetterSink: A tároló
+
+    Raises:
+        EventBusError: Ha a típus ismeretlen, vagy 'file' típusnál nincs útvonal
+    """
+    if sink_type == "database":
+        return DatabaseDeadLetterSink()
+    if sink_type == "file":
+        if path is None:
+            raise EventBusError("A 'file' dead-letter tárolóhoz útvonal szükséges")
+        return FileDeadLetterSink(path)
+    raise EventBusError(f"Ismeretlen dead-letter tároló: {sink_type}. Támogatott: {SINK_TYPES}")
+
+
+# (eseménytípus, ok, feliratkozó, codec, payload, esemény, kivétel, idő)
+_Pending = tuple[
+    str, str, str | None, int, bytes | None, "BaseModel | None", BaseException, float
+]
+
+
+class DeadLetterQueue:
+    """Korlátos memóriabeli puffer kötegelt, háttérben futó mentéssel.
+
+    Attributes:
+        sink: A tároló
+        max_buffer_size: A puffer kapacitása; teli puffernél a legrégebbi
+            bejegyzés elvész
+        batch_size: Egy mentési köteg maximális mérete
+        flush_interval: A mentések közötti idő másodpercben
+    """
+
+    def __init__(
+        self,
+        sink: DeadLetterSink,
+        max_buffer_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        logger: logging.Logger | None = None,
+        metrics: EventBusMetrics | None = None,
+    ) -> None:
+        """Inicializálja a DeadLetterQueue-t.
+
+        Args:
+            sink: A tároló
+            max_buffer_size: A puffer kapacitása
+            batch_size: Egy mentési köteg maximális mérete
+            flush_interval: A mentések közötti idő másodpercben
+            logger: Logger
+            metrics: A busz metrikái (None = kikapcsolva)
+
+        Raises:
+            EventBusError: Ha a méretek vagy az időköz érvénytelenek
+        """
+        if max_buffer_size <= 0 or batch_size <= 0:
+            raise EventBusError(
+                f"Érvénytelen dead-letter puffer ({max_buffer_size}) vagy köteg ({batch_size})"
+            )
+        if flush_interval <= 0:
+            raise EventBusError(f"Érvénytelen dead_letter_flush_interval: {flush_interval}")
+
+        self.sink = sink
+        self.max_buffer_size = max_buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._logger = logger or logging.getLogger(self.__class__.__name__)
+        self._metrics = metrics
+        self._buffer: deque[_Pending] = deque()
+        self._stats = DeadLetterStats()
+        self._json_codec = JsonEventCodec()
+        self._wakeup: asyncio.Event | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "EventBusConfig",
+        logger: logging.Logger | None = None,
+        metrics: EventBusMetrics | None = None,
+    ) -> "DeadLetterQueue":
+        """Létrehozás az EventBus konfigurációból.
+
+        Args:
+            config: Az EventBus konfigurációja
+            logger: Logger
+            metrics: A busz metrikái (None = kikapcsolva)
+
+        Returns:
+            DeadLetterQueue: Az új példány
+
+        Raises:
+            EventBusError: Ha a tároló vagy a méretek érvénytelenek
+        """
+        return cls(
+            create_sink(config.dead_letter_sink, config.dead_letter_path),
+            max_buffer_size=config.dead_letter_buffer_size,
+            batch_size=config.dead_letter_batch_size,
+            flush_interval=config.dead_letter_flush_interval,
+            logger=logger,
+            metrics=metrics,
+        )
+
+    def capture_callback_failure(
+        self, event_type: str, subscriber: str, event: "BaseModel", error: BaseException
+    ) -> None:
+        """Egy callback-ben hibát okozó esemény rögzítése.
+
+        Args:
+            event_type: Az eseménytípus
+            subscriber: A feliratkozó neve
+            event: Az esemény (a mentéskor JSON-ba kódolódik)
+            error: A callback kivétele
+        """
+        self._capture(
+            (event_type, REASON_CALLBACK, subscriber, 0, None, event, error, time.time())
+        )
+
+    def capture_decode_failure(
+        self, event_type: str, codec_id: int, payload: bytes, error: BaseException
+    ) -> None:
+        """Egy nem dekódolható payload rögzítése.
+
+        Args:
+            event_type: Az eseménytípus
+            codec_id: A payload codec-jének azonosítója (0 = régi JSON formátum)
+            payload: A nyers payload
+            error: A dekódolás kivétele
+        """
+        self._capture(
+            (event_type, REASON_DECODE, None, codec_id, bytes(payload), None, error, time.time())
+        )
+
+    def _capture(self, pending: _Pending) -> None:
+        """Bejegyzés a pufferbe; teli köteg esetén a mentés azonnal indul."""
+        stats = self._stats
+        stats.captured += 1
+        if len(self._buffer) >= self.max_buffer_size:
+            self._buffer.popleft()
+            stats.dropped += 1
+        self._buffer.append(pending)
+        if self._metrics is not None:
+            self._metrics.inc(DEAD_LETTERS, pending[0])
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _materialize(self, pending: _Pending) -> DeadLetter:
+        """Pufferbejegyzés átalakítása menthető DeadLetter-ré."""
+        event_type, reason, subscriber, codec_id, payload, event, error, created_at = pending
+        if payload is None:
+            try:
+                payload = self._json_codec.encode(event)  # type: ignore[arg-type]
+                codec_id = self._json_codec.codec_id
+            except Exception:
+                payload = repr(event).encode("utf-8")
+        return DeadLetter(
+            event_type=event_type,
+            reason=reason,
+            subscriber=subscriber,
+            codec_id=codec_id,
+            payload=payload,
+            exception_type=type(error).__qualname__,
+            exception_message=str(error),
+            traceback="".join(traceback.format_exception(error)),
+            created_at=created_at,
+        )
+
+    def start(self) -> None:
+        """A háttérmentés indítása (futó eseményhurkot igényel)."""
+        if self._flusher is not None and not self._flusher.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher = asyncio.get_running_loop().create_task(
+            self._run(), name="dead_letter_flusher"
+        )
+
+    async def stop(self) -> None:
+        """A háttérmentés leállítása; a pufferben maradt bejegyzések mentésre kerülnek."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """A puffer mentése kötegekben.
+
+        Sikertelen mentésnél a köteg visszakerül a puffer elejére, és a
+        következő mentéskor újra próbálkozik.
+
+        Returns:
+            int: A mentett bejegyzések száma
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        flushed = 0
+        async with self._flush_lock:
+            while self._buffer:
+                count = min(self.batch_size, len(self._buffer))
+                batch = [self._buffer.popleft() for _ in range(count)]
+                try:
+                    await self.sink.write([self._materialize(pending) for pending in batch])
+                except Exception as e:
+                    self._stats.flush_errors += 1
+                    self._logger.error(f"Hiba a dead-letter köteg mentésekor: {e}")
+                    # A visszatett köteg sem lépheti túl a puffer kapacitását
+                    room = max(0, self.max_buffer_size - len(self._buffer))
+                    self._stats.dropped += max(0, count - room)
+                    self._buffer.extendleft(reversed(batch[max(0, count - room) :] if room else []))
+                    break
+                flushed += count
+                self._stats.flushed += count
+        return flushed
+
+    async def _run(self) -> None:
+        """A háttér task: mentés időközönként vagy teli kötegnél."""
+        wakeup = self._wakeup
+        assert wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
+
+    def stats(self) -> DeadLetterStats:
+        """A dead-letter sor metrikáinak pillanatképe.
+
+        Returns:
+            DeadLetterStats: A metrikák másolata
+        """
+        snapshot = DeadLetterStats(**asdict(self._stats))
+        snapshot.buffered = len(self._buffer)
+        return snapshot
+
+
+def _decode_letter(letter: DeadLetter, registry: EventRegistry) -> "BaseModel":
+    """Egy dead-letter bejegyzés eseménnyé alakítása (validációval).
+
+    Args:
+        letter: A bejegyzés
+        registry: Eseménytípus regiszter
+
+    Returns:
+        BaseModel: Az esemény
+
+    Raises:
+        EventBusError: Ha a codec ismeretlen
+    """
+    if letter.codec_id == LEGACY_CODEC_ID:
+        data = json.loads(letter.payload)
+        data = {key: value for key, value in data.items() if not key.startswith("_")}
+        return registry.validate(letter.event_type, data)
+    codec = available_codecs().get(letter.codec_id)
+    if codec is None:
+        raise EventBusError(f"Ismeretlen codec azonosító: {letter.codec_id}")
+    return codec.decode_event(letter.event_type, letter.payload, registry, False)
+
+
+async def redrive_dead_letters(
+    sink: DeadLetterSink,
+    *,
+    bus: "EventBusInterface | None" = None,
+    callback: Callable[[str, "BaseModel"], Awaitable[Any]] | None = None,
+    event_type: str | None = None,
+    limit: int | None = None,
+    registry: EventRegistry | None = None,
+    logger: logging.Logger | None = None,
+) -> tuple[int, int]:
+    """Mentett események újraküldése a buszra vagy egy callback-nek.
+
+    A buszra küldött esemény az eseménytípus minden feliratkozójához eljut,
+    nem csak ahhoz, amelyiknél eredetileg hibát okozott. A bejegyzés akkor
+    törlődik, ha a publish() (vagy a callback) kivétel nélkül visszatért; a
+    sikertelenek a tárolóban maradnak.
+
+    A törlés "elküldve"-t jelent, nem "kézbesítve"-t: a ZeroMQ PUB socket
+    nyugtázás nélkül küld, és eldobja az üzenetet, ha éppen nincs (vagy még
+    nem csatlakozott) feliratkozó. Külön folyamatból ezért csak broker módú
+    buszra érdemes újraküldeni, miután a feliratkozások már megérkeztek (lásd
+    scripts/redrive_dead_letters.py); garantált kézbesítéshez callback célt
+    kell használni.
+
+    Args:
+        sink: A tároló
+        bus: A cél EventBus (publish)
+        callback: A cél callback (eseménytípus, esemény)
+        event_type: Csak ez az eseménytípus (None = mind)
+        limit: Legfeljebb ennyi bejegyzés
+        registry: Eseménytípus regiszter (alapértelmezett: a busz regisztere)
+        logger: Logger
+
+    Returns:
+        tuple[int, int]: Az újraküldött és a sikertelen bejegyzések száma
+
+    Raises:
+        EventBusError: Ha nem pontosan egy cél (bus vagy callback) van megadva
+    """
+    if (bus is None) == (callback is None):
+        raise EventBusError("Pontosan egy cél adható meg: bus vagy callback")
+    logger = logger or logging.getLogger("DeadLetterRedrive")
+    registry = registry or getattr(bus, "registry", None) or default_registry()
+
+    redriven: list[str] = []
+    failed = 0
+    for letter in await sink.read(event_type=event_type, limit=limit):
+        try:
+            event = _decode_letter(letter, registry)
+            if bus is not None:
+                await bus.publish(letter.event_type, event)
+            else:
+                await callback(letter.event_type, event)  # type: ignore[misc]
+        except Exception as e:
+            failed += 1
+            logger.error(f"Sikertelen újraküldés ({letter.letter_id}, {letter.event_type}): {e}")
+            continue
+        redriven.append(letter.letter_id)
+
+    await sink.delete(redriven)
+    return len(redriven), failed
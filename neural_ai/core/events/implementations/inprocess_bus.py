@@ -0,0 +1,108 @@
+"""Folyamaton belüli EventBus implementáció szerializáció nélkül.
+
+Egy folyamaton belül nincs szükség kódolásra és ZeroMQ socketre: a
+közzétett esemény objektum közvetlenül a feliratkozók asyncio soraiba
+kerül. A feliratkozási, backpressure és metrika szemantika megegyezik a
+ZeroMQ-s EventBus-éval, így a kettő konfigurációból cserélhető.
+
+Az események objektumai meg vannak osztva a feliratkozók között, ezért
+azokat a callback-ek nem módosíthatják.
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from neural_ai.core.base.implementations.singleton import SingletonMeta
+from neural_ai.core.events.exceptions import EventBusError, PublishError
+from neural_ai.core.events.implementations.base_bus import BaseEventBus
+from neural_ai.core.events.implementations.metrics import EVENTS_PUBLISHED
+from neural_ai.core.events.interfaces.event_bus_interface import EventBusConfig
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+class InProcessEventBus(BaseEventBus, metaclass=SingletonMeta):
+    """Folyamaton belüli, szerializáció nélküli eseménybusz.
+
+    A feliratkozási, metrika és dead-letter felületet a BaseEventBus adja;
+    ez az osztály csak az indítást, a leállítást és a közzétételt valósítja meg.
+
+    Attributes:
+        config: Az EventBus konfigurációja
+        _subscribers: A feliratkozások eseménytípusonként
+        _running: Futási állapot jelzője
+    """
+
+    def __init__(self, config: EventBusConfig | None = None) -> None:
+        """Inicializálja az InProcessEventBus-t.
+
+        Args:
+            config: EventBus konfiguráció (opcionális)
+
+        Raises:
+            EventBusError: Ha a feliratkozói sor beállításai érvénytelenek
+        """
+        super().__init__(config)
+        self._stopped: asyncio.Event | None = None
+
+    async def start(self) -> None:
+        """Elindítja az EventBus-t és a feliratkozók worker task-jait."""
+        if self._running:
+            return
+
+        self._stopped = asyncio.Event()
+        self._running = True
+        await self._start_services()
+        self._logger.info("InProcessEventBus elindítva")
+
+    async def stop(self) -> None:
+        """Leállítja az EventBus-t és a feliratkozók worker task-jait."""
+        if not self._running:
+            return
+
+        self._running = False
+        await self._stop_services()
+        if self._stopped is not None:
+            self._stopped.set()
+        self._logger.info("InProcessEventBus leállítva")
+
+    async def publish(self, event_type: str, event: "BaseModel") -> None:
+        """Esemény közzététele: az objektum közvetlenül a feliratkozókhoz kerül.
+
+        Args:
+            event_type: Az esemény típusa (pl. 'market_data', 'trade')
+            event: Az esemény objektum (Pydantic BaseModel)
+
+        Raises:
+            EventBusError: Ha az EventBus nincs elindítva
+            PublishError: Ha az esemény nem a típushoz regisztrált modell példánya
+        """
+        if not self._running:
+            raise EventBusError("EventBus nincs elindítva")
+
+        try:
+            self._registry.check(event_type, event)
+        except EventBusError as e:
+            raise PublishError(str(e), event_type=event_type) from e
+
+        if self._metrics is not None:
+            self._metrics.inc(EVENTS_PUBLISHED, event_type)
+        await self._subscribers.dispatch(event_type, event)
+
+    async def run_forever(self) -> None:
+        """Várakozás a leállításig.
+
+        Az események a publish() hívásokkor kerülnek a feliratkozókhoz, ezért
+        nincs fogadó ciklus; a metódus a ZeroMQ-s EventBus-szal való
+        cserélhetőséget szolgálja.
+
+        Raises:
+            EventBusError: Ha az EventBus nincs elindítva
+        """
+        if not self._running or self._stopped is None:
+            raise EventBusError("EventBus nincs elindítva")
+        await self._stopped.wait()
@@ -0,0 +1,660 @@
+"""Tartós, csak hozzáfűzhető eseménynapló és visszajátszás.
+
+A napló a buszra feliratkozva a kódolt eseményeket szegmentált,
+memory-mapped fájlokba fűzi. Egy szegmens fix méretre előre lefoglalt
+fájl, amelybe a rekordok közvetlenül a leképezett memóriába íródnak; ha
+megtelik, új szegmens nyílik. A rekordok a folyamat összeomlását túlélik
+(a lapok az OS page cache-ben vannak), a lemezre kényszerített írás a
+flush() hívásokkor (alapértelmezetten másodpercenként) történik.
+
+Fájlok a napló könyvtárában:
+
+    events-<első rekord ideje ns-ben, 20 jegy>.seg   a rekordok
+    events-<...>.idx                                  ritka időindex (ts, offset)
+
+Egy rekord:
+
+    u32 törzs hossz, u32 CRC32, i64 idő (ns), u8 codec azonosító,
+    u8 eseménytípus hossz, majd az eseménytípus és a payload
+
+A rekordidő a naplózás ideje, szegmensen belül nem csökkenő. Olvasáskor a
+nulla hosszú vagy hibás CRC-jű rekord a szegmens végét jelzi, így egy
+félbeszakadt írás nem okoz hibás eseményt; megnyitáskor a napló innen
+folytatja az írást.
+
+A modulban található:
+    - JournalRecord: Egy beolvasott rekord
+    - EventJournal: Író oldal (feliratkozás a buszra, szegmensek, index)
+    - JournalReader: Olvasó oldal (időtartomány, visszajátszás)
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+import bisect
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from neural_ai.core.events.exceptions import EventBusError
+from neural_ai.core.events.implementations.codecs import (
+    EventCodec,
+    available_codecs,
+    get_codec,
+)
+from neural_ai.core.events.implementations.registry import EventRegistry, default_registry
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from neural_ai.core.events.interfaces.event_bus_interface import EventBusInterface
+
+
+# törzs hossz, CRC32, idő (ns), codec azonosító, eseménytípus hossz
+_RECORD = struct.Struct("<IIqBB")
+# A CRC az idő, a codec és a törzs bájtjait fedi le
+_CRC_PREFIX = struct.Struct("<qB")
+# Indexbejegyzés: idő (ns), offset a szegmensben
+_INDEX_ENTRY = struct.Struct("<qQ")
+
+_SEGMENT_PREFIX = "events-"
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_SUFFIX = ".idx"
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+ReplayCallback = Callable[[str, "BaseModel"], Awaitable[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class JournalRecord:
+    """Egy beolvasott naplórekord.
+
+    Attributes:
+        timestamp_ns: A naplózás ideje (ns, Unix epoch)
+        event_type: Az eseménytípus
+        codec_id: A payload codec-jének azonosítója
+        payload: A kódolt esemény
+    """
+
+    timestamp_ns: int
+    event_type: str
+    codec_id: int
+    payload: bytes
+
+
+def _segment_name(first_timestamp_ns: int) -> str:
+    """Szegmens fájlnév az első rekord idejéből."""
+    return f"{_SEGMENT_PREFIX}{first_timestamp_ns:020d}{_SEGMENT_SUFFIX}"
+
+
+def _list_segments(directory: Path) -> list[tuple[int, Path]]:
+    """A könyvtár szegmensei az első rekord ideje szerint rendezve.
+
+    Args:
+        directory: A napló könyvtára
+
+    Returns:
+        list[tuple[int, Path]]: (első rekord ideje, szegmens útvonal) párok
+    """
+    segments = []
+    for path in directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"):
+        stem = path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]
+        if stem.isdigit():
+            segments.append((int(stem), path))
+    segments.sort()
+    return segments
+
+
+def _to_ns(value: datetime | int | None) -> int | None:
+    """Időpont átalakítása ns-re (a naiv datetime helyi időként értelmeződik)."""
+    if value is None or isinstance(value, int):
+        return value
+    return int(value.timestamp() * 1_000_000) * 1000
+
+
+def _scan_records(
+    buffer: mmap.mmap | bytes, offset: int = 0
+) -> Iterator[tuple[int, JournalRecord]]:
+    """Érvényes rekordok olvasása egy szegmens pufferéből.
+
+    Args:
+        buffer: A szegmens tartalma
+        offset: A kezdő offset (rekordhatár)
+
+    Yields:
+        tuple[int, JournalRecord]: A rekord kezdő offsetje és a rekord
+    """
+    size = len(buffer)
+    while offset + _RECORD.size <= size:
+        body_length, crc, timestamp_ns, codec_id, type_length = _RECORD.unpack_from(
+            buffer, offset
+        )
+        body_start = offset + _RECORD.size
+        body_end = body_start + body_length
+        if body_length == 0 or body_length < type_length or body_end > size:
+            return
+        body = buffer[body_start:body_end]
+        if zlib.crc32(body, zlib.crc32(_CRC_PREFIX.pack(timestamp_ns, codec_id))) != crc:
+            return
+        yield offset, JournalRecord(
+            timestamp_ns=timestamp_ns,
+            event_type=body[:type_length].decode("utf-8"),
+            codec_id=codec_id,
+            payload=body[type_length:],
+        )
+        offset = body_end
+
+
+def _read_index(path: Path) -> list[tuple[int, int]]:
+    """Egy szegmens időindexének beolvasása.
+
+    Args:
+        path: Az index fájl
+
+    Returns:
+        list[tuple[int, int]]: (idő, offset) párok növekvő sorrendben
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    usable = len(data) - len(data) % _INDEX_ENTRY.size
+    return list(_INDEX_ENTRY.iter_unpack(data[:usable]))
+
+
+def _record_size(record: JournalRecord) -> int:
+    """Egy rekord teljes mérete a szegmensben (fejléc és törzs)."""
+    return _RECORD.size + len(record.event_type.encode("utf-8")) + len(record.payload)
+
+
+class EventJournal:
+    """Szegmentált, memory-mapped eseménynapló (író oldal).
+
+    Attributes:
+        directory: A napló könyvtára
+        segment_size: Egy szegmens mérete bájtban
+        index_interval: Ennyi rekordonként kerül bejegyzés az időindexbe
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        index_interval: int = 256,
+        codec: str = "json",
+        codec_overrides: dict[str, str] | None = None,
+        flush_interval: float | None = 1.0,
+    ) -> None:
+        """Inicializálja az EventJournal-t.
+
+        Args:
+            directory: A napló könyvtára (létrejön, ha nem létezik)
+            segment_size: Egy szegmens mérete bájtban
+            index_interval: Ennyi rekordonként kerül bejegyzés az időindexbe
+            codec: Az események alapértelmezett codec-je
+            codec_overrides: Eseménytípusonkénti codec
+                (alapértelmezett: {'market_data': 'binary'})
+            flush_interval: A lemezre írás (msync) gyakorisága a buszra
+                feliratkozott naplónál, másodpercben (None = csak záráskor)
+
+        Raises:
+            EventBusError: Ha a paraméterek érvénytelenek
+        """
+        if segment_size < 4096:
+            raise EventBusError(f"Túl kicsi szegmens méret: {segment_size}")
+        if index_interval <= 0:
+            raise EventBusError(f"Érvénytelen index_interval: {index_interval}")
+
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.index_interval = index_interval
+        self._flush_interval = flush_interval
+        self._default_codec = get_codec(codec)
+        overrides = {"market_data": "binary"} if codec_overrides is None else codec_overrides
+        self._codec_overrides: dict[str, EventCodec] = {
+            event_type: get_codec(name) for event_type, name in overrides.items()
+        }
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+        self._opened = False
+        self._file: Any = None
+        self._mmap: mmap.mmap | None = None
+        self._index_file: Any = None
+        self._segment_path: Path | None = None
+        self._offset = 0
+        self._last_timestamp_ns = 0
+        self._since_index = 0
+
+        self._bus: EventBusInterface | None = None
+        self._callbacks: dict[str, Callable[[BaseModel], Awaitable[None]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Nyitva van-e a napló."""
+        return self._opened
+
+    def open(self) -> None:
+        """A napló megnyitása; a legutóbbi szegmens érvényes végétől folytatja."""
+        if self.is_open:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = _list_segments(self.directory)
+        if segments:
+            self._open_segment(segments[-1][1], recover=True)
+        self._opened = True
+        self._logger.info(f"Eseménynapló megnyitva: {self.directory}")
+
+    def close(self) -> None:
+        """Az aktuális szegmens lezárása (a fájl a tényleges méretére rövidül)."""
+        self._close_segment()
+        self._opened = False
+
+    def _open_segment(self, path: Path, recover: bool) -> None:
+        """Szegmens megnyitása írásra.
+
+        Args:
+            path: A szegmens fájl
+            recover: Meglévő szegmens: az érvényes rekordok utáni offsettől folytatja
+        """
+        mode = "r+b" if path.exists() else "w+b"
+        segment_file = open(path, mode)
+        try:
+            original_size = os.fstat(segment_file.fileno()).st_size
+            if original_size < self.segment_size:
+                segment_file.truncate(self.segment_size)
+            mapped = mmap.mmap(segment_file.fileno(), 0)
+        except Exception:
+            segment_file.close()
+            raise
+
+        offset = 0
+        last_timestamp_ns = self._last_timestamp_ns
+        if recover:
+            for start, record in _scan_records(mapped):
+                offset = start + _record_size(record)
+                last_timestamp_ns = record.timestamp_ns
+            if offset < original_size:
+                # Egy félbeszakadt írás maradékának nullázása az érvényes rekordok után
+                mapped[offset:original_size] = bytes(original_size - offset)
+            index_path = path.with_suffix(_INDEX_SUFFIX)
+            # A már nem létező rekordokra mutató indexbejegyzések eltávolítása
+            entries = [entry for entry in _read_index(index_path) if entry[1] < offset]
+            index_path.write_bytes(b"".join(_INDEX_ENTRY.pack(*entry) for entry in entries))
+
+        self._file = segment_file
+        self._mmap = mapped
+        self._segment_path = path
+        self._index_file = open(path.with_suffix(_INDEX_SUFFIX), "ab")
+        self._offset = offset
+        self._last_timestamp_ns = last_timestamp_ns
+        self._since_index = self.index_interval if offset == 0 else 0
+
+    def _close_segment(self) -> None:
+        """Az aktuális szegmens lemezre írása és lezárása."""
+        if self._mmap is None:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(self._offset)
+        self._file.close()
+        self._index_file.close()
+        self._mmap = None
+        self._file = None
+        self._index_file = None
+        self._segment_path = None
+
+    def _roll(self, timestamp_ns: int) -> int:
+        """Új szegmens nyitása.
+
+        Args:
+            timestamp_ns: Az új szegmens első rekordjának ideje
+
+        Returns:
+            int: Az első rekord ideje (a szegmens neve szerint)
+        """
+        self._close_segment()
+        path = self.directory / _segment_name(timestamp_ns)
+        # Ugyanabban a nanoszekundumban nyitott szegmensek ne írják felül egymást
+        while path.exists():
+            timestamp_ns += 1
+            path = self.directory / _segment_name(timestamp_ns)
+        self._open_segment(path, recover=False)
+        return timestamp_ns
+
+    def append(self, event_type: str, event: "BaseModel", timestamp_ns: int | None = None) -> None:
+        """Esemény kódolása és hozzáfűzése a naplóhoz.
+
+        Args:
+            event_type: Az eseménytípus
+            event: Az esemény
+            timestamp_ns: A rekord ideje (alapértelmezett: most)
+
+        Raises:
+            EventBusError: Ha a napló nincs megnyitva vagy a rekord túl nagy
+        """
+        codec = self._codec_overrides.get(event_type, self._default_codec)
+        self.append_raw(event_type, codec.codec_id, codec.encode(event), timestamp_ns)
+
+    def append_raw(
+        self,
+        event_type: str,
+        codec_id: int,
+        payload: bytes,
+        timestamp_ns: int | None = None,
+    ) -> None:
+        """Már kódolt esemény hozzáfűzése a naplóhoz.
+
+        Args:
+            event_type: Az eseménytípus
+            codec_id: A payload codec-jének azonosítója
+            payload: A kódolt esemény
+            timestamp_ns: A rekord ideje (alapértelmezett: most)
+
+        Raises:
+            EventBusError: Ha a napló nincs megnyitva vagy a rekord túl nagy
+        """
+        if not self._opened:
+            raise EventBusError(f"Az eseménynapló nincs megnyitva: {self.directory}")
+
+        type_bytes = event_type.encode("utf-8")
+        body_length = len(type_bytes) + len(payload)
+        record_size = _RECORD.size + body_length
+        if record_size > self.segment_size:
+            raise EventBusError(f"Túl nagy naplórekord: {record_size} bájt")
+
+        # A rekordidő szegmensen belül nem csökkenhet (az időindex miatt)
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        timestamp_ns = max(timestamp_ns, self._last_timestamp_ns)
+        if self._mmap is None or self._offset + record_size > self.segment_size:
+            timestamp_ns = self._roll(timestamp_ns)
+        mapped = self._mmap
+        assert mapped is not None
+
+        offset = self._offset
+        crc = zlib.crc32(type_bytes, zlib.crc32(_CRC_PREFIX.pack(timestamp_ns, codec_id)))
+        crc = zlib.crc32(payload, crc)
+        body_start = offset + _RECORD.size
+        mapped[body_start : body_start + len(type_bytes)] = type_bytes
+        mapped[body_start + len(type_bytes) : body_start + body_length] = payload
+        # A fejléc utoljára íródik: összeomláskor nem marad félkész, de érvényes rekord
+        _RECORD.pack_into(
+            mapped, offset, body_length, crc, timestamp_ns, codec_id, len(type_bytes)
+        )
+
+        if self._since_index >= self.index_interval:
+            self._index_file.write(_INDEX_ENTRY.pack(timestamp_ns, offset))
+            self._since_index = 0
+        self._since_index += 1
+        self._offset = offset + record_size
+        self._last_timestamp_ns = timestamp_ns
+
+    def flush(self) -> None:
+        """A megírt rekordok és az index lemezre írása."""
+        if self._mmap is None:
+            return
+        self._mmap.flush()
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+
+    async def attach(
+        self, bus: "EventBusInterface", event_types: Iterable[str] | None = None
+    ) -> None:
+        """Feliratkozás a buszra: a megadott eseménytípusok naplózása.
+
+        A napló saját, 'block' szabályú sorral iratkozik fel, így a naplózás
+        nem lassítja a többi feliratkozót és nem veszít eseményt. Ugyanarra a
+        buszra visszajátszott események újra naplózódnak.
+
+        Args:
+            bus: Az EventBus
+            event_types: A naplózott eseménytípusok (alapértelmezett: az összes
+                regisztrált eseménytípus)
+        """
+        self.open()
+        self._bus = bus
+        registry: EventRegistry = getattr(bus, "registry", None) or default_registry()
+        for event_type in event_types or registry.event_types():
+            callback = self._make_callback(event_type)
+            self._callbacks[event_type] = callback
+            bus.subscribe(  # type: ignore[call-arg]
+                event_type, callback, overflow="block", name=f"journal:{event_type}"
+            )
+
+        if self._flush_interval is not None:
+            self._flush_task = asyncio.create_task(self._flush_loop(self._flush_interval))
+
+    async def detach(self) -> None:
+        """Leiratkozás a buszról és a napló lezárása."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._bus is not None:
+            for event_type, callback in self._callbacks.items():
+                self._bus.unsubscribe(event_type, callback)
+            self._bus = None
+            self._callbacks = {}
+        self.close()
+
+    def _make_callback(self, event_type: str) -> Callable[["BaseModel"], Awaitable[None]]:
+        """Naplózó callback egy eseménytípushoz.
+
+        Args:
+            event_type: Az eseménytípus
+
+        Returns:
+            Callable: Az aszinkron callback
+        """
+
+        async def record(event: "BaseModel") -> None:
+            self.append(event_type, event)
+
+        return record
+
+    async def _flush_loop(self, interval: float) -> None:
+        """Periodikus lemezre írás.
+
+        Args:
+            interval: A lemezre írások közötti idő másodpercben
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.flush()
+            except Exception as e:
+                self._logger.error(f"Hiba az eseménynapló lemezre írásakor: {e}")
+
+    def __enter__(self) -> "EventJournal":
+        """Context manager: a napló megnyitása.
+
+        Returns:
+            Az EventJournal példány
+        """
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Context manager lezárás.
+
+        Args:
+            exc_type: A kivétel típusa (ha volt kivétel)
+            exc_val: A kivétel objektum (ha volt kivétel)
+            exc_tb: A traceback objektum (ha volt kivétel)
+        """
+        self.close()
+
+
+class JournalReader:
+    """Eseménynapló olvasása időtartomány szerint és visszajátszás.
+
+    Attributes:
+        directory: A napló könyvtára
+    """
+
+    def __init__(self, directory: str | Path, registry: EventRegistry | None = None) -> None:
+        """Inicializálja a JournalReader-t.
+
+        Args:
+            directory: A napló könyvtára
+            registry: Eseménytípus regiszter a dekódoláshoz
+                (alapértelmezett: a közös regiszter)
+        """
+        self.directory = Path(directory)
+        self._registry = registry or default_registry()
+        self._codecs = available_codecs()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def records(
+        self,
+        start: datetime | int | None = None,
+        end: datetime | int | None = None,
+        event_types: Iterable[str] | None = None,
+    ) -> Iterator[JournalRecord]:
+        """A napló rekordjai időrendben.
+
+        Args:
+            start: Az időtartomány eleje (datetime vagy ns; None = a napló eleje)
+            end: Az időtartomány vége, exkluzív (None = a napló vége)
+            event_types: Csak ezek az eseménytípusok (None = mind)
+
+        Yields:
+            JournalRecord: A rekordok
+        """
+        start_ns = _to_ns(start)
+        end_ns = _to_ns(end)
+        wanted = set(event_types) if event_types is not None else None
+
+        segments = _list_segments(self.directory)
+        first = 0
+        if start_ns is not None and segments:
+            # Az utolsó szegmens, amely a kezdőidő előtt kezdődik
+            first = max(0, bisect.bisect_left([ts for ts, _ in segments], start_ns) - 1)
+
+        for segment_start, path in segments[first:]:
+            if end_ns is not None and segment_start >= end_ns:
+                return
+            offset = 0
+            if start_ns is not None:
+                index = _read_index(path.with_suffix(_INDEX_SUFFIX))
+                # Az utolsó indexelt rekord, amely a kezdőidő előtt van
+                position = bisect.bisect_left([ts for ts, _ in index], start_ns) - 1
+                if position >= 0:
+                    offset = index[position][1]
+
+            with open(path, "rb") as segment_file:
+                if os.fstat(segment_file.fileno()).st_size == 0:
+                    continue
+                with mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for _, record in _scan_records(mapped, offset):
+                        if start_ns is not None and record.timestamp_ns < start_ns:
+                            continue
+                        if end_ns is not None and record.timestamp_ns >= end_ns:
+                            return
+                        if wanted is None or record.event_type in wanted:
+                            yield record
+
+    def events(
+        self,
+        start: datetime | int | None = None,
+        end: datetime | int | None = None,
+        event_types: Iterable[str] | None = None,
+        trusted: bool = True,
+    ) -> Iterator[tuple[int, str, "BaseModel"]]:
+        """A napló dekódolt eseményei időrendben.
+
+        Args:
+            start: Az időtartomány eleje (datetime vagy ns)
+            end: Az időtartomány vége, exkluzív
+            event_types: Csak ezek az eseménytípusok
+            trusted: Validáció nélküli dekódolás (a napló validált eseményeket tárol)
+
+        Yields:
+            tuple[int, str, BaseModel]: (rekordidő ns, eseménytípus, esemény)
+        """
+        for record in self.records(start, end, event_types):
+            codec = self._codecs.get(record.codec_id)
+            if codec is None:
+                self._logger.error(f"Ismeretlen codec azonosító a naplóban: {record.codec_id}")
+                continue
+            try:
+                event = codec.decode_event(
+                    record.event_type, record.payload, self._registry, trusted
+                )
+            except Exception as e:
+                self._logger.error(f"Hiba a(z) {record.event_type} naplórekord dekódolásakor: {e}")
+                continue
+            yield record.timestamp_ns, record.event_type, event
+
+    async def replay(
+        self,
+        start: datetime | int | None = None,
+        end: datetime | int | None = None,
+        *,
+        bus: "EventBusInterface | None" = None,
+        callback: ReplayCallback | None = None,
+        speed: float | None = None,
+        event_types: Iterable[str] | None = None,
+        trusted: bool = True,
+    ) -> int:
+        """Időtartomány visszajátszása a buszra vagy közvetlenül egy callback-be.
+
+        Args:
+            start: Az időtartomány eleje (datetime vagy ns)
+            end: Az időtartomány vége, exkluzív
+            bus: A cél EventBus (publish)
+            callback: A cél callback (eseménytípus, esemény)
+            speed: A felvételi időhöz képesti sebesség szorzó (1.0 = valós
+                idő, 10.0 = tízszeres); None = amilyen gyorsan lehet
+            event_types: Csak ezek az eseménytípusok
+            trusted: Validáció nélküli dekódolás
+
+        Returns:
+            int: A visszajátszott események száma
+
+        Raises:
+            EventBusError: Ha sem bus, sem callback nincs megadva, vagy a
+                speed nem pozitív
+        """
+        if (bus is None) == (callback is None):
+            raise EventBusError("Pontosan egy cél adható meg: bus vagy callback")
+        if speed is not None and speed <= 0:
+            raise EventBusError(f"Érvénytelen visszajátszási sebesség: {speed}")
+
+        count = 0
+        first_ns: int | None = None
+        wall_start = time.perf_counter()
+        for timestamp_ns, event_type, event in self.events(start, end, event_types, trusted):
+            if speed is not None:
+                if first_ns is None:
+                    first_ns = timestamp_ns
+                due = wall_start + (timestamp_ns - first_ns) / 1e9 / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif count % 1000 == 0:
+                # Maximális sebességnél is teret ad a többi task-nak
+                await asyncio.sleep(0)
+
+            if bus is not None:
+                await bus.publish(event_type, event)
+            else:
+                await callback(event_type, event)  # type: ignore[misc]
+            count += 1
+
+        return count
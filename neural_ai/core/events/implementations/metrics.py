@@ -0,0 +1,353 @@
+"""EventBus metrikák: számlálók, hisztogramok és Prometheus export.
+
+A busz a közzététel, a fogadás és a továbbítás útján eseménytípusonkénti
+számlálókat és fix bucket-es hisztogramokat vezet. A rögzítés egy dict
+művelet, illetve egy bisect és két összeadás, így a forró útra nem tesz
+mérhető késleltetést; kikapcsolt metrikáknál (metrics_enabled=False) semmi
+sem fut.
+
+A ZeroMQ PUB socket nem jelzi a high-water-mark miatt eldobott üzeneteket;
+ezek a küldő messages_sent és a fogadó messages_received számlálóinak
+különbségeként látszanak.
+
+A modulban található:
+    - Histogram: Fix bucket-es hisztogram
+    - EventBusMetrics: Eseménytípusonkénti számlálók és hisztogramok
+    - render_prometheus: Pillanatkép Prometheus szöveges formátumban
+    - MetricsServer: Helyi HTTP végpont a Prometheus scrape-hez
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from neural_ai.core.events.implementations.subscription import SubscriberStats
+
+
+# Számlálók
+EVENTS_PUBLISHED = "events_published"
+MESSAGES_SENT = "messages_sent"
+BYTES_SENT = "bytes_sent"
+MESSAGES_RECEIVED = "messages_received"
+BYTES_RECEIVED = "bytes_received"
+EVENTS_RECEIVED = "events_received"
+DECODE_ERRORS = "decode_errors"
+EVENTS_DISPATCHED = "events_dispatched"
+CALLBACK_ERRORS = "callback_errors"
+DEAD_LETTERS = "dead_letters"
+
+# Hisztogramok (másodperc)
+ENCODE_SECONDS = "encode_seconds"
+DECODE_SECONDS = "decode_seconds"
+CALLBACK_SECONDS = "callback_seconds"
+QUEUE_LAG_SECONDS = "queue_lag_seconds"
+
+# 1 µs - 10 s, nagyságrendenként 1 / 2.5 / 5 lépésekkel
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6,
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0,
+    10.0,
+)  # fmt: skip
+
+_PROMETHEUS_PREFIX = "neural_ai_eventbus_"
+
+
+class Histogram:
+    """Fix bucket-es hisztogram (Prometheus kompatibilis)."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Inicializálja a hisztogramot.
+
+        Args:
+            bounds: A bucket-ek felső határai növekvő sorrendben
+        """
+        self.bounds = bounds
+        # Az utolsó elem a +Inf bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Egy érték rögzítése.
+
+        Args:
+            value: A mért érték
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Becsült kvantilis (a bucket felső határa).
+
+        Args:
+            q: A kvantilis (0.0 - 1.0)
+
+        Returns:
+            float: A kvantilist tartalmazó bucket felső határa
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        """A hisztogram pillanatképe.
+
+        Returns:
+            dict[str, Any]: Kumulatív bucket-ek, összeg, darabszám és becsült kvantilisek
+        """
+        buckets = []
+        cumulative = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {
+            "buckets": buckets,
+            "sum": self.sum,
+            "count": self.count,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class EventBusMetrics:
+    """Eseménytípusonkénti számlálók és hisztogramok."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Inicializálja az EventBusMetrics-et.
+
+        Args:
+            buckets: A hisztogramok bucket határai
+        """
+        self._buckets = buckets
+        self._counters: defaultdict[str, defaultdict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._histograms: defaultdict[str, dict[str, Histogram]] = defaultdict(dict)
+
+    def inc(self, name: str, event_type: str, value: int = 1) -> None:
+        """Számláló növelése.
+
+        Args:
+            name: A számláló neve
+            event_type: Az eseménytípus
+            value: A növekmény
+        """
+        self._counters[name][event_type] += value
+
+    def observe(self, name: str, event_type: str, value: float) -> None:
+        """Érték rögzítése egy hisztogramban.
+
+        Args:
+            name: A hisztogram neve
+            event_type: Az eseménytípus
+            value: A mért érték (másodperc)
+        """
+        histograms = self._histograms[name]
+        histogram = histograms.get(event_type)
+        if histogram is None:
+            histogram = histograms[event_type] = Histogram(self._buckets)
+        histogram.observe(value)
+
+    def counter(self, name: str, event_type: str) -> int:
+        """Egy számláló aktuális értéke.
+
+        Args:
+            name: A számláló neve
+            event_type: Az eseménytípus
+
+        Returns:
+            int: A számláló értéke
+        """
+        return self._counters.get(name, {}).get(event_type, 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Az összes metrika pillanatképe.
+
+        Returns:
+            dict[str, Any]: {'counters': {név: {eseménytípus: érték}},
+            'histograms': {név: {eseménytípus: hisztogram pillanatkép}}}
+        """
+        return {
+            "counters": {name: dict(values) for name, values in self._counters.items()},
+            "histograms": {
+                name: {event_type: h.snapshot() for event_type, h in histograms.items()}
+                for name, histograms in self._histograms.items()
+            },
+        }
+
+    def reset(self) -> None:
+        """Az összes metrika nullázása."""
+        self._counters.clear()
+        self._histograms.clear()
+
+
+def _escape(value: str) -> str:
+    """Prometheus címke érték escape-elése."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    """Bucket határ formázása."""
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def render_prometheus(
+    snapshot: dict[str, Any], subscribers: list["SubscriberStats"] | None = None
+) -> str:
+    """Metrika pillanatkép Prometheus szöveges formátumban (0.0.4).
+
+    Args:
+        snapshot: Az EventBusMetrics.snapshot() eredménye
+        subscribers: A feliratkozók metrikái (sorhossz, késés, eldobások)
+
+    Returns:
+        str: A Prometheus exposition szöveg
+    """
+    lines: list[str] = []
+
+    for name, values in sorted(snapshot.get("counters", {}).items()):
+        metric = f"{_PROMETHEUS_PREFIX}{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for event_type, value in sorted(values.items()):
+            lines.append(f'{metric}{{event_type="{_escape(event_type)}"}} {value}')
+
+    for name, histograms in sorted(snapshot.get("histograms", {}).items()):
+        metric = f"{_PROMETHEUS_PREFIX}{name}"
+        lines.append(f"# TYPE {metric} histogram")
+        for event_type, histogram in sorted(histograms.items()):
+            label = f'event_type="{_escape(event_type)}"'
+            for bound, cumulative in histogram["buckets"]:
+                lines.append(f'{metric}_bucket{{{label},le="{_format_bound(bound)}"}} {cumulative}')
+            lines.append(f"{metric}_sum{{{label}}} {histogram['sum']}")
+            lines.append(f"{metric}_count{{{label}}} {histogram['count']}")
+
+    if subscribers:
+        gauges = (
+            ("queue_size", "gauge"),
+            ("received", "counter"),
+            ("delivered", "counter"),
+            ("dropped", "counter"),
+            ("conflated", "counter"),
+            ("errors", "counter"),
+            ("blocked_seconds", "counter"),
+            ("last_lag_seconds", "gauge"),
+            ("max_lag_seconds", "gauge"),
+            ("callback_seconds", "counter"),
+        )
+        rows = [asdict(stats) for stats in subscribers]
+        for field_name, metric_type in gauges:
+            suffix = "_total" if metric_type == "counter" else ""
+            metric = f"{_PROMETHEUS_PREFIX}subscriber_{field_name}{suffix}"
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for row in rows:
+                label = (
+                    f'event_type="{_escape(row["event_type"])}",'
+                    f'subscriber="{_escape(row["name"])}"'
+                )
+                lines.append(f"{metric}{{{label}}} {row[field_name]}")
+
+        metric = f"{_PROMETHEUS_PREFIX}subscriber_conflated_by_key_total"
+        lines.append(f"# TYPE {metric} counter")
+        for row in rows:
+            for key, count in sorted(row["conflated_by_key"].items()):
+                label = (
+                    f'event_type="{_escape(row["event_type"])}",'
+                    f'subscriber="{_escape(row["name"])}",key="{_escape(key)}"'
+                )
+                lines.append(f"{metric}{{{label}}} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Helyi HTTP végpont a Prometheus scrape-hez (GET /metrics).
+
+    Attributes:
+        host: A figyelt cím
+        port: A figyelt port
+    """
+
+    def __init__(
+        self, render: Callable[[], str], host: str = "127.0.0.1", port: int = 9464
+    ) -> None:
+        """Inicializálja a MetricsServer-t.
+
+        Args:
+            render: A Prometheus szöveget előállító függvény
+            host: A figyelt cím
+            port: A figyelt port
+        """
+        self.host = host
+        self.port = port
+        self._render = render
+        self._server: asyncio.Server | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    async def start(self) -> None:
+        """A végpont indítása."""
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self._logger.info(f"Metrika végpont: http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """A végpont leállítása."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Egy HTTP kérés kiszolgálása.
+
+        Args:
+            reader: A kapcsolat olvasó oldala
+            writer: A kapcsolat író oldala
+        """
+        try:
+            request_line = await reader.readline()
+            # A fejlécek átlépése az üres sorig
+            while (await reader.readline()).strip():
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] in ("/metrics", "/"):
+                status, body = "200 OK", self._render().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status, body = "404 Not Found", b"Not Found\n"
+                content_type = "text/plain; charset=utf-8"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
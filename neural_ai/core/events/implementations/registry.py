@@ -0,0 +1,214 @@
+"""Eseménytípus regiszter a publisher és a subscriber oldal számára.
+
+A regiszter az eseménytípus nevét (a ZeroMQ topic-ot) rendeli a Pydantic
+modellhez. A publisher a regiszter alapján ellenőrzi, hogy a közzétett
+esemény a típushoz tartozó modell példánya-e, a subscriber pedig a modellt
+egyetlen szótár-kereséssel találja meg.
+
+Dekódolási utak:
+    - validált: a codec közvetlenül a wire bájtokból validál (JSON esetén
+      model_validate_json, a köztes dict nélkül)
+    - megbízható (trusted): model_construct, validáció nélkül. Csak saját,
+      validált modelleket közzétevő producerek eseményeihez használható; a
+      szöveges (ISO) időbélyegeket a regiszter alakítja datetime-má, más
+      típuskonverzió nem történik.
+
+A modulban található:
+    - EventRegistry: Eseménytípus -> modell regiszter
+    - default_registry: A folyamatszintű, közös regiszter
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import types
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+from neural_ai.core.events.exceptions import EventBusError
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+def _is_datetime_annotation(annotation: Any) -> bool:
+    """Ellenőrzi, hogy a mező típusa datetime vagy opcionális datetime-e.
+
+    Args:
+        annotation: A mező típusannotációja
+
+    Returns:
+        bool: True, ha a mező datetime értéket tárol
+    """
+    if annotation is datetime:
+        return True
+    if get_origin(annotation) in (Union, types.UnionType):
+        return datetime in get_args(annotation)
+    return False
+
+
+class EventRegistry:
+    """Eseménytípus -> Pydantic modell regiszter."""
+
+    def __init__(self) -> None:
+        """Inicializálja az üres regisztert."""
+        self._models: dict[str, type[BaseModel]] = {}
+        self._datetime_fields: dict[str, tuple[str, ...]] = {}
+
+    def register(self, event_type: str, model: type["BaseModel"]) -> None:
+        """Eseménytípus regisztrálása.
+
+        Args:
+            event_type: Az eseménytípus neve (a topic)
+            model: Az eseményt leíró Pydantic modell
+
+        Raises:
+            EventBusError: Ha az eseménytípus már más modellhez van rendelve
+        """
+        registered = self._models.get(event_type)
+        if registered is not None and registered is not model:
+            raise EventBusError(
+                f"A(z) {event_type} eseménytípus már regisztrálva van: {registered.__name__}"
+            )
+        self._models[event_type] = model
+        self._datetime_fields[event_type] = tuple(
+            name
+            for name, field in model.model_fields.items()
+            if _is_datetime_annotation(field.annotation)
+        )
+
+    def __contains__(self, event_type: object) -> bool:
+        """Regisztrált-e az eseménytípus."""
+        return event_type in self._models
+
+    def event_types(self) -> list[str]:
+        """A regisztrált eseménytípusok.
+
+        Returns:
+            list[str]: Az eseménytípusok nevei
+        """
+        return list(self._models)
+
+    def model_for(self, event_type: str) -> type["BaseModel"] | None:
+        """Az eseménytípus modellje.
+
+        Args:
+            event_type: Az eseménytípus
+
+        Returns:
+            type[BaseModel] | None: A modell, vagy None, ha nincs regisztrálva
+        """
+        return self._models.get(event_type)
+
+    def check(self, event_type: str, event: "BaseModel") -> None:
+        """Ellenőrzi, hogy az esemény a típushoz regisztrált modell példánya-e.
+
+        Args:
+            event_type: Az eseménytípus
+            event: A közzéteendő esemény
+
+        Raises:
+            EventBusError: Ha az esemény más modell példánya
+        """
+        model = self._models.get(event_type)
+        if model is not None and not isinstance(event, model):
+            raise EventBusError(
+                f"A(z) {event_type} eseménytípushoz {model.__name__} tartozik, "
+                f"nem {type(event).__name__}"
+            )
+
+    def _require(self, event_type: str) -> type["BaseModel"]:
+        """A regisztrált modell, vagy hiba.
+
+        Raises:
+            EventBusError: Ha az eseménytípus nincs regisztrálva
+        """
+        model = self._models.get(event_type)
+        if model is None:
+            raise EventBusError(f"Ismeretlen eseménytípus: {event_type}")
+        return model
+
+    def validate(self, event_type: str, data: dict[str, Any]) -> "BaseModel":
+        """Esemény létrehozása teljes validációval.
+
+        Args:
+            event_type: Az eseménytípus
+            data: Az esemény mezői
+
+        Returns:
+            BaseModel: A validált esemény
+
+        Raises:
+            EventBusError: Ha az eseménytípus nincs regisztrálva
+            pydantic.ValidationError: Ha az adatok érvénytelenek
+        """
+        return self._require(event_type).model_validate(data)
+
+    def validate_json(self, event_type: str, payload: bytes) -> "BaseModel":
+        """Esemény validálása közvetlenül JSON bájtokból.
+
+        Args:
+            event_type: Az eseménytípus
+            payload: A JSON payload
+
+        Returns:
+            BaseModel: A validált esemény
+
+        Raises:
+            EventBusError: Ha az eseménytípus nincs regisztrálva
+            pydantic.ValidationError: Ha az adatok érvénytelenek
+        """
+        return self._require(event_type).model_validate_json(payload)
+
+    def construct(self, event_type: str, data: dict[str, Any]) -> "BaseModel":
+        """Esemény létrehozása validáció nélkül (megbízható producerekhez).
+
+        Args:
+            event_type: Az eseménytípus
+            data: Az esemény mezői (a dict módosulhat)
+
+        Returns:
+            BaseModel: Az esemény
+
+        Raises:
+            EventBusError: Ha az eseménytípus nincs regisztrálva
+        """
+        model = self._require(event_type)
+        for name in self._datetime_fields[event_type]:
+            value = data.get(name)
+            if isinstance(value, str):
+                data[name] = datetime.fromisoformat(value)
+        return model.model_construct(**data)
+
+
+_default_registry: EventRegistry | None = None
+
+
+def default_registry() -> EventRegistry:
+    """A folyamatszintű, közös regiszter a beépített eseménytípusokkal.
+
+    Returns:
+        EventRegistry: A közös regiszter
+    """
+    global _default_registry
+    if _default_registry is None:
+        # Importáljuk itt, hogy elkerüljük a körkörös importot
+        from neural_ai.core.events.interfaces.event_models import (
+            EventType,
+            MarketDataEvent,
+            OrderEvent,
+            PositionEvent,
+            SignalEvent,
+            SystemLogEvent,
+            TradeEvent,
+        )
+
+        registry = EventRegistry()
+        registry.register(EventType.MARKET_DATA.value, MarketDataEvent)
+        registry.register(EventType.TRADE.value, TradeEvent)
+        registry.register(EventType.SIGNAL.value, SignalEvent)
+        registry.register(EventType.SYSTEM_LOG.value, SystemLogEvent)
+        registry.register(EventType.ORDER.value, OrderEvent)
+        registry.register(EventType.POSITION.value, PositionEvent)
+        _default_registry = registry
+    return _default_registry
@@ -0,0 +1,625 @@
+"""Feliratkozók saját, korlátos sorral és worker task-kal.
+
+A fogadó ciklus csak a feliratkozók soraiba teszi az eseményeket, a
+callback-eket feliratkozónként külön worker task hívja. Így egy lassú
+callback nem akasztja meg a busz többi feliratkozóját.
+
+A modulban található:
+    - OverflowPolicy: A teli sor kezelésének módja
+    - SubscriberStats: Egy feliratkozó pillanatnyi metrikái
+    - Subscription: Egy callback sora, worker task-ja és metrikái
+    - SubscriptionManager: Egy busz feliratkozásai eseménytípusonként
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from neural_ai.core.events.exceptions import EventBusError, SubscriberError
+from neural_ai.core.events.implementations.metrics import (
+    CALLBACK_ERRORS,
+    CALLBACK_SECONDS,
+    EVENTS_DISPATCHED,
+    QUEUE_LAG_SECONDS,
+    EventBusMetrics,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from neural_ai.core.events.implementations.dead_letter import DeadLetterQueue
+    from neural_ai.core.events.interfaces.event_bus_interface import EventBusConfig
+
+
+class OverflowPolicy(str, Enum):
+    """A teli feliratkozói sor kezelésének módja.
+
+    Attributes:
+        BLOCK: A fogadó ciklus megvárja, amíg a sorban hely lesz (backpressure)
+        DROP_OLDEST: A legrégebbi várakozó esemény eldobásra kerül
+        CONFLATE: Kulcsonként csak a legfrissebb várakozó esemény marad meg
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+
+
+@dataclass
+class SubscriberStats:
+    """Egy feliratkozó pillanatnyi metrikái.
+
+    Attributes:
+        name: A feliratkozó neve
+        event_type: Az eseménytípus
+        overflow: A túlcsordulási szabály
+        queue_size: A várakozó események száma
+        max_queue_size: A sor kapacitása
+        received: A sorba került események száma
+        delivered: A callback-nek átadott események száma
+        dropped: A túlcsordulás miatt eldobott események száma
+        conflated: Újabb eseménnyel felülírt várakozó események száma
+        conflated_by_key: A felülírások száma conflation kulcsonként (pl. szimbólum)
+        errors: A kivétellel végződött callback hívások száma
+        blocked_seconds: A fogadó ciklus várakozása teli sor miatt (BLOCK)
+        last_lag_seconds: Az utolsó esemény várakozási ideje a sorban
+        max_lag_seconds: A legnagyobb mért várakozási idő
+        callback_seconds: A callback-ekben töltött összes idő
+    """
+
+    name: str
+    event_type: str
+    overflow: str
+    queue_size: int
+    max_queue_size: int
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    conflated_by_key: dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    blocked_seconds: float = 0.0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    callback_seconds: float = 0.0
+
+
+def _single_key(event: "BaseModel") -> Hashable:
+    """Alapértelmezett conflation kulcs: egyetlen legfrissebb esemény."""
+    return None
+
+
+def symbol_key(event: "BaseModel") -> Hashable:
+    """Conflation kulcs szimbólumonként (pl. MarketDataEvent).
+
+    Args:
+        event: Az esemény
+
+    Returns:
+        Hashable: Az esemény szimbóluma
+    """
+    return event.symbol  # type: ignore[attr-defined, no-any-return]
+
+
+def resolve_conflation(
+    overflow: OverflowPolicy | str | None,
+    conflate_key: Callable[["BaseModel"], Hashable] | None,
+    conflate_by_symbol: bool,
+) -> tuple[OverflowPolicy | str | None, Callable[["BaseModel"], Hashable] | None]:
+    """A conflate_by_symbol kapcsoló feloldása túlcsordulási szabályra és kulcsra.
+
+    Args:
+        overflow: A megadott túlcsordulási szabály (None = nincs megadva)
+        conflate_key: A megadott conflation kulcs
+        conflate_by_symbol: Szimbólumonként csak a legfrissebb esemény maradjon
+
+    Returns:
+        tuple: A (szabály, kulcs) pár; conflate_by_symbol nélkül változatlanul
+
+    Raises:
+        SubscriberError: Ha conflate_by_symbol mellett más szabály vagy kulcs van megadva
+    """
+    if not conflate_by_symbol:
+        return overflow, conflate_key
+    if overflow is not None and overflow != OverflowPolicy.CONFLATE:
+        raise SubscriberError(f"A conflate_by_symbol nem használható a(z) {overflow} szabállyal")
+    if conflate_key is not None:
+        raise SubscriberError("A conflate_by_symbol mellett nem adható meg conflate_key")
+    return OverflowPolicy.CONFLATE, symbol_key
+
+
+class Subscription:
+    """Egy callback feliratkozása saját korlátos sorral és worker task-kal.
+
+    Attributes:
+        event_type: Az eseménytípus
+        callback: Az aszinkron callback
+        name: A feliratkozó neve (metrikákban és logokban)
+        max_queue_size: A sor kapacitása
+        overflow: A túlcsordulási szabály
+    """
+
+    def __init__(
+        self,
+        event_type: str,
+        callback: Callable[["BaseModel"], Any],
+        max_queue_size: int = 10000,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        conflate_key: Callable[["BaseModel"], Hashable] | None = None,
+        name: str | None = None,
+        logger: logging.Logger | None = None,
+        metrics: EventBusMetrics | None = None,
+        dead_letters: "DeadLetterQueue | None" = None,
+    ) -> None:
+        """Inicializálja a Subscription-t.
+
+        Args:
+            event_type: Az eseménytípus
+            callback: Az aszinkron callback
+            max_queue_size: A sor kapacitása
+            overflow: A túlcsordulási szabály
+            conflate_key: CONFLATE szabálynál az eseményekből képzett kulcs
+                (alapértelmezett: egyetlen legfrissebb esemény)
+            name: A feliratkozó neve (alapértelmezett: a callback neve)
+            logger: Logger a callback hibákhoz
+            metrics: A busz metrikái (callback idő, sorban várakozás, hibák)
+            dead_letters: A callback-ben hibát okozó események dead-letter sora
+
+        Raises:
+            SubscriberError: Ha a sor mérete vagy a szabály érvénytelen
+        """
+        try:
+            self.overflow = OverflowPolicy(overflow)
+        except ValueError as e:
+            raise SubscriberError(f"Érvénytelen túlcsordulási szabály: {overflow}") from e
+        if max_queue_size <= 0:
+            raise SubscriberError(f"Érvénytelen sorméret: {max_queue_size}")
+
+        self.event_type = event_type
+        self.callback = callback
+        self.max_queue_size = max_queue_size
+        self.name: str = name or str(getattr(callback, "__qualname__", repr(callback)))
+        self._conflate_key = conflate_key or _single_key
+        self._logger = logger or logging.getLogger(self.__class__.__name__)
+        self._metrics = metrics
+        self._dead_letters = dead_letters
+
+        # (esemény, sorba kerülés ideje) párok; CONFLATE esetén kulcs szerint
+        self._queue: deque[tuple[BaseModel, float]] = deque()
+        self._latest: OrderedDict[Hashable, tuple[BaseModel, float]] = OrderedDict()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._worker: asyncio.Task[None] | None = None
+        self._stats = SubscriberStats(
+            name=self.name,
+            event_type=event_type,
+            overflow=self.overflow.value,
+            queue_size=0,
+            max_queue_size=max_queue_size,
+        )
+
+    def __len__(self) -> int:
+        """A várakozó események száma."""
+        return len(self._latest) if self.overflow is OverflowPolicy.CONFLATE else len(self._queue)
+
+    @property
+    def running(self) -> bool:
+        """Fut-e a worker task."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Elindítja a worker task-ot (futó eseményhurkot igényel)."""
+        if not self.running:
+            self._worker = asyncio.get_running_loop().create_task(
+                self._run(), name=f"subscriber:{self.event_type}:{self.name}"
+            )
+
+    def stop(self) -> int:
+        """Leállítja a worker task-ot; a várakozó események elvesznek.
+
+        Returns:
+            int: Az eldobott várakozó események száma
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        pending = len(self)
+        self._queue.clear()
+        self._latest.clear()
+        self._not_empty.clear()
+        self._not_full.set()
+        return pending
+
+    async def put(self, event: "BaseModel") -> None:
+        """Esemény sorba tétele a túlcsordulási szabály szerint.
+
+        Args:
+            event: A továbbítandó esemény
+        """
+        stats = self._stats
+        stats.received += 1
+        enqueued_at = time.monotonic()
+
+        if self.overflow is OverflowPolicy.CONFLATE:
+            key = self._conflate_key(event)
+            if key in self._latest:
+                # A kulcs megtartja a helyét a sorban, csak az esemény frissül;
+                # a késés így a ténylegesen kézbesített esemény korát mutatja
+                self._latest[key] = (event, enqueued_at)
+                self._count_conflated(key)
+            else:
+                if len(self._latest) >= self.max_queue_size:
+                    self._latest.popitem(last=False)
+                    stats.dropped += 1
+                self._latest[key] = (event, enqueued_at)
+        elif self.overflow is OverflowPolicy.DROP_OLDEST:
+            if len(self._queue) >= self.max_queue_size:
+                self._queue.popleft()
+                stats.dropped += 1
+            self._queue.append((event, enqueued_at))
+        else:
+            while len(self._queue) >= self.max_queue_size:
+                self._not_full.clear()
+                await self._not_full.wait()
+            stats.blocked_seconds += time.monotonic() - enqueued_at
+            self._queue.append((event, enqueued_at))
+
+        self._not_empty.set()
+
+    def _count_conflated(self, key: Hashable) -> None:
+        """Egy újabb eseménnyel felülírt várakozó esemény számlálása.
+
+        Args:
+            key: A conflation kulcs
+        """
+        stats = self._stats
+        stats.conflated += 1
+        by_key = stats.conflated_by_key
+        label = str(key)
+        by_key[label] = by_key.get(label, 0) + 1
+
+    async def _get(self) -> tuple["BaseModel", float]:
+        """A következő várakozó esemény kivétele (várakozik, ha üres).
+
+        Returns:
+            tuple[BaseModel, float]: Az esemény és a sorba kerülés ideje
+        """
+        while not len(self):
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        if self.overflow is OverflowPolicy.CONFLATE:
+            _, item = self._latest.popitem(last=False)
+        else:
+            item = self._queue.popleft()
+            self._not_full.set()
+        return item
+
+    async def _run(self) -> None:
+        """A worker task: a sor eseményeinek átadása a callback-nek."""
+        stats = self._stats
+        metrics = self._metrics
+        while True:
+            event, enqueued_at = await self._get()
+            started = time.monotonic()
+            lag = started - enqueued_at
+            stats.last_lag_seconds = lag
+            if lag > stats.max_lag_seconds:
+                stats.max_lag_seconds = lag
+
+            try:
+                await self.callback(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.errors += 1
+                if metrics is not None:
+                    metrics.inc(CALLBACK_ERRORS, self.event_type)
+                self._logger.error(
+                    f"Hiba a callback végrehajtásakor ({self.name}): {e}", exc_info=True
+                )
+                if self._dead_letters is not None:
+                    self._dead_letters.capture_callback_failure(
+                        self.event_type, self.name, event, e
+                    )
+            finally:
+                elapsed = time.monotonic() - started
+                stats.delivered += 1
+                stats.callback_seconds += elapsed
+                if metrics is not None:
+                    metrics.observe(CALLBACK_SECONDS, self.event_type, elapsed)
+                    metrics.observe(QUEUE_LAG_SECONDS, self.event_type, lag)
+
+    def stats(self) -> SubscriberStats:
+        """A feliratkozó metrikáinak pillanatképe.
+
+        Returns:
+            SubscriberStats: A metrikák másolata
+        """
+        snapshot = SubscriberStats(**self._stats.__dict__)
+        snapshot.queue_size = len(self)
+        snapshot.conflated_by_key = dict(self._stats.conflated_by_key)
+        return snapshot
+
+
+class SubscriptionManager:
+    """Egy busz feliratkozásai eseménytípusonként.
+
+    A transport-független részt (sorok, worker task-ok, metrikák) fogja
+    össze, így a ZeroMQ-s és a folyamaton belüli busz ugyanúgy kezeli a
+    feliratkozókat.
+    """
+
+    def __init__(
+        self,
+        default_queue_size: int = 10000,
+        default_overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        logger: logging.Logger | None = None,
+        metrics: EventBusMetrics | None = None,
+        dead_letters: "DeadLetterQueue | None" = None,
+    ) -> None:
+        """Inicializálja a SubscriptionManager-t.
+
+        Args:
+            default_queue_size: Az alapértelmezett sorméret
+            default_overflow: Az alapértelmezett túlcsordulási szabály
+            logger: Logger a feliratkozókhoz
+            metrics: A busz metrikái (None = kikapcsolva)
+            dead_letters: A callback hibák dead-letter sora (None = kikapcsolva)
+
+        Raises:
+            EventBusError: Ha a sorméret vagy a szabály érvénytelen
+        """
+        if default_queue_size <= 0:
+            raise EventBusError(f"Érvénytelen subscriber_queue_size: {default_queue_size}")
+        try:
+            self._default_overflow = OverflowPolicy(default_overflow)
+        except ValueError as e:
+            raise EventBusError(
+                f"Érvénytelen overflow_policy: {default_overflow}. "
+                f"Támogatott: {[policy.value for policy in OverflowPolicy]}"
+            ) from e
+        self._default_queue_size = default_queue_size
+        self._logger = logger or logging.getLogger(self.__class__.__name__)
+        self._metrics = metrics
+        self._dead_letters = dead_letters
+        self._subscriptions: dict[str, list[Subscription]] = {}
+        self._running = False
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "EventBusConfig",
+        logger: logging.Logger | None = None,
+        metrics: EventBusMetrics | None = None,
+        dead_letters: "DeadLetterQueue | None" = None,
+    ) -> "SubscriptionManager":
+        """Létrehozás az EventBus konfigurációból.
+
+        Args:
+            config: Az EventBus konfigurációja
+            logger: Logger a feliratkozókhoz
+            metrics: A busz metrikái (None = kikapcsolva)
+            dead_letters: A callback hibák dead-letter sora (None = kikapcsolva)
+
+        Returns:
+            SubscriptionManager: Az új példány
+
+        Raises:
+            EventBusError: Ha a sorméret vagy a szabály érvénytelen
+        """
+        return cls(
+            config.subscriber_queue_size, config.overflow_policy, logger, metrics, dead_letters
+        )
+
+    def __contains__(self, event_type: object) -> bool:
+        """Van-e feliratkozó az eseménytípusra."""
+        return event_type in self._subscriptions
+
+    def __iter__(self) -> Iterator[str]:
+        """A feliratkozott eseménytípusok."""
+        return iter(list(self._subscriptions))
+
+    def add(
+        self,
+        event_type: str,
+        callback: Callable[["BaseModel"], Any],
+        max_queue_size: int | None = None,
+        overflow: OverflowPolicy | str | None = None,
+        conflate_key: Callable[["BaseModel"], Hashable] | None = None,
+        name: str | None = None,
+        conflate_by_symbol: bool = False,
+    ) -> tuple[Subscription, bool]:
+        """Új feliratkozás; futó manager esetén a worker azonnal elindul.
+
+        Args:
+            event_type: Az eseménytípus
+            callback: Az aszinkron callback
+            max_queue_size: A sor kapacitása (None = alapértelmezett)
+            overflow: A túlcsordulási szabály (None = alapértelmezett)
+            conflate_key: CONFLATE szabálynál a kulcs
+            name: A feliratkozó neve
+            conflate_by_symbol: Szimbólumonként csak a legfrissebb várakozó
+                esemény marad meg (CONFLATE szabály symbol kulccsal)
+
+        Returns:
+            tuple[Subscription, bool]: A feliratkozás, és hogy ez-e az
+            eseménytípus első feliratkozója
+
+        Raises:
+            SubscriberError: Ha a sor mérete vagy a szabály érvénytelen, vagy
+                conflate_by_symbol mellett más szabály vagy kulcs van megadva
+        """
+        overflow, conflate_key = resolve_conflation(overflow, conflate_key, conflate_by_symbol)
+        subscription = Subscription(
+            event_type,
+            callback,
+            max_queue_size=max_queue_size or self._default_queue_size,
+            overflow=overflow or self._default_overflow,
+            conflate_key=conflate_key,
+            name=name,
+            logger=self._logger,
+            metrics=self._metrics,
+            dead_letters=self._dead_letters,
+        )
+        return subscription, self._register(subscription)
+
+    def add_batches(
+        self,
+        event_type: str,
+        callback: Callable[[Any], Any],
+        max_batch_size: int = 1000,
+        max_batch_delay: float = 0.05,
+        batch_format: str = "arrow",
+        max_queue_size: int | None = None,
+        overflow: OverflowPolicy | str | None = None,
+        name: str | None = None,
+        conflate_by_symbol: bool = False,
+    ) -> tuple[Subscription, bool]:
+        """Új kötegelt, oszlopos feliratkozás (lásd ColumnarSubscription).
+
+        Args:
+            event_type: Az eseménytípus (jelenleg 'market_data')
+            callback: Az aszinkron callback, amely a köteget kapja
+            max_batch_size: Egy köteg maximális eseményszáma
+            max_batch_delay: Az első esemény legnagyobb várakozása a kötegben (s)
+            batch_format: 'arrow' vagy 'polars'
+            max_queue_size: A sor kapacitása (None = alapértelmezett)
+            overflow: A túlcsordulási szabály (None = alapértelmezett)
+            name: A feliratkozó neve
+            conflate_by_symbol: Az ablakon belül szimbólumonként csak a
+                legfrissebb esemény kerül a kötegbe
+
+        Returns:
+            tuple[Subscription, bool]: A feliratkozás, és hogy ez-e az
+            eseménytípus első feliratkozója
+
+        Raises:
+            SubscriberError: Ha az eseménytípus nem kötegelhető, a paraméterek
+                érvénytelenek, vagy conflate_by_symbol mellett más szabály van megadva
+            ImportError: Ha a formátum csomagja nincs telepítve
+        """
+        # Lusta import: a columnar modul erre a modulra épül
+        from neural_ai.core.events.implementations.columnar import ColumnarSubscription
+
+        overflow, _ = resolve_conflation(overflow, None, conflate_by_symbol)
+        subscription = ColumnarSubscription(
+            event_type,
+            callback,
+            max_batch_size=max_batch_size,
+            max_batch_delay=max_batch_delay,
+            batch_format=batch_format,
+            max_queue_size=max_queue_size or self._default_queue_size,
+            overflow=overflow or self._default_overflow,
+            name=name,
+            logger=self._logger,
+            metrics=self._metrics,
+            dead_letters=self._dead_letters,
+            conflate_by_symbol=conflate_by_symbol,
+        )
+        return subscription, self._register(subscription)
+
+    def _register(self, subscription: Subscription) -> bool:
+        """Feliratkozás felvétele; futó manager esetén a worker azonnal elindul.
+
+        Args:
+            subscription: A feliratkozás
+
+        Returns:
+            bool: Ez-e az eseménytípus első feliratkozója
+        """
+        event_type = subscription.event_type
+        first = event_type not in self._subscriptions
+        self._subscriptions.setdefault(event_type, []).append(subscription)
+        if self._running:
+            subscription.start()
+        return first
+
+    def remove(
+        self, event_type: str, callback: Callable[["BaseModel"], Any]
+    ) -> tuple[Subscription | None, bool]:
+        """A callback feliratkozásának megszüntetése.
+
+        Args:
+            event_type: Az eseménytípus
+            callback: Az eltávolítandó callback
+
+        Returns:
+            tuple[Subscription | None, bool]: Az eltávolított feliratkozás (ha
+            volt), és hogy elfogyott-e az eseménytípus összes feliratkozója
+        """
+        subscriptions = self._subscriptions.get(event_type)
+        if subscriptions is None:
+            return None, False
+
+        removed = None
+        for subscription in subscriptions:
+            if subscription.callback == callback:
+                subscriptions.remove(subscription)
+                subscription.stop()
+                removed = subscription
+                break
+
+        if not subscriptions:
+            del self._subscriptions[event_type]
+            return removed, True
+        return removed, False
+
+    def start(self) -> None:
+        """Az összes worker task elindítása."""
+        self._running = True
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.start()
+
+    def stop(self) -> None:
+        """Az összes worker task leállítása; a várakozó események elvesznek."""
+        self._running = False
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                pending = subscription.stop()
+                if pending:
+                    self._logger.warning(
+                        f"{pending} feldolgozatlan esemény eldobva: {subscription.name}"
+                    )
+
+    async def dispatch(self, event_type: str, event: "BaseModel") -> None:
+        """Esemény sorba tétele az eseménytípus összes feliratkozójánál.
+
+        Args:
+            event_type: Az eseménytípus
+            event: Az esemény
+        """
+        subscriptions = self._subscriptions.get(event_type)
+        if not subscriptions:
+            return
+        if self._metrics is not None:
+            self._metrics.inc(EVENTS_DISPATCHED, event_type, len(subscriptions))
+        # Másolaton iterálunk, mert várakozás közben változhat a lista
+        for subscription in list(subscriptions):
+            await subscription.put(event)
+
+    def stats(self, event_type: str | None = None) -> list[SubscriberStats]:
+        """A feliratkozók metrikái.
+
+        Args:
+            event_type: Csak ennek az eseménytípusnak a feliratkozói (None = mind)
+
+        Returns:
+            list[SubscriberStats]: Feliratkozónként egy pillanatkép
+        """
+        return [
+            subscription.stats()
+            for current_type, subscriptions in self._subscriptions.items()
+            if event_type is None or current_type == event_type
+            for subscription in subscriptions
+        ]
@@ -10,13 +10,32 @@ Version: 1.0.0
 import asyncio
 import json
 import logging
-from collections.abc import Callable
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, Optional
+import time
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
 
 from neural_ai.core.base.implementations.singleton import SingletonMeta
 from neural_ai.core.events.exceptions import EventBusError, PublishError
-from neural_ai.core.events.interfaces.event_bus_interface import EventBusInterface
+from neural_ai.core.events.implementations.base_bus import BaseEventBus
+from neural_ai.core.events.implementations.codecs import (
+    FLAG_BATCH,
+    EventCodec,
+    MessageHeader,
+    available_codecs,
+    get_codec,
+)
+from neural_ai.core.events.implementations.dead_letter import LEGACY_CODEC_ID
+from neural_ai.core.events.implementations.metrics import (
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    DECODE_ERRORS,
+    DECODE_SECONDS,
+    ENCODE_SECONDS,
+    EVENTS_PUBLISHED,
+    EVENTS_RECEIVED,
+    MESSAGES_RECEIVED,
+    MESSAGES_SENT,
+)
 
 # Csak típusellenőrzéskor importáljuk, hogy elkerüljük a körkörös importot
 if TYPE_CHECKING:
@@ -35,7 +54,7 @@ EventCallback = Callable[["BaseModel"], "Any"]
 from neural_ai.core.events.interfaces.event_bus_interface import EventBusConfig
 
 
-class EventBus(EventBusInterface, metaclass=SingletonMeta):
+class EventBus(BaseEventBus, metaclass=SingletonMeta):
     """ZeroMQ alapú aszinkron eseménybusz.
 
     Ez az osztály biztosítja az események közzétételét és feliratkozást
@@ -43,28 +62,24 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
 
     A specifikációban említett asyncio.Queue-s megvalósítás helyett egyből
     ZeroMQ-t használunk a teljesítmény és a skálázhatóság érdekében.
+    Broker módban (config.broker_mode) a socketek egy közös EventBroker-hez
+    csatlakoznak, így több publisher folyamat is használhatja ugyanazt a buszt.
+    A feliratkozási, metrika és dead-letter felületet a BaseEventBus adja.
 
     Attributes:
         config: Az EventBus konfigurációja
         _context: ZeroMQ kontextus
         _publisher: Publisher socket
-        _subscribers: Feliratkozók szótára event_type -> callback lista
+        _subscribers: A feliratkozások eseménytípusonként
         _running: Futási állapot jelzője
     """
 
-    @property
-    def config(self) -> EventBusConfig:
-        """Visszaadja az EventBus konfigurációját."""
-        return self._config
-
     def __init__(self, config: EventBusConfig | None = None) -> None:
         """Inicializálja az EventBus-t.
 
         Args:
             config: EventBus konfiguráció (opcionális)
         """
-        self._config = config or EventBusConfig()
-
         # Importáljuk itt, hogy ne legyen kötelező függőség a használathoz
         try:
             import zmq.asyncio
@@ -74,6 +89,8 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
         except ImportError as e:
             raise ImportError("ZeroMQ nincs telepítve. Telepítsd: pip install pyzmq") from e
 
+        super().__init__(config)
+
         # Hozzuk létre a kontextust ha nincs megadva
         if self.config.zmq_context is None:
             self._context: zmq.asyncio.Context = self._zmq_asyncio.Context()
@@ -83,9 +100,53 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
             self._own_context = False
 
         self._publisher: zmq.Socket | None = None
-        self._subscribers: dict[str, list[EventCallback]] = {}
-        self._running = False
-        self._logger = logging.getLogger(self.__class__.__name__)
+        self._subscriber_socket: zmq.Socket | None = None
+
+        # Codec-ek: a fogadó oldal minden telepített codec-et ismer (a fejléc
+        # codec azonosítója alapján dekódol), a küldő a konfiguráltat használja
+        self._codecs: dict[int, EventCodec] = available_codecs()
+        self._default_codec = self._register_codec(self.config.codec)
+        self._codec_overrides: dict[str, EventCodec] = {}
+        for event_type, codec_name in self.config.codec_overrides.items():
+            codec = self._register_codec(codec_name)
+            if not codec.supports(event_type):
+                raise EventBusError(
+                    f"A(z) {codec_name} codec nem kezeli a(z) {event_type} eseményeket"
+                )
+            self._codec_overrides[event_type] = codec
+
+        # Automatikus kötegelés: eseménytípusonként a még el nem küldött payload-ok
+        if self.config.batch_max_size <= 0:
+            raise EventBusError(f"Érvénytelen batch_max_size: {self.config.batch_max_size}")
+        self._batch_buffers: dict[str, list[bytes]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._trusted = self.config.trusted_producers
+
+    def _register_codec(self, name: str) -> EventCodec:
+        """A konfigurált codec példányosítása és regisztrálása a fogadó oldalon.
+
+        Args:
+            name: A codec neve
+
+        Returns:
+            EventCodec: A codec példány
+
+        Raises:
+            EventBusError: Ha a codec ismeretlen vagy nem telepített
+        """
+        codec = get_codec(name)
+        return self._codecs.setdefault(codec.codec_id, codec)
+
+    def _codec_for(self, event_type: str) -> EventCodec:
+        """Az eseménytípus küldéséhez használt codec.
+
+        Args:
+            event_type: Az eseménytípus
+
+        Returns:
+            EventCodec: Az override vagy az alapértelmezett codec
+        """
+        return self._codec_overrides.get(event_type, self._default_codec)
 
     async def start(self) -> None:
         """Elindítja az EventBus-t és létrehozza a socketeket."""
@@ -97,20 +158,27 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
         # Publisher socket létrehozása
         self._publisher = self._context.socket(self._zmq.PUB)
 
-        if self.config.use_inproc:
-            # Inproc transport teszteléshez
-            pub_url = "inproc://eventbus_pub"
+        if self.config.broker_mode:
+            # Több publisher folyamat egy közös broker XSUB végpontjára csatlakozik
+            pub_url = f"tcp://{self.config.broker_host}:{self.config.pub_port}"
+            self._publisher.connect(pub_url)
+            self._logger.info(f"Publisher csatlakozva a brokerhez: {pub_url}")
         else:
-            # TCP transport éles használathoz
-            pub_url = f"tcp://*:{self.config.pub_port}"
+            if self.config.use_inproc:
+                # Inproc transport teszteléshez
+                pub_url = "inproc://eventbus_pub"
+            else:
+                # TCP transport éles használathoz
+                pub_url = f"tcp://*:{self.config.pub_port}"
 
-        self._publisher.bind(pub_url)
-        self._logger.info(f"Publisher bind-olva: {pub_url}")
+            self._publisher.bind(pub_url)
+            self._logger.info(f"Publisher bind-olva: {pub_url}")
 
         # Kis várakozás, hogy a bind teljesüljön
         await asyncio.sleep(0.1)
 
         self._running = True
+        await self._start_services()
         self._logger.info("EventBus elindítva")
 
     async def stop(self) -> None:
@@ -119,7 +187,15 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
             return
 
         self._logger.info("EventBus leállítása...")
+
+        # A pufferben maradt események még a socket lezárása előtt kimennek
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
         self._running = False
+        await self._stop_services()
 
         if self._publisher:
             self._publisher.close()
@@ -147,117 +223,172 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
         if self._publisher is None:
             raise PublishError("Publisher socket nincs inicializálva")
 
-        # Serializáljuk az eseményt JSON formátumba
-        # A model_dump_json() automatikusan kezeli a datetime objektumokat
-        event_dict = json.loads(event.model_dump_json())
-        event_dict["_event_type"] = event_type
-        event_dict["_timestamp"] = datetime.now(UTC).isoformat()
-
-        message = json.dumps(event_dict).encode("utf-8")
-
-        # Küldjük az eseményt a megfelelő témakörbe
-        topic = event_type.encode("utf-8")
-        await self._publisher.send_multipart([topic, message])
+        # Egyetlen kódolás; a metaadatok külön fejléc frame-ben utaznak
+        payload = self._encode(event_type, event)
+
+        if self.config.batch_max_delay is not None:
+            buffer = self._batch_buffers.setdefault(event_type, [])
+            buffer.append(payload)
+            if len(buffer) >= self.config.batch_max_size:
+                self._batch_buffers[event_type] = []
+                await self._send(event_type, buffer)
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(
+                    self._flush_after(self.config.batch_max_delay)
+                )
+            return
 
+        await self._send(event_type, [payload])
         self._logger.debug(f"Esemény közzétéve: {event_type}")
 
-    def subscribe(self, event_type: str, callback: EventCallback) -> None:
-        """Feliratkozás eseménytípusra.
+    async def publish_many(self, event_type: str, events: Sequence["BaseModel"]) -> None:
+        """Azonos típusú események közzététele kötegelt üzenetekben.
+
+        Az események legfeljebb batch_max_size méretű ZeroMQ üzenetekbe
+        kerülnek (üzenetenként egy send hívás), a fogadó oldal pedig
+        eseményenként továbbítja őket a feliratkozóknak.
 
         Args:
-            event_type: Az esemény típusa, amire feliratkozunk
-            callback: A callback függvény, amely az eseményt fogadja
+            event_type: Az események típusa
+            events: Az esemény objektumok
 
-        Note:
-            A callback-nek aszinkronnak kell lennie (async def)
+        Raises:
+            EventBusError: Ha az EventBus nincs elindítva
+            PublishError: Ha a publisher socket nincs inicializálva, vagy egy
+                esemény nem kódolható
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
+        if not self._running:
+            raise EventBusError("EventBus nincs elindítva")
+
+        if self._publisher is None:
+            raise PublishError("Publisher socket nincs inicializálva")
 
-        self._subscribers[event_type].append(callback)
-        self._logger.info(f"Feliratkozás létrehozva: {event_type}")
+        payloads = [self._encode(event_type, event) for event in events]
+        size = self.config.batch_max_size
+        for start in range(0, len(payloads), size):
+            await self._send(event_type, payloads[start : start + size])
 
-    def unsubscribe(self, event_type: str, callback: EventCallback) -> None:
-        """Leiratkozás eseménytípusról.
+        self._logger.debug(f"{len(payloads)} esemény közzétéve: {event_type}")
 
-        Args:
-            event_type: Az esemény típusa
-            callback: A callback függvény, amelyet eltávolítunk
-        """
-        if event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
-                self._logger.info(f"Leiratkozás: {event_type}")
+    async def flush(self) -> None:
+        """Az automatikus kötegelés pufferében lévő események azonnali elküldése."""
+        buffers, self._batch_buffers = self._batch_buffers, {}
+        for event_type, payloads in buffers.items():
+            if payloads:
+                await self._send(event_type, payloads)
 
-    async def _dispatch_event(self, event_type: str, event_data: dict[str, "Any"]) -> None:
-        """Esemény továbbítása a feliratkozóknak.
+    async def _flush_after(self, delay: float) -> None:
+        """A puffer ürítése a megadott késleltetés után.
 
         Args:
-            event_type: Az esemény típusa
-            event_data: Az esemény adatai
+            delay: A késleltetés másodpercben
         """
-        if event_type not in self._subscribers:
-            return
-
-        # Deserializáljuk az eseményt a megfelelő osztályba
+        await asyncio.sleep(delay)
+        self._flush_task = None
         try:
-            event = self._deserialize_event(event_type, event_data)
-            if event is None:
-                return
-
-            # Hívjuk meg az összes feliratkozó callback-jét
-            for callback in self._subscribers[event_type]:
-                try:
-                    await callback(event)
-                except Exception as e:
-                    self._logger.error(f"Hiba a callback végrehajtásakor: {e}", exc_info=True)
+            await self.flush()
         except Exception as e:
-            self._logger.error(f"Hiba az esemény deserializálásakor: {e}", exc_info=True)
+            self._logger.error(f"Hiba a kötegelt események küldésekor: {e}", exc_info=True)
 
-    def _deserialize_event(
-        self, event_type: str, event_data: dict[str, "Any"]
-    ) -> Optional["BaseModel"]:
-        """Deserializálja az eseményt a megfelelő Pydantic modellbe.
+    def _encode(self, event_type: str, event: "BaseModel") -> bytes:
+        """Esemény kódolása az eseménytípus codec-jével.
 
         Args:
             event_type: Az esemény típusa
-            event_data: Az esemény adatai
+            event: Az esemény objektum
 
         Returns:
-            A deserializált esemény objektum vagy None ha hiba történt
-        """
-        # Importáljuk itt, hogy elkerüljük a körkörös importot
-        from neural_ai.core.events.interfaces.event_models import (
-            MarketDataEvent,
-            OrderEvent,
-            PositionEvent,
-            SignalEvent,
-            SystemLogEvent,
-            TradeEvent,
-        )
-
-        # Távolítsuk el a meta adatokat
-        event_data = {k: v for k, v in event_data.items() if not k.startswith("_")}
+            bytes: A payload
 
+        Raises:
+            PublishError: Ha az esemény nem a típushoz regisztrált modell
+                példánya, vagy nem kódolható
+        """
+        metrics = self._metrics
+        started = time.perf_counter() if metrics is not None else 0.0
         try:
-            if event_type == "market_data":
-                return MarketDataEvent(**event_data)
-            elif event_type == "trade":
-                return TradeEvent(**event_data)
-            elif event_type == "signal":
-                return SignalEvent(**event_data)
-            elif event_type == "system_log":
-                return SystemLogEvent(**event_data)
-            elif event_type == "order":
-                return OrderEvent(**event_data)
-            elif event_type == "position":
-                return PositionEvent(**event_data)
-            else:
-                self._logger.warning(f"Ismeretlen eseménytípus: {event_type}")
-                return None
+            self._registry.check(event_type, event)
+            payload = self._codec_for(event_type).encode(event)
         except Exception as e:
-            self._logger.error(f"Hiba az esemény deserializálásakor: {e}", exc_info=True)
-            return None
+            raise PublishError(f"Az esemény nem kódolható: {e}", event_type=event_type) from e
+
+        if metrics is not None:
+            metrics.observe(ENCODE_SECONDS, event_type, time.perf_counter() - started)
+            metrics.inc(EVENTS_PUBLISHED, event_type)
+        return payload
+
+    async def _send(self, event_type: str, payloads: list[bytes]) -> None:
+        """Egy vagy több kódolt esemény küldése egyetlen ZeroMQ üzenetben.
+
+        Args:
+            event_type: Az események típusa
+            payloads: A kódolt események
+
+        Raises:
+            PublishError: Ha a publisher socket nincs inicializálva
+        """
+        if self._publisher is None:
+            raise PublishError("Publisher socket nincs inicializálva", event_type=event_type)
+
+        header = MessageHeader(
+            codec_id=self._codec_for(event_type).codec_id,
+            flags=FLAG_BATCH if len(payloads) > 1 else 0,
+            published_ns=time.time_ns(),
+        ).pack()
+
+        # Küldjük az eseményeket a megfelelő témakörbe
+        topic = event_type.encode("utf-8")
+        await self._publisher.send_multipart([topic, header, *payloads])
+
+        if self._metrics is not None:
+            self._metrics.inc(MESSAGES_SENT, event_type)
+            self._metrics.inc(BYTES_SENT, event_type, sum(map(len, payloads)))
+
+    def _topic_added(self, event_type: str) -> None:
+        """A futó subscriber socket feliratkoztatása a témakörre.
+
+        Az első callback után hívódik, így a többi eseménytípus el sem jut
+        ehhez a folyamathoz.
+
+        Args:
+            event_type: Az eseménytípus
+        """
+        self._set_topic_subscription(event_type, subscribe=True)
+
+    def _topic_removed(self, event_type: str) -> None:
+        """Az utolsó callback után a socket-szintű szűrés is megszűnik.
+
+        Args:
+            event_type: Az eseménytípus
+        """
+        self._set_topic_subscription(event_type, subscribe=False)
+
+    def _set_topic_subscription(self, event_type: str, subscribe: bool) -> None:
+        """Témakör fel- vagy leiratkozása a futó subscriber socketen.
+
+        A ZeroMQ a szűrést TCP esetén már a publisher oldalon, inproc esetén
+        a socketen végzi, így a nem kért események nem kerülnek dekódolásra.
+
+        Args:
+            event_type: Az eseménytípus (a topic frame tartalma)
+            subscribe: True feliratkozáshoz, False leiratkozáshoz
+        """
+        if self._subscriber_socket is None:
+            return
+        option = self._zmq.SUBSCRIBE if subscribe else self._zmq.UNSUBSCRIBE
+        self._subscriber_socket.setsockopt(option, event_type.encode("utf-8"))
+
+    async def _dispatch_event(self, event_type: str, event: "BaseModel") -> None:
+        """Esemény továbbítása a feliratkozók soraiba.
+
+        A callback-eket a feliratkozók worker task-jai hívják; ez a metódus
+        csak 'block' szabályú, teli sor esetén várakozik (backpressure).
+
+        Args:
+            event_type: Az esemény típusa
+            event: A dekódolt esemény
+        """
+        await self._subscribers.dispatch(event_type, event)
 
     async def run_forever(self) -> None:
         """Eseménybusz örök futás (blokkoló).
@@ -274,15 +405,20 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
         # Subscriber socket létrehozása
         subscriber = self._context.socket(self._zmq.SUB)
 
-        if self.config.use_inproc:
+        if self.config.broker_mode:
+            sub_url = f"tcp://{self.config.broker_host}:{self.config.sub_port}"
+        elif self.config.use_inproc:
             sub_url = "inproc://eventbus_pub"
         else:
             sub_url = f"tcp://localhost:{self.config.pub_port}"
 
         subscriber.connect(sub_url)
 
-        # Feliratkozás az összes témakörre
-        subscriber.setsockopt(self._zmq.SUBSCRIBE, b"")
+        # Csak azokra a témakörökre iratkozunk fel, amelyekhez van callback;
+        # a későbbi subscribe()/unsubscribe() hívások ezt dinamikusan frissítik
+        self._subscriber_socket = subscriber
+        for event_type in self._subscribers:
+            self._set_topic_subscription(event_type, subscribe=True)
 
         self._logger.info(f"Subscriber csatlakozva: {sub_url}")
 
@@ -292,18 +428,7 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
                     # Várjunk egy eseményre (non-blocking)
                     msg = await asyncio.wait_for(subscriber.recv_multipart(), timeout=1.0)
 
-                    if len(msg) >= 2:
-                        topic = msg[0].decode("utf-8")
-                        message = msg[1].decode("utf-8")
-
-                        # Deserializáljuk az üzenetet
-                        event_data = json.loads(message)
-
-                        # Távolítsuk el a témakört az event_data-ból
-                        event_type = event_data.pop("_event_type", topic)
-
-                        # Továbbítjuk az eseményt
-                        await self._dispatch_event(event_type, event_data)
+                    await self._handle_message(msg)
 
                 except TimeoutError:
                     # Időtúllépés, ellenőrizzük a futási állapotot
@@ -312,29 +437,74 @@ class EventBus(EventBusInterface, metaclass=SingletonMeta):
                     self._logger.error(f"Hiba az esemény fogadásakor: {e}", exc_info=True)
 
         finally:
+            self._subscriber_socket = None
             subscriber.close()
             self._logger.info("Subscriber lezárva")
 
-    async def __aenter__(self) -> "EventBus":
-        """Aszinkron context manager.
-
-        Returns:
-            Az EventBus példány
-        """
-        await self.start()
-        return self
+    async def _handle_message(self, frames: list[bytes]) -> None:
+        """Egy fogadott ZeroMQ üzenet dekódolása és továbbítása.
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: Any | None,
-    ) -> None:
-        """Aszinkron context manager lezárás.
+        Kötegelt üzenet esetén minden payload frame külön eseményként kerül
+        továbbításra, a küldési sorrendben.
 
         Args:
-            exc_type: A kivétel típusa (ha volt kivétel)
-            exc_val: A kivétel objektum (ha volt kivétel)
-            exc_tb: A traceback objektum (ha volt kivétel)
+            frames: Az üzenet frame-jei ([topic, header, payload, ...], vagy a
+                régi kétframe-es JSON formátum)
         """
-        await self.stop()
+        if len(frames) >= 3:
+            event_type = frames[0].decode("utf-8")
+            # A ZeroMQ prefix alapján szűr (pl. 'order' -> 'order_book'), ezért
+            # a pontos egyezést még a dekódolás előtt ellenőrizzük
+            if event_type not in self._subscribers:
+                return
+            if event_type not in self._registry:
+                self._logger.warning(f"Ismeretlen eseménytípus: {event_type}")
+                return
+            header = MessageHeader.unpack(frames[1])
+            codec = self._codecs.get(header.codec_id)
+            if codec is None:
+                self._logger.error(
+                    f"Ismeretlen codec azonosító ({header.codec_id}) a(z) {event_type} eseményben"
+                )
+                return
+            metrics = self._metrics
+            if metrics is not None:
+                metrics.inc(MESSAGES_RECEIVED, event_type)
+            for payload in frames[2:]:
+                # Egy hibás payload nem veszi el a köteg többi eseményét
+                started = time.perf_counter() if metrics is not None else 0.0
+                try:
+                    event = codec.decode_event(event_type, payload, self._registry, self._trusted)
+                except Exception as e:
+                    if metrics is not None:
+                        metrics.inc(DECODE_ERRORS, event_type)
+                    self._logger.error(f"Hiba a(z) {event_type} esemény dekódolásakor: {e}")
+                    if self._dead_letters is not None:
+                        self._dead_letters.capture_decode_failure(
+                            event_type, header.codec_id, payload, e
+                        )
+                    continue
+                if metrics is not None:
+                    metrics.observe(DECODE_SECONDS, event_type, time.perf_counter() - started)
+                    metrics.inc(EVENTS_RECEIVED, event_type)
+                    metrics.inc(BYTES_RECEIVED, event_type, len(payload))
+                await self._dispatch_event(event_type, event)
+        elif len(frames) == 2:
+            # Régi formátum: JSON, metaadatokkal a törzsben
+            event_data = json.loads(frames[1])
+            event_type = event_data.pop("_event_type", frames[0].decode("utf-8"))
+            if event_type not in self._subscribers:
+                return
+            event_data = {k: v for k, v in event_data.items() if not k.startswith("_")}
+            try:
+                event = self._registry.validate(event_type, event_data)
+            except Exception as e:
+                self._logger.error(f"Hiba a(z) {event_type} esemény dekódolásakor: {e}")
+                if self._dead_letters is not None:
+                    self._dead_letters.capture_decode_failure(
+                        event_type, LEGACY_CODEC_ID, frames[1], e
+                    )
+                return
+            await self._dispatch_event(event_type, event)
+        else:
+            self._logger.warning(f"Érvénytelen üzenet: {len(frames)} frame")
@@ -8,8 +8,8 @@ Version: 1.0.0
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -26,14 +26,62 @@ class EventBusConfig:
 
     Attributes:
         zmq_context: ZeroMQ kontextus (opcionális, létrejön ha nincs megadva)
-        pub_port: Publisher port (alapértelmezett: 5555)
-        sub_port: Subscriber port (alapértelmezett: 5556)
-        use_inproc: Használjon inproc transportot teszteléshez (alapértelmezett: False)
+        pub_port: Publisher port (alapértelmezett: 5555); broker módban a broker
+            XSUB végpontja, ahová a publisher-ek csatlakoznak
+        sub_port: Subscriber port (alapértelmezett: 5556); broker módban a broker
+            XPUB végpontja, ahová a subscriber-ek csatlakoznak
+        use_inproc: Egy folyamaton belüli busz (alapértelmezett: False). Nem
+            transportot választ: az EventBusFactory ilyenkor a ZeroMQ-s EventBus
+            helyett az InProcessEventBus-t hozza létre, amely az eseményeket
+            objektumként, kódolás és ZeroMQ nélkül adja át; korábban ez a
+            ZeroMQ-s EventBus inproc:// transportját jelentette. A ZeroMQ-s
+            EventBus csak más folyamatban futó feliratkozóhoz kell; közvetlenül
+            példányosítva use_inproc mellett továbbra is inproc:// socketet használ.
+        codec: Az események alapértelmezett codec-je ('json', 'msgpack')
+        codec_overrides: Eseménytípusonkénti codec (pl. {'market_data': 'binary'})
+        batch_max_size: Egy kötegelt üzenet maximális eseményszáma
+        batch_max_delay: Automatikus kötegelésnél a késleltetés felső korlátja
+            másodpercben (None = nincs automatikus kötegelés)
+        subscriber_queue_size: Feliratkozónkénti sor kapacitása (alapértelmezett)
+        overflow_policy: Teli sor kezelése ('block', 'drop_oldest', 'conflate')
+        broker_mode: Csatlakozás egy közös XPUB/XSUB brokerhez saját PUB socket
+            bind-olása helyett (több publisher folyamat egy buszon)
+        broker_host: A broker címe broker módban
+        metrics_enabled: Számlálók és hisztogramok vezetése (get_metrics())
+        metrics_port: Prometheus szöveges végpont portja (None = nincs végpont)
+        metrics_host: A Prometheus végpont címe
+        trusted_producers: A fogadott események validáció nélküli létrehozása
+            (model_construct); csak saját, validált producerek esetén
+        dead_letter_enabled: A callback-ben hibát okozó és a nem dekódolható
+            események mentése (dead-letter sor)
+        dead_letter_sink: A dead-letter tároló ('database' vagy 'file')
+        dead_letter_path: A JSON Lines fájl útvonala 'file' tárolónál
+        dead_letter_buffer_size: A mentésre váró bejegyzések pufferének kapacitása
+        dead_letter_batch_size: Egy mentési köteg maximális mérete
+        dead_letter_flush_interval: A dead-letter mentések közötti idő másodpercben
     """
     zmq_context: Any = None
     pub_port: int = 5555
     sub_port: int = 5556
     use_inproc: bool = False
+    codec: str = "json"
+    codec_overrides: dict[str, str] = field(default_factory=dict)
+    batch_max_size: int = 1000
+    batch_max_delay: float | None = None
+    subscriber_queue_size: int = 10000
+    overflow_policy: str = "block"
+    trusted_producers: bool = False
+    broker_mode: bool = False
+    broker_host: str = "127.0.0.1"
+    metrics_enabled: bool = True
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+    dead_letter_enabled: bool = False
+    dead_letter_sink: str = "database"
+    dead_letter_path: str = "logs/dead_letters.jsonl"
+    dead_letter_buffer_size: int = 10000
+    dead_letter_batch_size: int = 500
+    dead_letter_flush_interval: float = 1.0
 
 
 class EventBusInterface(ABC):
@@ -44,6 +92,9 @@ class EventBusInterface(ABC):
     - Feliratkozás eseményekre
     - Leiratkozás eseményekről
     - Bus indítása és leállítása
+
+    A feliratkozási, metrika és dead-letter felületet az implementációk a
+    közös BaseEventBus osztályból kapják (implementations/base_bus.py).
     """
 
     @property
@@ -80,6 +131,30 @@ class EventBusInterface(ABC):
         """
         pass
 
+    async def publish_many(self, event_type: str, events: "Sequence[BaseModel]") -> None:
+        """Azonos típusú események közzététele egy hívással.
+
+        Az alapértelmezett implementáció egyenként hívja a publish()-t; az
+        implementációk ezt kötegelt küldéssel helyettesíthetik.
+
+        Args:
+            event_type: Az események típusa
+            events: Az esemény objektumok
+
+        Raises:
+            EventBusError: Ha az EventBus nincs elindítva
+            PublishError: Ha a közzététel sikertelen
+        """
+        for event in events:
+            await self.publish(event_type, event)
+
+    async def flush(self) -> None:
+        """A pufferelt események azonnali elküldése.
+
+        Az alapértelmezett implementáció nem pufferel, így nincs teendője; a
+        kötegelő implementációk (pl. batch_max_delay) felülírják.
+        """
+
     @abstractmethod
     def subscribe(self, event_type: str, callback: EventCallback) -> None:
         """Feliratkozás eseménytípusra.
@@ -6,7 +6,7 @@ használják a hatékony adattároláshoz és támogatják a chunkolást és
 aszinkron műveleteket.
 """
 
-from neural_ai.core.storage.backends.base import DataFrameType, StorageBackend
+from neural_ai.core.storage.backends.base import DataFrameType, StorageBackend, normalize_filters
 from neural_ai.core.storage.backends.pandas_backend import PandasBackend
 from neural_ai.core.storage.backends.polars_backend import PolarsBackend
 
@@ -15,4 +15,5 @@ __all__ = [
     "StorageBackend",
     "PandasBackend",
     "PolarsBackend",
+    "normalize_filters",
 ]
@@ -4,13 +4,108 @@ Ez a modul tartalmazza a tárolási backend-ek absztrakt alaposztályát,
 amely definiálja a kötelező interfészt minden tárolási implementációhoz.
 """
 
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from typing import Any, TypeAlias
 
 if __name__ == "__main__":
     raise RuntimeError("Ez a modul nem futtatható közvetlenül.")
 
 
+def _to_datetime(value: Any) -> Any:
+    """Időbélyeg statisztika datetime-ra alakítása.
+
+    Args:
+        value: pandas.Timestamp, numpy.datetime64 vagy más érték
+
+    Returns:
+        datetime (a datetime és más típusú érték változatlanul)
+    """
+    if hasattr(value, "to_pydatetime"):
+        return value.to_pydatetime()
+    if getattr(getattr(value, "dtype", None), "kind", None) == "M":
+        # A numpy csak mikroszekundumos felbontásnál ad vissza datetime-ot
+        return value.astype("datetime64[us]").item()
+    return value
+
+
+class FooterCache:
+    """Kis méretű LRU cache a feldolgozott Parquet footer metaadatok számára.
+
+    A kulcs a fájl abszolút útvonala, módosítási ideje (nanoszekundumban) és
+    mérete, így a fájl felülírása után a régi bejegyzés automatikusan
+    érvénytelenné válik. A cache szálbiztos, mert a backend-eket executor
+    szálakból is hívjuk.
+
+    Attribútumok:
+        max_entries: A tárolt footer-ek maximális száma
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Inicializálja a FooterCache példányt.
+
+        Args:
+            max_entries: A tárolt footer-ek maximális száma
+        """
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self, path: str, stat: os.stat_result, loader: Callable[[str], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Visszaadja a cache-elt footer-t, vagy betölti a loader segítségével.
+
+        Args:
+            path: A Parquet fájl elérési útja
+            stat: A fájl már lekérdezett stat eredménye
+            loader: Függvény, amely a footer-t feldolgozza és dictionary-ként adja vissza
+
+        Returns:
+            A feldolgozott footer metaadatok
+        """
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        footer = loader(path)
+
+        with self._lock:
+            self._entries[key] = footer
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return footer
+
+    def invalidate(self, path: str) -> None:
+        """Eltávolítja az adott fájlhoz tartozó összes bejegyzést.
+
+        Args:
+            path: A Parquet fájl elérési útja
+        """
+        abs_path = os.path.abspath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == abs_path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Kiüríti a cache-t."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """A cache-elt footer-ek száma."""
+        return len(self._entries)
+
+
 class StorageBackend(ABC):
     """Absztrakt alaposztály a tárolási backend-ek számára.
 
@@ -40,6 +135,7 @@ class StorageBackend(ABC):
         self.name: str = name
         self.supported_formats: list[str] = supported_formats
         self.is_async: bool = is_async
+        self._footer_cache = FooterCache()
 
     @abstractmethod
     def write(self, data: Any, path: str, **kwargs: dict[str, Any]) -> None:
@@ -69,7 +165,9 @@ class StorageBackend(ABC):
             **kwargs: További konfigurációs paraméterek
                 - columns: Csak ezen oszlopok betöltése
                 - filters: Szűrők a partíciókra (pl. [('year', '=', 2023)])
-                - chunk_size: Chunk méret chunkolás esetén
+                - chunk_size: Chunk méret chunkolás esetén (a teljes eredmény
+                  ilyenkor is a memóriába kerül; folyamatos feldolgozáshoz
+                  az iter_batches() használandó)
 
         Returns:
             A beolvasott DataFrame
@@ -81,6 +179,37 @@ class StorageBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_batches(
+        self,
+        path: str,
+        batch_size: int = 65536,
+        columns: list[str] | None = None,
+        filters: list | None = None,
+    ) -> Iterator[Any]:
+        """DataFrame batch-ek folyamatos olvasása a megadott elérési útról.
+
+        A read() metódussal ellentétben az implementációknak valódi generátort
+        kell visszaadniuk: egyszerre legfeljebb néhány batch lehet a memóriában,
+        így a memóriánál nagyobb fájlok is feldolgozhatók.
+
+        Args:
+            path: A forrás elérési út
+            batch_size: Egy batch maximális mérete sorokban
+            columns: Csak ezen oszlopok betöltése
+            filters: PyArrow DNF szűrők (pl. [('year', '=', 2023)]); soronként
+                érvényesülnek, a batch-ekben csak a feltételnek megfelelő sorok vannak
+
+        Returns:
+            Iterátor, amely sorban adja vissza a DataFrame batch-eket
+
+        Raises:
+            FileNotFoundError: Ha a forrásfájl nem létezik
+            ValueError: Ha a batch méret nem pozitív
+            RuntimeError: Ha az olvasási művelet sikertelen (iteráció közben)
+        """
+        pass
+
     @abstractmethod
     def append(self, data: Any, path: str, **kwargs: dict[str, Any]) -> None:
         """DataFrame adatok hozzáfűzése egy meglévő fájlhoz.
@@ -121,6 +250,10 @@ class StorageBackend(ABC):
         Args:
             path: Az elérési út
 
+        Az implementációknak kizárólag a fájl footer metaadataira kell
+        támaszkodniuk (adatot nem dekódolhatnak), és a feldolgozott footer-t
+        a ``_footer_cache``-ben kell tárolniuk.
+
         Returns:
             A fájl információit tartalmazó dictionary:
                 - size: Fájlméret bájtban
@@ -129,12 +262,59 @@ class StorageBackend(ABC):
                 - format: Fájlformátum
                 - created: Létrehozás dátuma
                 - modified: Módosítás dátuma
+                - num_row_groups: Row group-ok száma
+                - compression: Tömörítési algoritmus
+                - row_groups: Row group-onkénti sorszám és oszlopstatisztikák
+                  (min, max, null_count)
+                - timestamp_min: A 'timestamp' oszlop minimuma (ha elérhető)
+                - timestamp_max: A 'timestamp' oszlop maximuma (ha elérhető)
 
         Raises:
             FileNotFoundError: Ha a fájl nem létezik
         """
         pass
 
+    def clear_footer_cache(self) -> None:
+        """Kiüríti a feldolgozott Parquet footer-ek cache-ét."""
+        self._footer_cache.clear()
+
+    def invalidate_footer(self, path: str) -> None:
+        """Egy fájl footer-ének eltávolítása a cache-ből.
+
+        A backend-en kívül (pl. közvetlen pyarrow írással) felülírt fájlok
+        után kell hívni.
+
+        Args:
+            path: A fájl elérési útja
+        """
+        self._footer_cache.invalidate(path)
+
+    @staticmethod
+    def _summarize_timestamp(row_groups: list[dict[str, Any]]) -> tuple[Any, Any]:
+        """A 'timestamp' oszlop min/max értékének összesítése row group statisztikákból.
+
+        A backend-enként eltérő típusú értékek (pl. numpy.datetime64) datetime-ra
+        alakulnak, így a get_info() eredménye backend-től független.
+
+        Args:
+            row_groups: Row group-onkénti statisztikák listája
+
+        Returns:
+            (minimum, maximum) tuple; None, ha valamelyik row group-ból hiányzik a statisztika
+        """
+        minimums = []
+        maximums = []
+        for row_group in row_groups:
+            stats = row_group["statistics"].get("timestamp")
+            if stats is None or stats.get("min") is None or stats.get("max") is None:
+                return None, None
+            minimums.append(stats["min"])
+            maximums.append(stats["max"])
+
+        if not minimums:
+            return None, None
+        return _to_datetime(min(minimums)), _to_datetime(max(maximums))
+
     def validate_data(self, data: Any) -> bool:
         """DataFrame érvényességének ellenőrzése.
 
@@ -178,3 +358,17 @@ class StorageBackend(ABC):
 
 # DataFrameType alias a támogatott DataFrame típusokhoz
 DataFrameType: TypeAlias = Any
+
+
+def normalize_filters(filters: list) -> list[list[tuple[str, str, Any]]]:
+    """Szűrők DNF (VAGY-lista ÉS-listákból) alakra hozása.
+
+    Args:
+        filters: Egyszerű ([(col, op, val)]) vagy DNF ([[(col, op, val)]]) szűrők
+
+    Returns:
+        A szűrők DNF alakban
+    """
+    if filters and isinstance(filters[0], tuple):
+        return [list(filters)]
+    return [list(conjunction) for conjunction in filters]
@@ -5,7 +5,9 @@ amely a FastParquet-et használja a DataFrame-ek tárolásához.
 A modul lazy importot használ a pandas és fastparquet csomagok számára.
 """
 
+import copy
 import os
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -133,6 +135,9 @@ class PandasBackend(StorageBackend):
                     path, pd_df, compression=compression, write_index=index
                 )
 
+            # A régi footer már nem érvényes
+            self._footer_cache.invalidate(path)
+
         except Exception as e:
             raise RuntimeError(f"A tárolási művelet sikertelen: {str(e)}") from e
 
@@ -212,19 +217,7 @@ class PandasBackend(StorageBackend):
         Returns:
             Az összes chunkból összefűzött DataFrame
         """
-        self._ensure_initialized()
-
-        # FastParquet segítségével chunkolás
-        parquet_file = self._pandas_wrapper.fp.ParquetFile(path)
-
-        chunks = []
-        for chunk in parquet_file.iter_row_groups():
-            df_chunk = chunk.to_pandas(columns=columns, filters=filters)
-            chunks.append(df_chunk)
-
-            # Ha elértük a kívánt chunk méretet, álljunk le
-            if len(df_chunk) >= chunk_size:
-                break
+        chunks = list(self.iter_batches(path, chunk_size, columns, filters))
 
         # Összefűzés
         if chunks:
@@ -232,6 +225,86 @@ class PandasBackend(StorageBackend):
         else:
             return self._pandas_wrapper.pd.DataFrame()
 
+    def iter_batches(
+        self,
+        path: str,
+        batch_size: int = 65536,
+        columns: list[str] | None = None,
+        filters: list | None = None,
+    ) -> Iterator[Any]:
+        """Pandas DataFrame batch-ek folyamatos olvasása Parquet fájlból.
+
+        A FastParquet row group-onként dekódol, ezért a generátor a row
+        group-okat batch_size méretű szeletekre bontja, illetve a kisebb
+        row group-okat összevonja. Egyszerre legfeljebb egy row group és
+        egy batch van a memóriában. A szűrők a statisztikák alapján kihagyják
+        a row group-okat, a megmaradtakban pedig soronként érvényesülnek.
+
+        Args:
+            path: A forrás elérési út
+            batch_size: Egy batch maximális mérete sorokban
+            columns: Csak ezen oszlopok betöltése
+            filters: Sor szintű szűrők (pl. [('year', '=', 2023)])
+
+        Returns:
+            Iterátor Pandas DataFrame batch-ekkel
+
+        Raises:
+            FileNotFoundError: Ha a forrásfájl nem létezik
+            ValueError: Ha a batch méret nem pozitív
+            RuntimeError: Ha az olvasási művelet sikertelen (iteráció közben)
+        """
+        self._ensure_initialized()
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"A forrásfájl nem található: {path}")
+        if batch_size <= 0:
+            raise ValueError("A batch méretnek pozitívnak kell lennie")
+
+        return self._generate_batches(path, batch_size, columns, filters)
+
+    def _generate_batches(
+        self, path: str, batch_size: int, columns: list | None, filters: list | None
+    ) -> Iterator[Any]:
+        """Az iter_batches() generátor törzse.
+
+        Args:
+            path: A forrás elérési út
+            batch_size: Egy batch maximális mérete sorokban
+            columns: Csak ezen oszlopok betöltése
+            filters: Sor szintű szűrők
+
+        Yields:
+            Pandas DataFrame batch-ek
+        """
+        pd = self._pandas_wrapper.pd
+        pending: list[Any] = []
+        pending_rows = 0
+
+        try:
+            parquet_file = self._pandas_wrapper.fp.ParquetFile(path)
+
+            row_groups = parquet_file.iter_row_groups(
+                columns=columns, filters=filters, row_filter=bool(filters)
+            )
+            for row_group in row_groups:
+                offset = 0
+                while offset < len(row_group):
+                    take = min(batch_size - pending_rows, len(row_group) - offset)
+                    pending.append(row_group.iloc[offset : offset + take])
+                    pending_rows += take
+                    offset += take
+
+                    if pending_rows == batch_size:
+                        yield pd.concat(pending, ignore_index=True)
+                        pending = []
+                        pending_rows = 0
+
+            if pending:
+                yield pd.concat(pending, ignore_index=True)
+        except Exception as e:
+            raise RuntimeError(f"Az olvasási művelet sikertelen: {str(e)}") from e
+
     def append(self, data: Any, path: str, **kwargs: dict[str, Any]) -> None:
         """DataFrame adatok hozzáfűzése egy meglévő Parquet fájlhoz.
 
@@ -345,25 +418,87 @@ class PandasBackend(StorageBackend):
             # Fájl statisztikák
             stat = os.stat(path)
 
-            # FastParquet fájl információk
-            parquet_file = self._pandas_wrapper.fp.ParquetFile(path)
-            metadata = parquet_file.info
-
-            # DataFrame betöltése a sorok számának lekérdezéséhez
-            df_sample = parquet_file.to_pandas()
+            # Footer metaadatok (cache-elve útvonal + mtime alapján)
+            footer = self._footer_cache.get_or_load(path, stat, self._load_footer)
 
             return {
                 "size": stat.st_size,
-                "rows": len(df_sample),
-                "columns": list(df_sample.columns),
                 "format": "parquet",
                 "created": datetime.fromtimestamp(stat.st_ctime),
                 "modified": datetime.fromtimestamp(stat.st_mtime),
-                "num_row_groups": len(parquet_file.row_groups),
-                "compression": metadata.get("compression", "unknown"),
+                **footer,
+                # A cache-elt footer nem módosulhat a hívón keresztül
+                "row_groups": copy.deepcopy(footer["row_groups"]),
             }
 
         except FileNotFoundError:
             raise
         except Exception as e:
             raise RuntimeError(f"Az információ lekérdezése sikertelen: {str(e)}") from e
+
+    def _load_footer(self, path: str) -> dict[str, Any]:
+        """Parquet footer feldolgozása adat dekódolás nélkül.
+
+        A FastParquet ParquetFile konstruktora csak a footer-t olvassa be,
+        a sorok száma és a statisztikák a metaadatokból származnak.
+
+        Args:
+            path: A Parquet fájl elérési útja
+
+        Returns:
+            A footer-ből kinyert információk (sorok, oszlopok, row group statisztikák)
+        """
+        parquet_file = self._pandas_wrapper.fp.ParquetFile(path)
+        stats = parquet_file.statistics
+        minimums = stats.get("min", {})
+        maximums = stats.get("max", {})
+        null_counts = stats.get("null_count", {})
+        missing = [None] * len(parquet_file.row_groups)
+
+        row_groups: list[dict[str, Any]] = []
+        for rg_index, row_group in enumerate(parquet_file.row_groups):
+            statistics: dict[str, dict[str, Any]] = {}
+            for column in parquet_file.columns:
+                if column not in minimums and column not in null_counts:
+                    continue
+                statistics[column] = {
+                    "min": minimums.get(column, missing)[rg_index],
+                    "max": maximums.get(column, missing)[rg_index],
+                    "null_count": null_counts.get(column, missing)[rg_index],
+                }
+            row_groups.append(
+                {
+                    "num_rows": row_group.num_rows,
+                    "total_byte_size": row_group.total_byte_size,
+                    "statistics": statistics,
+                }
+            )
+
+        timestamp_min, timestamp_max = self._summarize_timestamp(row_groups)
+
+        return {
+            "rows": parquet_file.count(),
+            "columns": list(parquet_file.columns),
+            "num_row_groups": len(parquet_file.row_groups),
+            "compression": self._get_compression(parquet_file),
+            "row_groups": row_groups,
+            "timestamp_min": timestamp_min,
+            "timestamp_max": timestamp_max,
+        }
+
+    def _get_compression(self, parquet_file: Any) -> str:
+        """Az első oszlop chunk tömörítési algoritmusának neve.
+
+        Args:
+            parquet_file: A megnyitott FastParquet ParquetFile
+
+        Returns:
+            A tömörítés neve, vagy 'unknown', ha nem állapítható meg
+        """
+        try:
+            codec = parquet_file.row_groups[0].columns[0].meta_data.codec
+            codecs = self._pandas_wrapper.fp.parquet_thrift.CompressionCodec
+            names = {value: name for name, value in vars(codecs).items() if isinstance(value, int)}
+            return names.get(codec, "unknown")
+        except Exception:
+            return "unknown"
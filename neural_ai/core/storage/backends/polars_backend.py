@@ -5,12 +5,14 @@ amely a Parquet formátumot használja a DataFrame-ek tárolásához.
 A modul lazy importot használ a polars és pyarrow csomagok számára.
 """
 
+import copy
 import os
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from neural_ai.core.storage.backends.base import StorageBackend
+from neural_ai.core.storage.backends.base import StorageBackend, normalize_filters
 
 if __name__ == "__main__":
     raise RuntimeError("Ez a modul nem futtatható közvetlenül.")
@@ -151,6 +153,9 @@ class PolarsBackend(StorageBackend):
             else:
                 pl_df.write_parquet(path, compression=compression)
 
+            # A régi footer már nem érvényes
+            self._footer_cache.invalidate(path)
+
         except Exception as e:
             raise RuntimeError(f"A tárolási művelet sikertelen: {str(e)}") from e
 
@@ -215,16 +220,7 @@ class PolarsBackend(StorageBackend):
         Returns:
             Az összes chunkból összefűzött DataFrame
         """
-        self._ensure_initialized()
-
-        # PyArrow segítségével chunkolás
-        parquet_file = self._polars_wrapper.pq.ParquetFile(path)
-
-        chunks = []
-        for batch in parquet_file.iter_batches(
-            batch_size=chunk_size, columns=columns, filters=filters
-        ):
-            chunks.append(self._polars_wrapper.pl.from_arrow(batch))
+        chunks = list(self.iter_batches(path, chunk_size, columns, filters))
 
         # Összefűzés
         if chunks:
@@ -232,6 +228,96 @@ class PolarsBackend(StorageBackend):
         else:
             return self._polars_wrapper.pl.DataFrame()
 
+    def iter_batches(
+        self,
+        path: str,
+        batch_size: int = 65536,
+        columns: list[str] | None = None,
+        filters: list | None = None,
+    ) -> Iterator[Any]:
+        """Polars DataFrame batch-ek folyamatos olvasása Parquet fájlból.
+
+        A PyArrow ParquetFile.iter_batches() generátorára épül, így egyszerre
+        csak egy batch dekódolt adata van a memóriában. A szűrők sorszinten,
+        batch-enként kerülnek alkalmazásra.
+
+        Args:
+            path: A forrás elérési út
+            batch_size: Egy batch maximális mérete sorokban
+            columns: Csak ezen oszlopok betöltése
+            filters: PyArrow DNF szűrők (pl. [('bid', '>', 1.1)])
+
+        Returns:
+            Iterátor Polars DataFrame batch-ekkel
+
+        Raises:
+            FileNotFoundError: Ha a forrásfájl nem létezik
+            ValueError: Ha a batch méret nem pozitív
+            RuntimeError: Ha az olvasási művelet sikertelen (iteráció közben)
+        """
+        self._ensure_initialized()
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"A forrásfájl nem található: {path}")
+        if batch_size <= 0:
+            raise ValueError("A batch méretnek pozitívnak kell lennie")
+
+        return self._generate_batches(path, batch_size, columns, filters)
+
+    def _generate_batches(
+        self, path: str, batch_size: int, columns: list | None, filters: list | None
+    ) -> Iterator[Any]:
+        """Az iter_batches() generátor törzse.
+
+        Args:
+            path: A forrás elérési út
+            batch_size: Egy batch maximális mérete sorokban
+            columns: Csak ezen oszlopok betöltése
+            filters: PyArrow DNF szűrők
+
+        Yields:
+            Polars DataFrame batch-ek
+        """
+        pl = self._polars_wrapper.pl
+        pa = self._polars_wrapper.pa
+
+        pq = self._polars_wrapper.pq
+
+        try:
+            parquet_file = pq.ParquetFile(path)
+            expression = pq.filters_to_expression(filters) if filters else None
+        except Exception as e:
+            raise RuntimeError(f"Az olvasási művelet sikertelen: {str(e)}") from e
+
+        # A szűrésben szereplő oszlopokat is be kell olvasni, a végén eldobjuk őket
+        read_columns = columns
+        if columns is not None and filters:
+            filter_columns = {
+                name
+                for conjunction in normalize_filters(filters)
+                for name, _, _ in conjunction
+            }
+            read_columns = list(columns) + sorted(filter_columns - set(columns))
+        drop_filter_columns = read_columns != columns
+
+        try:
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=read_columns):
+                if expression is None:
+                    yield pl.from_arrow(batch)
+                    continue
+
+                table = pa.Table.from_batches([batch]).filter(expression)
+                if table.num_rows == 0:
+                    continue
+                if drop_filter_columns:
+                    table = table.select(columns)
+                yield pl.from_arrow(table)
+        except Exception as e:
+            raise RuntimeError(f"Az olvasási művelet sikertelen: {str(e)}") from e
+        finally:
+            # A fájl lezárása korai generátor-leállítás esetén is
+            parquet_file.close()
+
     def append(self, data: Any, path: str, **kwargs: dict[str, Any]) -> None:
         """DataFrame adatok hozzáfűzése egy meglévő Parquet fájlhoz.
 
@@ -357,22 +443,69 @@ class PolarsBackend(StorageBackend):
             # Fájl statisztikák
             stat = os.stat(path)
 
-            # Parquet fájl információk
-            parquet_file = self._polars_wrapper.pq.ParquetFile(path)
-            metadata = parquet_file.metadata
+            # Footer metaadatok (cache-elve útvonal + mtime alapján)
+            footer = self._footer_cache.get_or_load(path, stat, self._load_footer)
 
             return {
                 "size": stat.st_size,
-                "rows": metadata.num_rows,
-                "columns": list(metadata.schema.names),
                 "format": "parquet",
                 "created": datetime.fromtimestamp(stat.st_ctime),
                 "modified": datetime.fromtimestamp(stat.st_mtime),
-                "num_row_groups": metadata.num_row_groups,
-                "compression": metadata.row_group(0).column(0).compression,
+                **footer,
+                # A cache-elt footer nem módosulhat a hívón keresztül
+                "row_groups": copy.deepcopy(footer["row_groups"]),
             }
 
         except FileNotFoundError:
             raise
         except Exception as e:
             raise RuntimeError(f"Az információ lekérdezése sikertelen: {str(e)}") from e
+
+    def _load_footer(self, path: str) -> dict[str, Any]:
+        """Parquet footer feldolgozása adat dekódolás nélkül.
+
+        Args:
+            path: A Parquet fájl elérési útja
+
+        Returns:
+            A footer-ből kinyert információk (sorok, oszlopok, row group statisztikák)
+        """
+        metadata = self._polars_wrapper.pq.read_metadata(path)
+
+        row_groups: list[dict[str, Any]] = []
+        for rg_index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg_index)
+            statistics: dict[str, dict[str, Any]] = {}
+            for col_index in range(row_group.num_columns):
+                column = row_group.column(col_index)
+                stats = column.statistics
+                if stats is None:
+                    continue
+                statistics[column.path_in_schema] = {
+                    "min": stats.min if stats.has_min_max else None,
+                    "max": stats.max if stats.has_min_max else None,
+                    "null_count": stats.null_count if stats.has_null_count else None,
+                }
+            row_groups.append(
+                {
+                    "num_rows": row_group.num_rows,
+                    "total_byte_size": row_group.total_byte_size,
+                    "statistics": statistics,
+                }
+            )
+
+        compression = "unknown"
+        if metadata.num_row_groups > 0 and metadata.row_group(0).num_columns > 0:
+            compression = metadata.row_group(0).column(0).compression
+
+        timestamp_min, timestamp_max = self._summarize_timestamp(row_groups)
+
+        return {
+            "rows": metadata.num_rows,
+            "columns": list(metadata.schema.names),
+            "num_row_groups": metadata.num_row_groups,
+            "compression": compression,
+            "row_groups": row_groups,
+            "timestamp_min": timestamp_min,
+            "timestamp_max": timestamp_max,
+        }
@@ -9,6 +9,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from neural_ai.core.storage.exceptions import StorageError
+from neural_ai.core.storage.implementations.content_addressed_storage import (
+    ContentAddressedStorage,
+)
 from neural_ai.core.storage.implementations.file_storage import FileStorage
 from neural_ai.core.storage.interfaces.factory_interface import StorageFactoryInterface
 from neural_ai.core.storage.interfaces.storage_interface import StorageInterface
@@ -27,6 +30,7 @@ class StorageFactory(StorageFactoryInterface):
 
     _storage_types: dict[str, type[StorageInterface]] = {
         "file": FileStorage,
+        "cas": ContentAddressedStorage,
     }
 
     @classmethod
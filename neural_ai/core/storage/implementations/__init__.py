@@ -1,9 +1,29 @@
 """Storage komponens implementációk."""
 
-from neural_ai.core.storage.implementations.file_storage import FileStorage
+from neural_ai.core.storage.implementations.bi5_decoder import Bi5Importer, Bi5ImportStats
+from neural_ai.core.storage.implementations.content_addressed_storage import (
+    ContentAddressedStorage,
+)
+from neural_ai.core.storage.implementations.directory_index import (
+    DirEntryInfo,
+    DirListingPage,
+)
+from neural_ai.core.storage.implementations.file_storage import BatchItemResult, FileStorage
 from neural_ai.core.storage.implementations.parquet_storage import ParquetStorageService
+from neural_ai.core.storage.implementations.tick_csv_importer import (
+    TickCsvImporter,
+    TickImportStats,
+)
 
 __all__ = [
+    "Bi5Importer",
+    "Bi5ImportStats",
+    "BatchItemResult",
+    "ContentAddressedStorage",
+    "DirEntryInfo",
+    "DirListingPage",
     "FileStorage",
     "ParquetStorageService",
+    "TickCsvImporter",
+    "TickImportStats",
 ]
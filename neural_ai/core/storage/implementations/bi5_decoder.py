@@ -0,0 +1,400 @@
+"""Dukascopy .bi5 tick fájlok vektorizált dekódolása és betöltése a tick tárba.
+
+A modulban található:
+    - BI5_RECORD_DTYPE: A kitömörített .bi5 rekordok big-endian strukturált dtype-ja
+    - TICK_RECORD_DTYPE: A dekódolt tickek belső (natív byte-sorrendű) dtype-ja
+    - get_point_value: Az árak pont -> ár váltószáma szimbólum alapján
+    - hour_from_path: Az óra kezdete a Dukascopy könyvtárszerkezetből
+    - decode_bi5: Egy .bi5 tartalom dekódolása numpy tömbbé
+    - decode_bi5_file: Egy .bi5 fájl dekódolása (process pool worker)
+    - Bi5ImportStats: Az import eredménye
+    - Bi5Importer: Sok órás fájl párhuzamos dekódolása a napi partíciókba
+
+Egy .bi5 fájl egy óra tickjeit tartalmazza LZMA tömörítéssel. Kitömörítve
+20 bájtos big-endian rekordok sorozata:
+
+    uint32 ms eltolás az óra kezdetétől, uint32 ask (pont), uint32 bid (pont),
+    float32 ask volumen, float32 bid volumen
+
+A rekordok soronkénti struct.unpack helyett egyetlen numpy.frombuffer hívással,
+a konverziók pedig oszloponként, vektorizáltan történnek.
+
+Author: Neural AI Next Team
+Version: 2.0.0
+"""
+
+import asyncio
+import lzma
+import re
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import structlog
+
+if TYPE_CHECKING:
+    from neural_ai.core.storage.implementations.parquet_storage import ParquetStorageService
+
+
+logger = structlog.get_logger()
+
+BI5_RECORD_DTYPE = np.dtype(
+    [
+        ("ms", ">u4"),
+        ("ask", ">u4"),
+        ("bid", ">u4"),
+        ("ask_volume", ">f4"),
+        ("bid_volume", ">f4"),
+    ]
+)
+
+TICK_RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),  # mikroszekundum 1970-01-01 (UTC) óta
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+
+# A 3 tizedesjegyre jegyzett instrumentumok (a többi 5 tizedesjegyű)
+_THREE_DIGIT_SUFFIXES = ("JPY", "RUB", "HUF")
+_THREE_DIGIT_PREFIXES = ("XAU", "XAG")
+
+_EPOCH = datetime(1970, 1, 1)
+_HOUR_FILE_PATTERN = re.compile(r"^(\d{2})h_ticks\.bi5$")
+
+
+def get_point_value(symbol: str) -> float:
+    """Az árak pont -> ár váltószáma a Dukascopy konvenció szerint.
+
+    Args:
+        symbol: A szimbólum (pl. 'EURUSD', 'USDJPY')
+
+    Returns:
+        float: A váltószám (1e3 a JPY/RUB/HUF kereszteknél és a nemesfémeknél, egyébként 1e5)
+    """
+    symbol = symbol.upper()
+    if symbol.endswith(_THREE_DIGIT_SUFFIXES) or symbol.startswith(_THREE_DIGIT_PREFIXES):
+        return 1e3
+    return 1e5
+
+
+def hour_from_path(path: str | Path) -> datetime:
+    """Az óra kezdete a Dukascopy könyvtárszerkezetből.
+
+    A várt szerkezet: .../{ÉÉÉÉ}/{HH-1}/{NN}/{óó}h_ticks.bi5 (a hónap 0-tól
+    számozott, ahogy a Dukascopy datafeed-ben).
+
+    Args:
+        path: A .bi5 fájl útvonala
+
+    Returns:
+        datetime: Az óra kezdete (naiv UTC)
+
+    Raises:
+        ValueError: Ha az útvonal nem a Dukascopy szerkezetet követi
+    """
+    path = Path(path)
+    match = _HOUR_FILE_PATTERN.match(path.name)
+    try:
+        if match is None:
+            raise ValueError(path.name)
+        day_dir, month_dir, year_dir = path.parent, path.parent.parent, path.parent.parent.parent
+        return datetime(
+            int(year_dir.name), int(month_dir.name) + 1, int(day_dir.name), int(match.group(1))
+        )
+    except ValueError as e:
+        raise ValueError(
+            f"Nem Dukascopy .bi5 útvonal (ÉÉÉÉ/HH/NN/óóh_ticks.bi5): {path}"
+        ) from e
+
+
+def decode_bi5(
+    data: bytes, hour_start: datetime, point_value: float, compressed: bool = True
+) -> np.ndarray:
+    """Egy óra .bi5 tartalmának dekódolása.
+
+    Args:
+        data: A fájl tartalma
+        hour_start: Az óra kezdete (naiv UTC)
+        point_value: Pont -> ár váltószám (lásd get_point_value)
+        compressed: A tartalom LZMA tömörített-e
+
+    Returns:
+        np.ndarray: TICK_RECORD_DTYPE típusú tömb, időrendben
+
+    Raises:
+        ValueError: Ha a kitömörített tartalom nem egész számú rekordból áll
+    """
+    # Az üres fájl tick nélküli órát jelent
+    if not data:
+        return np.empty(0, dtype=TICK_RECORD_DTYPE)
+
+    raw = lzma.decompress(data) if compressed else data
+    if len(raw) % BI5_RECORD_DTYPE.itemsize:
+        raise ValueError(
+            f"Sérült .bi5 tartalom: {len(raw)} bájt nem osztható "
+            f"{BI5_RECORD_DTYPE.itemsize} bájtos rekordokra"
+        )
+
+    records = np.frombuffer(raw, dtype=BI5_RECORD_DTYPE)
+    hour_micros = (hour_start - _EPOCH) // timedelta(microseconds=1)
+
+    ticks = np.empty(len(records), dtype=TICK_RECORD_DTYPE)
+    ticks["timestamp"] = records["ms"].astype(np.int64) * 1000 + hour_micros
+    ticks["bid"] = records["bid"] / point_value
+    ticks["ask"] = records["ask"] / point_value
+    ticks["volume"] = records["bid_volume"].astype(np.float64) + records["ask_volume"]
+    return ticks
+
+
+def decode_bi5_file(
+    path: str, point_value: float, hour_start: datetime | None = None
+) -> np.ndarray:
+    """Egy .bi5 fájl dekódolása (process pool worker-ként is használható).
+
+    Args:
+        path: A .bi5 fájl útvonala
+        point_value: Pont -> ár váltószám
+        hour_start: Az óra kezdete (ha None, az útvonalból)
+
+    Returns:
+        np.ndarray: TICK_RECORD_DTYPE típusú tömb
+
+    Raises:
+        ValueError: Ha a fájl sérült vagy az útvonal nem értelmezhető
+    """
+    if hour_start is None:
+        hour_start = hour_from_path(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return decode_bi5(data, hour_start, point_value)
+    except (lzma.LZMAError, ValueError) as e:
+        raise ValueError(f"Hiba a .bi5 fájl dekódolása során: {path} ({e})") from e
+
+
+@dataclass
+class Bi5ImportStats:
+    """Egy .bi5 import eredménye.
+
+    Attributes:
+        symbol: A pénzpár szimbóluma
+        files: A feldolgozott .bi5 fájlok száma
+        bytes_read: A beolvasott (tömörített) bájtok
+        rows_written: A partíciókba írt tickek
+        days: A megírt napok
+        elapsed_seconds: Az import időtartama
+    """
+
+    symbol: str
+    files: int = 0
+    bytes_read: int = 0
+    rows_written: int = 0
+    days: list[datetime] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Átviteli sebesség tickekben."""
+        return self.rows_written / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class Bi5Importer:
+    """Dukascopy .bi5 órás fájlok párhuzamos dekódolása a napi tick partíciókba.
+
+    A dekódolás (LZMA + frombuffer) egy process pool-ban fut, így a CPU-igényes
+    kitömörítés az összes magot kihasználja. A napok időrendben íródnak ki a
+    ParquetStorageService.store_tick_data() hívással, miközben a következő
+    prefetch_days nap órái már dekódolás alatt állnak; a memóriában egyszerre
+    legfeljebb prefetch_days + 1 nap tickjei vannak.
+
+    Attributes:
+        storage: A cél ParquetStorageService
+        max_workers: A dekódoló folyamatok száma (None = CPU-k száma)
+        prefetch_days: Az előre dekódolt napok száma
+        source: A source oszlop értéke
+    """
+
+    def __init__(
+        self,
+        storage: "ParquetStorageService",
+        max_workers: int | None = None,
+        prefetch_days: int = 2,
+        source: str = "jforex",
+    ) -> None:
+        """Inicializálja a Bi5Importer-t.
+
+        Args:
+            storage: A cél ParquetStorageService
+            max_workers: A dekódoló folyamatok száma (None = CPU-k száma)
+            prefetch_days: Az előre dekódolt napok száma
+            source: A source oszlop értéke
+
+        Raises:
+            ValueError: Ha a prefetch_days negatív
+        """
+        if prefetch_days < 0:
+            raise ValueError(f"A prefetch_days nem lehet negatív: {prefetch_days}")
+        self.storage = storage
+        self.max_workers = max_workers
+        self.prefetch_days = prefetch_days
+        self.source = source
+
+    async def import_directory(
+        self,
+        symbol: str,
+        directory: str | Path,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        point_value: float | None = None,
+    ) -> Bi5ImportStats:
+        """Egy Dukascopy szerkezetű könyvtár (.../ÉÉÉÉ/HH/NN/óóh_ticks.bi5) importálása.
+
+        Args:
+            symbol: A pénzpár szimbóluma
+            directory: A szimbólum könyvtára (az évkönyvtárak szülője)
+            start: Csak az ennél nem korábbi órák (opcionális)
+            end: Csak az ennél nem későbbi órák (opcionális)
+            point_value: Pont -> ár váltószám (alapértelmezett: get_point_value)
+
+        Returns:
+            Bi5ImportStats: Az import eredménye
+
+        Raises:
+            FileNotFoundError: Ha a könyvtár nem létezik
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Könyvtár nem található: {directory}")
+
+        paths = [
+            path
+            for path in directory.glob("*/*/*/*h_ticks.bi5")
+            if (start is None or hour_from_path(path) >= start)
+            and (end is None or hour_from_path(path) <= end)
+        ]
+        return await self.import_files(symbol, paths, point_value)
+
+    async def import_files(
+        self,
+        symbol: str,
+        paths: Iterable[str | Path],
+        point_value: float | None = None,
+    ) -> Bi5ImportStats:
+        """Órás .bi5 fájlok dekódolása és napi partíciókba írása.
+
+        Args:
+            symbol: A pénzpár szimbóluma
+            paths: A .bi5 fájlok (a Dukascopy könyvtárszerkezetben)
+            point_value: Pont -> ár váltószám (alapértelmezett: get_point_value)
+
+        Returns:
+            Bi5ImportStats: Az import eredménye
+
+        Raises:
+            ValueError: Ha egy fájl sérült vagy az útvonala nem értelmezhető
+        """
+        point_value = point_value or get_point_value(symbol)
+        stats = Bi5ImportStats(symbol=symbol.upper())
+        started = time.monotonic()
+
+        # Nap -> [(óra, útvonal)]
+        days: dict[datetime, list[tuple[datetime, Path]]] = {}
+        for raw_path in paths:
+            path = Path(raw_path)
+            hour = hour_from_path(path)
+            day = hour.replace(hour=0)
+            days.setdefault(day, []).append((hour, path))
+            stats.files += 1
+            stats.bytes_read += path.stat().st_size
+
+        loop = asyncio.get_running_loop()
+        pending: deque[tuple[datetime, asyncio.Future[list[np.ndarray]]]] = deque()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            try:
+                for day in sorted(days):
+                    hours = sorted(days[day])
+                    decoded = asyncio.gather(
+                        *[
+                            loop.run_in_executor(
+                                pool, decode_bi5_file, str(path), point_value, hour
+                            )
+                            for hour, path in hours
+                        ]
+                    )
+                    pending.append((day, decoded))
+                    if len(pending) > self.prefetch_days:
+                        await self._store_day(stats, *pending.popleft())
+
+                while pending:
+                    await self._store_day(stats, *pending.popleft())
+            except BaseException:
+                for _, decoded in pending:
+                    decoded.cancel()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        stats.elapsed_seconds = time.monotonic() - started
+        logger.info(
+            "Bi5 import finished",
+            symbol=stats.symbol,
+            files=stats.files,
+            days=len(stats.days),
+            rows_written=stats.rows_written,
+            elapsed_seconds=round(stats.elapsed_seconds, 3),
+            ticks_per_second=round(stats.ticks_per_second),
+        )
+        return stats
+
+    async def _store_day(
+        self,
+        stats: Bi5ImportStats,
+        day: datetime,
+        decoded: "asyncio.Future[list[np.ndarray]]",
+    ) -> None:
+        """Egy nap dekódolt óráinak összefűzése és kiírása.
+
+        Args:
+            stats: A frissítendő statisztika
+            day: A nap
+            decoded: Az órák dekódolt tömbjei (időrendben)
+        """
+        hours = [ticks for ticks in await decoded if len(ticks)]
+        # Tick nélküli nap (pl. hétvége): nincs partíció
+        if not hours:
+            return
+
+        ticks = np.concatenate(hours)
+        await self.storage.store_tick_data(stats.symbol, self._to_dataframe(ticks), day)
+        stats.rows_written += len(ticks)
+        stats.days.append(day)
+
+    def _to_dataframe(self, ticks: np.ndarray) -> Any:
+        """Dekódolt tickek átalakítása a tick séma szerinti DataFrame-mé.
+
+        Args:
+            ticks: TICK_RECORD_DTYPE típusú tömb
+
+        Returns:
+            pd.DataFrame: timestamp, bid, ask, volume és source oszlopok
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "timestamp": ticks["timestamp"].astype("datetime64[us]"),
+                "bid": ticks["bid"],
+                "ask": ticks["ask"],
+                "volume": ticks["volume"],
+                "source": self.source,
+            }
+        )
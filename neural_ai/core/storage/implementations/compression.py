@@ -0,0 +1,149 @@
+"""Átlátszó tömörítés a FileStorage szöveges formátumaihoz.
+
+A modulban található:
+    - COMPRESSION_CODECS: A támogatott tömörítések fájlkiterjesztései
+    - codec_from_path: A tömörítés meghatározása a fájl kiterjesztéséből
+    - open_compressed: Bináris fájl megnyitása folyamatos (de)kompresszióval
+    - pandas_compression: A pandas to_csv/read_csv compression paramétere
+
+A zstd a zstandard csomagra épül (opcionális függőség, lazy importtal), és
+több szálon tömörít. A gzip a standard könyvtár része, egy szálon fut.
+"""
+
+import gzip
+import io
+from pathlib import Path
+from typing import IO, Any
+
+from neural_ai.core.storage.exceptions import StorageFormatError
+
+# Kiterjesztés -> pandas compression metódus
+COMPRESSION_CODECS: dict[str, str] = {
+    "zst": "zstd",
+    "gz": "gzip",
+}
+
+DEFAULT_ZSTD_LEVEL = 3
+DEFAULT_GZIP_LEVEL = 6
+
+# A zstd tömörítő szálainak száma (-1 = az összes logikai CPU)
+DEFAULT_ZSTD_THREADS = -1
+
+_READ_BUFFER_SIZE = 1024 * 1024
+
+
+def _import_zstandard() -> Any:
+    """A zstandard modul lazy importálása.
+
+    Returns:
+        A zstandard modul
+
+    Raises:
+        StorageFormatError: Ha a zstandard nincs telepítve
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise StorageFormatError(
+            "A zstd tömörítéshez a zstandard csomag szükséges: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+def codec_from_path(path: str | Path) -> str | None:
+    """A tömörítés meghatározása a fájl kiterjesztéséből.
+
+    Args:
+        path: A fájl útvonala
+
+    Returns:
+        str | None: 'zst', 'gz', vagy None, ha a fájl nem tömörített
+    """
+    suffix = Path(path).suffix.lower().lstrip(".")
+    return suffix if suffix in COMPRESSION_CODECS else None
+
+
+def open_compressed(
+    path: str | Path,
+    mode: str,
+    codec: str | None,
+    level: int | None = None,
+    threads: int | None = None,
+) -> IO[bytes]:
+    """Bináris fájl megnyitása folyamatos tömörítéssel vagy kitömörítéssel.
+
+    Olvasáskor a kitömörítés pufferelt streamként történik, a teljes
+    kitömörített tartalom sosem kerül egyszerre a memóriába.
+
+    Args:
+        path: A fájl útvonala
+        mode: 'rb' vagy 'wb'
+        codec: 'zst', 'gz', vagy None (tömörítetlen)
+        level: Tömörítési szint (csak írásnál)
+        threads: A zstd tömörítő szálainak száma (csak írásnál)
+
+    Returns:
+        IO[bytes]: Soronként is iterálható bináris fájlobjektum
+
+    Raises:
+        StorageFormatError: Ha a mód vagy a tömörítés nem támogatott
+    """
+    if mode not in ("rb", "wb"):
+        raise StorageFormatError(f"Nem támogatott fájlmód: {mode}")
+
+    if codec is None:
+        return open(path, mode, buffering=_READ_BUFFER_SIZE)
+
+    if codec == "gz":
+        compresslevel = DEFAULT_GZIP_LEVEL if level is None else level
+        return gzip.open(path, mode, compresslevel=compresslevel)
+
+    if codec == "zst":
+        zstandard = _import_zstandard()
+        fh = open(path, mode)
+        if mode == "wb":
+            compressor = zstandard.ZstdCompressor(
+                level=DEFAULT_ZSTD_LEVEL if level is None else level,
+                threads=DEFAULT_ZSTD_THREADS if threads is None else threads,
+            )
+            return compressor.stream_writer(fh, closefd=True)
+        reader = zstandard.ZstdDecompressor().stream_reader(fh, closefd=True)
+        # A pufferelt olvasó biztosítja a readline()-t és a soronkénti iterációt
+        return io.BufferedReader(reader, buffer_size=_READ_BUFFER_SIZE)
+
+    raise StorageFormatError(
+        f"Nem támogatott tömörítés: {codec}. Támogatott: {list(COMPRESSION_CODECS)}"
+    )
+
+
+def pandas_compression(
+    codec: str, level: int | None = None, threads: int | None = None
+) -> dict[str, Any]:
+    """A pandas to_csv()/read_csv() compression paraméterének összeállítása.
+
+    Args:
+        codec: 'zst' vagy 'gz'
+        level: Tömörítési szint (csak írásnál)
+        threads: A zstd tömörítő szálainak száma (csak írásnál)
+
+    Returns:
+        dict[str, Any]: A compression paraméter
+
+    Raises:
+        StorageFormatError: Ha a tömörítés nem támogatott, vagy a függősége hiányzik
+    """
+    if codec not in COMPRESSION_CODECS:
+        raise StorageFormatError(
+            f"Nem támogatott tömörítés: {codec}. Támogatott: {list(COMPRESSION_CODECS)}"
+        )
+
+    options: dict[str, Any] = {"method": COMPRESSION_CODECS[codec]}
+    if codec == "zst":
+        _import_zstandard()
+        if level is not None:
+            options["level"] = level
+        if threads is not None:
+            options["threads"] = threads
+    elif level is not None:
+        options["compresslevel"] = level
+    return options
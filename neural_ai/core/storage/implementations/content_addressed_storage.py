@@ -0,0 +1,578 @@
+"""Tartalom-címzett (content-addressed) storage implementáció.
+
+A modulban található:
+    - ContentAddressedStorage: Deduplikáló storage a FileStorage fölött
+
+Az adatok a tartalmuk SHA-256 hash-e alatt, egyetlen példányban tárolódnak
+(blob). A felhasználói útvonalak csak kis méretű hivatkozások (ref) a
+blob-okra, így az azonos tartalmú DataFrame-ek és objektumok többszöri
+mentése nem foglal újabb helyet, és a változatlan adatok újramentése
+kihagyja az írást.
+
+Könyvtárszerkezet a base_path alatt::
+
+    .cas/blobs/ab/abcdef...     # a tartalom, a digest alatt
+    .cas/refs/<útvonal>.ref     # hivatkozás: digest, formátum, méret
+    .cas/fingerprints/<hash>    # DataFrame ujjlenyomat -> digest
+    .cas/tmp/                   # félkész írások
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+import pandas as pd
+
+from neural_ai.core.storage.exceptions import (
+    StorageIOError,
+    StorageNotFoundError,
+    StorageValidationError,
+)
+from neural_ai.core.storage.implementations.file_storage import FileStorage
+from neural_ai.core.storage.interfaces.storage_interface import StorageInterface
+
+if TYPE_CHECKING:
+    from neural_ai.core.logger.interfaces.logger_interface import LoggerInterface
+
+
+class ContentAddressedStorage(StorageInterface):
+    """Deduplikáló, tartalom-címzett storage a FileStorage formátumkezelőire építve.
+
+    A szerializációt a belső FileStorage végzi (ugyanazok a formátumok
+    érhetők el), a kész fájl hash-e alapján pedig a blob csak akkor kerül
+    a tárolóba, ha még nincs ott. A DataFrame-ekhez vektorizált ujjlenyomat
+    is készül, így egy változatlan DataFrame újramentésekor a szerializáció
+    is elmarad.
+    """
+
+    _CAS_DIR = ".cas"
+    _REF_SUFFIX = ".ref"
+    _HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        base_path: str | Path | None = None,
+        logger: Optional["LoggerInterface"] = None,
+        storage: FileStorage | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Inicializálja a ContentAddressedStorage példányt.
+
+        Args:
+            base_path: Alap könyvtár útvonala
+            logger: Logger példány (opcionális)
+            storage: A szerializációt végző FileStorage (ha None, létrejön)
+            **kwargs: További paraméterek a belső FileStorage számára
+        """
+        self._base_path = Path(base_path) if base_path else Path.cwd()
+        self.logger: LoggerInterface | None = logger
+        self._storage = storage or FileStorage(base_path=self._base_path, logger=logger, **kwargs)
+
+        root = self._base_path / self._CAS_DIR
+        self._blobs_dir = root / "blobs"
+        self._refs_dir = root / "refs"
+        self._fingerprints_dir = root / "fingerprints"
+        self._tmp_dir = root / "tmp"
+        for directory in (self._blobs_dir, self._refs_dir, self._fingerprints_dir, self._tmp_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    # --- Belső segédfüggvények ---
+
+    def _relative_path(self, path: str | Path) -> Path:
+        """A felhasználói útvonal base_path-hoz viszonyított alakja.
+
+        Args:
+            path: Relatív vagy base_path alatti abszolút útvonal
+
+        Returns:
+            Path: A relatív útvonal
+
+        Raises:
+            StorageValidationError: Ha az útvonal a base_path-on kívül esik
+        """
+        rel = Path(path)
+        if rel.is_absolute():
+            try:
+                rel = rel.relative_to(self._base_path)
+            except ValueError as e:
+                raise StorageValidationError(
+                    f"Az útvonal a tároló alapkönyvtárán kívül esik: {path}"
+                ) from e
+        if ".." in rel.parts:
+            raise StorageValidationError(f"Érvénytelen útvonal: {path}")
+        return rel
+
+    def _ref_path(self, path: str | Path) -> Path:
+        """A felhasználói útvonalhoz tartozó ref fájl útvonala."""
+        rel = self._relative_path(path)
+        return self._refs_dir / rel.parent / (rel.name + self._REF_SUFFIX)
+
+    def _blob_path(self, digest: str) -> Path:
+        """A digest-hez tartozó blob útvonala."""
+        return self._blobs_dir / digest[:2] / digest
+
+    def _tmp_path(self, fmt: str) -> Path:
+        """Egyedi ideiglenes fájl útvonala a .cas/tmp könyvtárban."""
+        return self._tmp_dir / f"{uuid.uuid4().hex}.{fmt}"
+
+    def _hash_file(self, file_path: Path) -> str:
+        """Fájl SHA-256 hash-e, chunkonkénti olvasással.
+
+        Args:
+            file_path: A hash-elendő fájl
+
+        Returns:
+            str: A hexadecimális digest
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(self._HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _touch(blob_path: Path) -> None:
+        """Frissíti egy újrahasznosított blob módosítási idejét.
+
+        Így a gc() türelmi ideje az újrahasznosítástól számít, és egy
+        korábban hivatkozás nélküli blob nem törlődik, mielőtt az új
+        hivatkozás kiíródna.
+        """
+        try:
+            os.utime(blob_path)
+        except OSError:
+            pass
+
+    def _store_file(self, tmp_path: Path) -> str:
+        """Ideiglenes fájl áthelyezése a blob tárolóba (ha még nincs ott).
+
+        A fájl közvetlenül a kiírás után kerül hash-elésre, amikor még
+        az operációs rendszer lap-cache-ében van.
+
+        Args:
+            tmp_path: A szerializált ideiglenes fájl
+
+        Returns:
+            str: A tartalom digest-je
+        """
+        try:
+            digest = self._hash_file(tmp_path)
+            blob_path = self._blob_path(digest)
+            if blob_path.exists():
+                tmp_path.unlink()
+                self._touch(blob_path)
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, blob_path)
+            return digest
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise StorageIOError(f"Hiba a blob tárolása során: {str(e)}") from e
+
+    def _store_bytes(self, payload: bytes, fmt: str) -> str:
+        """Kódolt tartalom tárolása blob-ként; létező blob esetén nincs írás.
+
+        Args:
+            payload: A kódolt tartalom
+            fmt: A formátum (csak az ideiglenes fájl nevéhez)
+
+        Returns:
+            str: A tartalom digest-je
+        """
+        digest = hashlib.sha256(payload).hexdigest()
+        blob_path = self._blob_path(digest)
+        if blob_path.exists():
+            self._touch(blob_path)
+            return digest
+
+        tmp_path = self._tmp_path(fmt)
+        try:
+            tmp_path.write_bytes(payload)
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, blob_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise StorageIOError(f"Hiba a blob tárolása során: {str(e)}") from e
+        return digest
+
+    def _write_ref(self, path: str, digest: str, fmt: str, kind: str) -> None:
+        """Hivatkozás atomi írása a felhasználói útvonalhoz.
+
+        Args:
+            path: A felhasználói útvonal
+            digest: A blob digest-je
+            fmt: A tartalom formátuma
+            kind: 'dataframe' vagy 'object'
+        """
+        ref_path = self._ref_path(path)
+        ref = {
+            "digest": digest,
+            "fmt": fmt,
+            "kind": kind,
+            "size": self._blob_path(digest).stat().st_size,
+            "created": datetime.now().isoformat(),
+        }
+        tmp_path = ref_path.with_name(ref_path.name + ".tmp")
+        try:
+            ref_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(ref), encoding="utf-8")
+            os.replace(tmp_path, ref_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise StorageIOError(f"Hiba a hivatkozás írása során: {str(e)}") from e
+
+    def _read_ref(self, path: str) -> dict[str, Any]:
+        """Hivatkozás beolvasása.
+
+        Args:
+            path: A felhasználói útvonal
+
+        Returns:
+            dict[str, Any]: A hivatkozás tartalma
+
+        Raises:
+            StorageNotFoundError: Ha a hivatkozás vagy a blob nem létezik
+        """
+        ref_path = self._ref_path(path)
+        try:
+            ref: dict[str, Any] = json.loads(ref_path.read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise StorageNotFoundError(f"Fájl nem található: {path}") from e
+        except (OSError, ValueError) as e:
+            raise StorageIOError(f"Hiba a hivatkozás olvasása során: {str(e)}") from e
+
+        if not self._blob_path(ref["digest"]).exists():
+            raise StorageNotFoundError(f"A hivatkozott blob nem található: {ref['digest']}")
+        return ref
+
+    def _fingerprint_dataframe(self, df: pd.DataFrame, fmt: str, kwargs: dict[str, Any]) -> str:
+        """Vektorizált tartalmi ujjlenyomat egy DataFrame-hez.
+
+        Az ujjlenyomat a formátumot és a mentési paramétereket is tartalmazza,
+        mert ugyanaz a DataFrame más beállításokkal más blob-ot eredményez.
+
+        Args:
+            df: A DataFrame
+            fmt: A mentés formátuma
+            kwargs: A mentési paraméterek
+
+        Returns:
+            str: Az ujjlenyomat hexadecimális alakban
+        """
+        fingerprint = hashlib.sha256()
+        fingerprint.update(fmt.encode("utf-8"))
+        fingerprint.update(repr(sorted(kwargs.items())).encode("utf-8"))
+        fingerprint.update(repr(list(df.columns)).encode("utf-8"))
+        fingerprint.update(repr([str(dtype) for dtype in df.dtypes]).encode("utf-8"))
+        fingerprint.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return fingerprint.hexdigest()
+
+    def _lookup_fingerprint(self, fingerprint: str) -> str | None:
+        """Az ujjlenyomathoz tartozó, még létező blob digest-je."""
+        try:
+            digest = (self._fingerprints_dir / fingerprint).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            return None
+        self._touch(blob_path)
+        return digest
+
+    # --- StorageInterface ---
+
+    def save_dataframe(
+        self,
+        df: pd.DataFrame,
+        path: str,
+        fmt: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Menti a DataFrame-et tartalom-címzett blob-ként.
+
+        Ha ugyanez a tartalom már szerepel a tárolóban, csak a hivatkozás
+        íródik ki.
+
+        Args:
+            df: A mentendő DataFrame
+            path: A mentés (logikai) útvonala
+            fmt: A mentés formátuma (ha None, akkor a kiterjesztésből)
+            **kwargs: További formátum-specifikus paraméterek
+
+        Raises:
+            StorageFormatError: Ha a formátum nem támogatott
+            StorageIOError: Ha a mentés sikertelen
+        """
+        fmt = self._storage.resolve_format(self._relative_path(path), fmt, df)
+
+        try:
+            fingerprint: str | None = self._fingerprint_dataframe(df, fmt, kwargs)
+        except TypeError:
+            # Nem hash-elhető cellák (pl. listák): csak a fájl hash-e alapján deduplikálunk
+            fingerprint = None
+
+        digest = self._lookup_fingerprint(fingerprint) if fingerprint else None
+        if digest is None:
+            tmp_path = self._tmp_path(fmt)
+            self._storage.save_dataframe(df, str(tmp_path), fmt=fmt, **kwargs)
+            digest = self._store_file(tmp_path)
+            if fingerprint:
+                (self._fingerprints_dir / fingerprint).write_text(digest, encoding="utf-8")
+        elif self.logger:
+            self.logger.debug(f"Változatlan DataFrame, az írás kimarad: {path}")
+
+        self._write_ref(path, digest, fmt, "dataframe")
+
+    def load_dataframe(self, path: str, fmt: str | None = None, **kwargs: Any) -> pd.DataFrame:
+        """Betölti a hivatkozott DataFrame-et.
+
+        Args:
+            path: A betöltendő (logikai) útvonal
+            fmt: A fájl formátuma (ha None, akkor a hivatkozásból)
+            **kwargs: További formátum-specifikus paraméterek
+
+        Returns:
+            pd.DataFrame: A betöltött DataFrame
+
+        Raises:
+            StorageNotFoundError: Ha a hivatkozás nem található
+        """
+        ref = self._read_ref(path)
+        blob_path = self._blob_path(ref["digest"])
+        return self._storage.load_dataframe(str(blob_path), fmt=fmt or ref["fmt"], **kwargs)
+
+    def save_object(self, obj: Any, path: str, fmt: str | None = None, **kwargs: Any) -> None:
+        """Menti az objektumot tartalom-címzett blob-ként.
+
+        Előre kódolható formátumoknál (pl. JSON) a hash a kódolt bájtokból
+        készül, és létező blob esetén semmi sem íródik a lemezre.
+
+        Args:
+            obj: A mentendő objektum
+            path: A mentés (logikai) útvonala
+            fmt: A mentés formátuma (ha None, akkor a kiterjesztésből)
+            **kwargs: További formátum-specifikus paraméterek
+
+        Raises:
+            StorageFormatError: Ha a formátum nem támogatott
+            StorageSerializationError: Ha az objektum nem szerializálható
+            StorageIOError: Ha a mentés sikertelen
+        """
+        fmt = self._storage.resolve_format(self._relative_path(path), fmt, obj)
+
+        if self._storage.can_encode(fmt):
+            payload = self._storage.encode_object(obj, fmt, **kwargs)
+            digest = self._store_bytes(payload, fmt)
+        else:
+            tmp_path = self._tmp_path(fmt)
+            self._storage.save_object(obj, str(tmp_path), fmt=fmt, **kwargs)
+            digest = self._store_file(tmp_path)
+
+        self._write_ref(path, digest, fmt, "object")
+
+    def load_object(self, path: str, fmt: str | None = None, **kwargs: Any) -> Any:
+        """Betölti a hivatkozott objektumot.
+
+        Args:
+            path: A betöltendő (logikai) útvonal
+            fmt: A fájl formátuma (ha None, akkor a hivatkozásból)
+            **kwargs: További formátum-specifikus paraméterek
+
+        Returns:
+            Any: A betöltött objektum
+
+        Raises:
+            StorageNotFoundError: Ha a hivatkozás nem található
+        """
+        ref = self._read_ref(path)
+        blob_path = self._blob_path(ref["digest"])
+        return self._storage.load_object(str(blob_path), fmt=fmt or ref["fmt"], **kwargs)
+
+    def exists(self, path: str) -> bool:
+        """Ellenőrzi, hogy létezik-e hivatkozás (vagy könyvtár) az útvonalon.
+
+        Args:
+            path: Az ellenőrizendő útvonal
+
+        Returns:
+            bool: True, ha létezik, False ha nem
+        """
+        rel = self._relative_path(path)
+        return self._ref_path(path).exists() or (self._refs_dir / rel).is_dir()
+
+    def contains(self, digest: str) -> bool:
+        """Ellenőrzi, hogy a digest-hez tartozó tartalom tárolva van-e.
+
+        Args:
+            digest: A tartalom SHA-256 digest-je
+
+        Returns:
+            bool: True, ha a blob létezik
+        """
+        return self._blob_path(digest).exists()
+
+    def get_digest(self, path: str) -> str:
+        """Visszaadja az útvonal által hivatkozott tartalom digest-jét.
+
+        Args:
+            path: A (logikai) útvonal
+
+        Returns:
+            str: A SHA-256 digest
+
+        Raises:
+            StorageNotFoundError: Ha a hivatkozás nem található
+        """
+        return str(self._read_ref(path)["digest"])
+
+    def get_metadata(self, path: str) -> dict[str, Any]:
+        """Lekéri a hivatkozás és a blob metaadatait.
+
+        Args:
+            path: A fájl vagy könyvtár (logikai) útvonala
+
+        Returns:
+            Dict[str, Any]: A metaadatok (digest, fmt és kind mezőkkel kiegészítve)
+
+        Raises:
+            StorageNotFoundError: Ha az útvonal nem található
+        """
+        rel = self._relative_path(path)
+        if (self._refs_dir / rel).is_dir():
+            return self._storage.get_metadata(str(self._refs_dir / rel))
+
+        ref = self._read_ref(path)
+        metadata = self._storage.get_metadata(str(self._blob_path(ref["digest"])))
+        metadata.update(
+            {
+                "created": datetime.fromisoformat(ref["created"]),
+                "digest": ref["digest"],
+                "fmt": ref["fmt"],
+                "kind": ref["kind"],
+            }
+        )
+        return metadata
+
+    def delete(self, path: str) -> None:
+        """Törli a hivatkozást; a blob a következő gc() futáskor törlődik.
+
+        Args:
+            path: A törlendő (logikai) útvonal
+
+        Raises:
+            StorageNotFoundError: Ha az útvonal nem található
+            StorageIOError: Ha a törlés sikertelen
+        """
+        rel = self._relative_path(path)
+        ref_path = self._ref_path(path)
+        try:
+            if ref_path.exists():
+                ref_path.unlink()
+            elif (self._refs_dir / rel).is_dir():
+                (self._refs_dir / rel).rmdir()  # Csak üres könyvtárakat törlünk
+            else:
+                raise StorageNotFoundError(f"Fájl nem található: {path}")
+        except StorageNotFoundError:
+            raise
+        except OSError as e:
+            raise StorageIOError(f"Hiba a törlés során: {str(e)}") from e
+
+    def list_dir(self, path: str, pattern: str | None = None) -> Sequence[Path]:
+        """Listázza egy (logikai) könyvtár hivatkozásait.
+
+        Args:
+            path: A könyvtár útvonala
+            pattern: Szűrő minta a fájlnevekre
+
+        Returns:
+            Sequence[Path]: A logikai útvonalak (base_path alatt)
+
+        Raises:
+            StorageNotFoundError: Ha a könyvtár nem található
+        """
+        rel = self._relative_path(path)
+        refs_dir = self._refs_dir / rel
+        if not refs_dir.is_dir():
+            raise StorageNotFoundError(f"Könyvtár nem található: {self._base_path / rel}")
+
+        pattern = pattern or "*"
+        entries: list[Path] = []
+        try:
+            for entry in refs_dir.iterdir():
+                if entry.is_dir():
+                    name = entry.name
+                elif entry.name.endswith(self._REF_SUFFIX):
+                    name = entry.name[: -len(self._REF_SUFFIX)]
+                else:
+                    continue
+                if fnmatch(name, pattern):
+                    entries.append(self._base_path / rel / name)
+        except OSError as e:
+            raise StorageIOError(f"Hiba a könyvtár listázása során: {str(e)}") from e
+        return entries
+
+    # --- Szemétgyűjtés ---
+
+    def gc(self, grace_period: float = 3600.0, dry_run: bool = False) -> dict[str, int]:
+        """Törli a hivatkozás nélküli blob-okat és a félbemaradt írásokat.
+
+        A grace_period-nál fiatalabb blob-ok és ideiglenes fájlok érintetlenek
+        maradnak, hogy a párhuzamosan futó mentések (amelyek a blob-ot már,
+        a hivatkozást még nem írták ki) ne veszítsenek adatot.
+
+        Args:
+            grace_period: Ennyi másodpercnél fiatalabb fájlokat nem törlünk
+            dry_run: Ha True, csak számol, de nem töröl
+
+        Returns:
+            dict[str, int]: Statisztika (blobs_removed, bytes_freed,
+                fingerprints_removed, tmp_removed)
+        """
+        cutoff = time.time() - grace_period
+        referenced: set[str] = set()
+        for ref_path in self._refs_dir.rglob(f"*{self._REF_SUFFIX}"):
+            try:
+                referenced.add(json.loads(ref_path.read_text(encoding="utf-8"))["digest"])
+            except (OSError, ValueError, KeyError):
+                continue
+
+        stats = {"blobs_removed": 0, "bytes_freed": 0, "fingerprints_removed": 0, "tmp_removed": 0}
+        removed: set[str] = set()
+
+        for blob_path in self._blobs_dir.glob("*/*"):
+            if blob_path.name in referenced:
+                continue
+            stat = blob_path.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            removed.add(blob_path.name)
+            stats["blobs_removed"] += 1
+            stats["bytes_freed"] += stat.st_size
+            if not dry_run:
+                blob_path.unlink(missing_ok=True)
+
+        for fingerprint_path in self._fingerprints_dir.iterdir():
+            digest = fingerprint_path.read_text(encoding="utf-8").strip()
+            if digest not in removed and self._blob_path(digest).exists():
+                continue
+            stats["fingerprints_removed"] += 1
+            if not dry_run:
+                fingerprint_path.unlink(missing_ok=True)
+
+        for tmp_path in self._tmp_dir.iterdir():
+            if tmp_path.stat().st_mtime > cutoff:
+                continue
+            stats["tmp_removed"] += 1
+            if not dry_run:
+                tmp_path.unlink(missing_ok=True)
+
+        if self.logger:
+            self.logger.info(f"CAS gc kész: {stats}")
+        return stats
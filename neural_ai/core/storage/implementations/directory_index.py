@@ -0,0 +1,204 @@
+"""Könyvtárlistázás os.scandir alapon, opcionális memóriabeli indexszel.
+
+A modulban található:
+    - DirEntryInfo: Egy könyvtárbejegyzés neve, típusa és stat adatai
+    - DirListingPage: Lapozott listázás egy oldala
+    - DirectoryIndex: Könyvtáranként cache-elt bejegyzések, mtime alapú frissítéssel
+    - scan_entries: Egy könyvtár bejegyzéseinek folyamatos beolvasása
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class DirEntryInfo:
+    """Egy könyvtárbejegyzés adatai egyetlen scandir + stat lekérdezésből.
+
+    Attributes:
+        path: A bejegyzés teljes útvonala
+        name: A bejegyzés neve
+        is_dir: Könyvtár-e
+        is_file: Fájl-e
+        size: Méret bájtban
+        created: Létrehozás (ctime) időbélyege
+        modified: Módosítás (mtime) időbélyege
+        accessed: Utolsó hozzáférés (atime) időbélyege
+        is_symlink: Szimbolikus link-e
+    """
+
+    path: Path
+    name: str
+    is_dir: bool
+    is_file: bool
+    size: int
+    created: float
+    modified: float
+    accessed: float
+    is_symlink: bool = False
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry[str]) -> "DirEntryInfo":
+        """Létrehozás egy os.DirEntry-ből.
+
+        A típus a scandir által visszaadott d_type-ból jön (extra rendszerhívás
+        nélkül), a méret és az időbélyegek egyetlen stat hívásból.
+
+        Args:
+            entry: A scandir bejegyzés
+
+        Returns:
+            DirEntryInfo: A bejegyzés adatai
+        """
+        stat = entry.stat()
+        return cls(
+            path=Path(entry.path),
+            name=entry.name,
+            is_dir=entry.is_dir(),
+            is_file=entry.is_file(),
+            size=stat.st_size,
+            created=stat.st_ctime,
+            modified=stat.st_mtime,
+            accessed=stat.st_atime,
+            is_symlink=entry.is_symlink(),
+        )
+
+    def to_metadata(self) -> dict[str, Any]:
+        """A FileStorage.get_metadata() formátumának megfelelő dictionary.
+
+        Returns:
+            dict[str, Any]: A metaadatok
+        """
+        return {
+            "size": self.size,
+            "created": datetime.fromtimestamp(self.created),
+            "modified": datetime.fromtimestamp(self.modified),
+            "accessed": datetime.fromtimestamp(self.accessed),
+            "is_file": self.is_file,
+            "is_dir": self.is_dir,
+        }
+
+
+def scan_entries(directory: Path) -> Iterator[DirEntryInfo]:
+    """Egy könyvtár bejegyzéseinek folyamatos beolvasása os.scandir-rel.
+
+    A listázás és a stat lekérdezés között törölt bejegyzéseket kihagyja.
+
+    Args:
+        directory: A könyvtár
+
+    Yields:
+        A könyvtár bejegyzései a fájlrendszer sorrendjében
+
+    Raises:
+        OSError: Ha a könyvtár nem olvasható
+    """
+    with os.scandir(directory) as iterator:
+        for entry in iterator:
+            try:
+                yield DirEntryInfo.from_dir_entry(entry)
+            except FileNotFoundError:
+                continue
+
+
+@dataclass
+class DirListingPage:
+    """Lapozott könyvtárlistázás egy oldala.
+
+    Attributes:
+        entries: Az oldal bejegyzései
+        next_offset: A következő oldal kezdete (None, ha nincs több bejegyzés)
+        next_cursor: A következő oldal kurzora: az oldal utolsó bejegyzésének
+            a listázott könyvtárhoz viszonyított útvonala (None, ha nincs több)
+    """
+
+    entries: list[DirEntryInfo]
+    next_offset: int | None
+    next_cursor: str | None = None
+
+
+class DirectoryIndex:
+    """Könyvtáranként cache-elt bejegyzések LRU tárolója.
+
+    Egy bejegyzés addig érvényes, amíg a könyvtár mtime-ja nem változik
+    (fájl létrehozása, törlése vagy átnevezése). A meglévő fájlok helyben
+    történő módosítása a könyvtár mtime-ját nem változtatja meg, ezért a
+    FileStorage a saját írásai után explicit módon érvényteleníti az
+    érintett könyvtárat.
+
+    Attributes:
+        max_directories: A cache-elt könyvtárak maximális száma
+    """
+
+    def __init__(self, max_directories: int = 4096) -> None:
+        """Inicializálja a DirectoryIndex példányt.
+
+        Args:
+            max_directories: A cache-elt könyvtárak maximális száma
+        """
+        self.max_directories = max_directories
+        self._entries: OrderedDict[Path, tuple[int, dict[str, DirEntryInfo]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, directory: Path) -> dict[str, DirEntryInfo]:
+        """A könyvtár bejegyzései névsorrendben, szükség esetén újraolvasva.
+
+        Args:
+            directory: A könyvtár
+
+        Returns:
+            dict[str, DirEntryInfo]: Név -> bejegyzés, név szerint rendezve
+
+        Raises:
+            OSError: Ha a könyvtár nem olvasható
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+
+        with self._lock:
+            cached = self._entries.get(directory)
+            if cached is not None and cached[0] == mtime_ns:
+                self._entries.move_to_end(directory)
+                return cached[1]
+
+        infos = sorted(scan_entries(directory), key=lambda info: info.name)
+        entries = {info.name: info for info in infos}
+
+        with self._lock:
+            self._entries[directory] = (mtime_ns, entries)
+            self._entries.move_to_end(directory)
+            while len(self._entries) > self.max_directories:
+                self._entries.popitem(last=False)
+
+        return entries
+
+    def lookup(self, path: Path) -> DirEntryInfo | None:
+        """Egy útvonal bejegyzése a szülőkönyvtár indexéből.
+
+        Args:
+            path: A keresett útvonal
+
+        Returns:
+            DirEntryInfo | None: A bejegyzés, vagy None, ha nem létezik
+        """
+        try:
+            return self.get(path.parent).get(path.name)
+        except OSError:
+            return None
+
+    def invalidate(self, directory: Path | None = None) -> None:
+        """Érvényteleníti egy könyvtár (vagy az összes) cache-elt bejegyzéseit.
+
+        Args:
+            directory: A könyvtár (ha None, a teljes index törlődik)
+        """
+        with self._lock:
+            if directory is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(directory, None)
@@ -2,15 +2,26 @@
 
 A modulban található:
     - FileStorage: Fájlrendszer alapú storage implementáció
+    - BatchItemResult: Kötegelt műveletek elemenkénti eredménye
 """
 
+import asyncio
+import fnmatch
+import functools
+import itertools
 import json
 import os
-from collections.abc import Callable, Sequence
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, cast
 
+import numpy as np
 import pandas as pd
 
 from neural_ai.core.base.exceptions import (
@@ -18,25 +29,87 @@ from neural_ai.core.base.exceptions import (
     PermissionDeniedError,
     StorageWriteError,
 )
+from neural_ai.core.storage.backends.base import normalize_filters
 from neural_ai.core.storage.exceptions import (
     StorageFormatError,
     StorageIOError,
     StorageNotFoundError,
     StorageSerializationError,
+    StorageValidationError,
 )
+from neural_ai.core.storage.implementations.compression import (
+    COMPRESSION_CODECS,
+    DEFAULT_ZSTD_THREADS,
+    codec_from_path,
+    open_compressed,
+    pandas_compression,
+)
+from neural_ai.core.storage.implementations.directory_index import (
+    DirectoryIndex,
+    DirEntryInfo,
+    DirListingPage,
+    scan_entries,
+)
+from neural_ai.core.storage.implementations.json_codec import StdlibJsonCodec, get_json_codec
 from neural_ai.core.storage.interfaces.storage_interface import StorageInterface
 
 if TYPE_CHECKING:
     from neural_ai.core.logger.interfaces.logger_interface import LoggerInterface
 
 
+@dataclass
+class BatchItemResult:
+    """Egy kötegelt (save_many/load_many) művelet elemének eredménye.
+
+    Attributes:
+        path: Az elem útvonala, ahogy a hívó megadta
+        success: True, ha a művelet sikeres volt
+        value: Betöltésnél a betöltött adat, mentésnél None
+        error: A művelet során keletkezett kivétel (ha volt)
+    """
+
+    path: str
+    success: bool
+    value: Any = None
+    error: Exception | None = None
+
+
+@dataclass
+class _DirectoryCapability:
+    """Egy célkönyvtár cache-elt jogosultság- és szabadhely-információi.
+
+    Attributes:
+        writable: Írható-e a könyvtár (None, ha még nem ellenőriztük)
+        permissions_checked_at: A jogosultság-ellenőrzés ideje (monotonic)
+        free_bytes: A helyben nyilvántartott szabad hely bájtban
+        space_checked_at: Az utolsó statvfs hívás ideje (monotonic)
+    """
+
+    writable: bool | None = None
+    permissions_checked_at: float = 0.0
+    free_bytes: int | None = None
+    space_checked_at: float = 0.0
+
+
 class FileStorage(StorageInterface):
-    """Fájlrendszer alapú storage implementáció."""
+    """Fájlrendszer alapú storage implementáció.
+
+    A szinkron metódusok mellett aszinkron párjaik (asave_dataframe,
+    aload_object, ...) is elérhetők, amelyek egy korlátos szálkészletben
+    futnak, így nem blokkolják az asyncio eseményhurkot.
+    """
+
+    # A szöveges oszlopok méretbecsléséhez mintavételezett sorok száma
+    _SIZE_SAMPLE_ROWS = 64
 
     def __init__(
         self,
         base_path: str | Path | None = None,
         logger: Optional["LoggerInterface"] = None,
+        max_workers: int = 4,
+        capability_ttl: float = 5.0,
+        json_codec: str = "json",
+        dir_index: bool = False,
         **kwargs: Any,
     ) -> None:
         """Inicializálja a FileStorage példányt.
@@ -44,10 +117,27 @@ class FileStorage(StorageInterface):
         Args:
             base_path: Alap könyvtár útvonala
             logger: Logger példány (opcionális)
+            max_workers: Az aszinkron műveletek szálkészletének mérete
+            capability_ttl: A könyvtáranként cache-elt jogosultság- és
+                szabadhely-információk érvényessége másodpercben (0 = nincs cache)
+            json_codec: JSON codec ('json', 'orjson', 'msgspec' vagy 'auto');
+                'auto' esetén a leggyorsabb telepített codec. A gyors codec-ek
+                NaN/Inf értéket null-ként írnak, ezért csak kérésre aktívak
+            dir_index: Memóriabeli könyvtárindex használata a listázáshoz,
+                az exists() és a get_metadata() hívásokhoz (a könyvtárak
+                mtime-ja alapján frissül)
             **kwargs: További paraméterek (pl. hardware), amiket figyelmen kívül hagyunk.
         """
         self._base_path = Path(base_path) if base_path else Path.cwd()
         self.logger: LoggerInterface | None = logger
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._capability_ttl = capability_ttl
+        self._capabilities: dict[Path, _DirectoryCapability] = {}
+        self._capabilities_lock = threading.Lock()
+        self._json_codec = get_json_codec(json_codec)
+        self._stdlib_json_codec = StdlibJsonCodec()
+        self._dir_index = DirectoryIndex() if dir_index else None
         self._setup_format_handlers()
         # A kwargs-al nem csinálunk semmit, csak hagyjuk, hogy létezzen.
 
@@ -62,6 +152,23 @@ class FileStorage(StorageInterface):
         def load_csv(path: str, **kwargs: Any) -> pd.DataFrame:
             return cast(pd.DataFrame, pd.read_csv(path, **kwargs))
 
+        def save_csv_compressed(
+            df: pd.DataFrame,
+            path: str,
+            codec: str,
+            compression_level: int | None = None,
+            compression_threads: int = DEFAULT_ZSTD_THREADS,
+            **kwargs: Any,
+        ) -> None:
+            kwargs["compression"] = pandas_compression(
+                codec, compression_level, compression_threads if codec == "zst" else None
+            )
+            save_csv(df, path, **kwargs)
+
+        def load_csv_compressed(path: str, codec: str, **kwargs: Any) -> pd.DataFrame:
+            # A pandas folyamatosan tömörít ki (chunksize esetén is)
+            return load_csv(path, compression=pandas_compression(codec), **kwargs)
+
         def save_excel(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
             kwargs.setdefault("index", False)  # Alapértelmezetten ne mentse az indexet
             # Excel esetén közvetlen mentés
@@ -70,14 +177,111 @@ class FileStorage(StorageInterface):
         def load_excel(path: str, **kwargs: Any) -> pd.DataFrame:
             return cast(pd.DataFrame, pd.read_excel(path, **kwargs))
 
-        def save_json(obj: Any, path: str, **kwargs: Any) -> None:
-            # JSON esetén közvetlen mentés
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(obj, f, **kwargs)
-
-        def load_json(path: str, **kwargs: Any) -> Any:
-            with open(path, encoding="utf-8") as f:
-                return json.load(f, **kwargs)
+        def encode_json(obj: Any, **kwargs: Any) -> bytes:
+            # A gyors codec-et csak akkor használjuk, ha minden paramétert ismer
+            codec = self._json_codec if self._json_codec.accepts(kwargs) else None
+            return (codec or self._stdlib_json_codec).dumps(obj, **kwargs)
+
+        def save_json(
+            obj: Any,
+            path: str,
+            codec: str | None = None,
+            compression_level: int | None = None,
+            compression_threads: int | None = None,
+            **kwargs: Any,
+        ) -> None:
+            payload = encode_json(obj, **kwargs)
+            with open_compressed(path, "wb", codec, compression_level, compression_threads) as f:
+                f.write(payload)
+
+        def load_json(path: str, codec: str | None = None, **kwargs: Any) -> Any:
+            with open_compressed(path, "rb", codec) as f:
+                data = f.read()
+            if kwargs:
+                return self._stdlib_json_codec.loads(data, **kwargs)
+            return self._json_codec.loads(data)
+
+        def save_jsonl(
+            obj: Any,
+            path: str,
+            codec: str | None = None,
+            compression_level: int | None = None,
+            compression_threads: int | None = None,
+            **kwargs: Any,
+        ) -> None:
+            # Soronkénti kódolás: a teljes dokumentum sosem kerül a memóriába
+            json_codec = self._json_codec if self._json_codec.accepts(kwargs) else None
+            dumps = (json_codec or self._stdlib_json_codec).dumps
+            with open_compressed(path, "wb", codec, compression_level, compression_threads) as f:
+                for row in obj:
+                    f.write(dumps(row, **kwargs))
+                    f.write(b"\n")
+
+        def load_jsonl(
+            path: str, codec: str | None = None, as_array: bool = False, **kwargs: Any
+        ) -> Any:
+            rows = list(self._iter_jsonl(path, codec, **kwargs))
+            return np.asarray(rows) if as_array else rows
+
+        def save_parquet(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
+            pa, pq, _ = self._import_pyarrow()
+            kwargs.setdefault("compression", "snappy")
+            table = pa.Table.from_pandas(df, preserve_index=kwargs.pop("index", False))
+            pq.write_table(table, path, **kwargs)
+
+        def load_parquet(
+            path: str,
+            columns: list[str] | None = None,
+            filters: list | None = None,
+            **kwargs: Any,
+        ) -> pd.DataFrame:
+            _, pq, _ = self._import_pyarrow()
+            # Oszlop- és row group szintű pushdown, memory-mapped olvasással
+            kwargs.setdefault("memory_map", True)
+            table = pq.read_table(path, columns=columns, filters=filters, **kwargs)
+            return cast(pd.DataFrame, table.to_pandas())
+
+        def save_feather(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
+            _, _, feather = self._import_pyarrow()
+            if not kwargs.pop("index", False):
+                df = df.reset_index(drop=True)
+            feather.write_feather(df, path, **kwargs)
+
+        def save_arrow(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
+            # Tömörítetlen IPC fájl, hogy a betöltés zero-copy memory map legyen
+            kwargs.setdefault("compression", "uncompressed")
+            save_feather(df, path, **kwargs)
+
+        def load_feather(
+            path: str,
+            columns: list[str] | None = None,
+            filters: list | None = None,
+            **kwargs: Any,
+        ) -> pd.DataFrame:
+            _, pq, feather = self._import_pyarrow()
+            kwargs.setdefault("memory_map", True)
+            if filters and columns is not None:
+                # A szűrt oszlopokat is be kell olvasni
+                read_columns = list(dict.fromkeys([*columns, *self._filter_columns(filters)]))
+            else:
+                read_columns = columns
+            table = feather.read_table(path, columns=read_columns, **kwargs)
+            if filters:
+                table = table.filter(pq.filters_to_expression(filters))
+            if read_columns != columns:
+                table = table.select(columns)
+            return cast(pd.DataFrame, table.to_pandas())
+
+        def save_npy(obj: Any, path: str, **kwargs: Any) -> None:
+            kwargs.setdefault("allow_pickle", False)
+            # Fájl objektumba írunk, hogy a numpy ne fűzzön .npy kiterjesztést a névhez
+            with open(path, "wb") as f:
+                np.save(f, np.asarray(obj), **kwargs)
+
+        def load_npy(path: str, **kwargs: Any) -> Any:
+            kwargs.setdefault("mmap_mode", "r")
+            kwargs.setdefault("allow_pickle", False)
+            return np.load(path, **kwargs)
 
         self._DATAFRAME_FORMATS: dict[str, dict[str, Callable[..., Any]]] = {
             "csv": {
@@ -88,18 +292,174 @@ class FileStorage(StorageInterface):
                 "save": save_excel,
                 "load": load_excel,
             },
+            "parquet": {
+                "save": save_parquet,
+                "load": load_parquet,
+            },
+            "feather": {
+                "save": save_feather,
+                "load": load_feather,
+            },
+            "arrow": {
+                "save": save_arrow,
+                "load": load_feather,
+            },
+            "ipc": {
+                "save": save_arrow,
+                "load": load_feather,
+            },
         }
 
+        # Tömörített szöveges formátumok (pl. csv.zst, json.gz); a tömörítési
+        # szint a compression_level, a zstd szálak száma a compression_threads
+        # paraméterrel állítható
+        for codec in COMPRESSION_CODECS:
+            self._DATAFRAME_FORMATS[f"csv.{codec}"] = {
+                "save": functools.partial(save_csv_compressed, codec=codec),
+                "load": functools.partial(load_csv_compressed, codec=codec),
+            }
+
+        # Formátumok, amelyek betöltője maga kezeli a columns/filters paramétereket
+        self._PUSHDOWN_FORMATS: set[str] = {"parquet", "feather", "arrow", "ipc"}
+
         self._OBJECT_FORMATS: dict[str, dict[str, Callable[..., Any]]] = {
             "json": {
                 "save": save_json,
                 "load": load_json,
+                # Előre kódolható: a méretellenőrzés a kész bájtokon történik
+                "encode": encode_json,
+            },
+            "jsonl": {
+                "save": save_jsonl,
+                "load": load_jsonl,
+            },
+            "npy": {
+                "save": save_npy,
+                "load": load_npy,
+            },
+        }
+
+        for codec in COMPRESSION_CODECS:
+            self._OBJECT_FORMATS[f"json.{codec}"] = {
+                "save": functools.partial(save_json, codec=codec),
+                "load": functools.partial(load_json, codec=codec),
+            }
+            self._OBJECT_FORMATS[f"jsonl.{codec}"] = {
+                "save": functools.partial(save_jsonl, codec=codec),
+                "load": functools.partial(load_jsonl, codec=codec),
             }
+
+    @staticmethod
+    def _import_pyarrow() -> tuple[Any, Any, Any]:
+        """Lazy import a pyarrow csomag számára.
+
+        Returns:
+            A (pyarrow, pyarrow.parquet, pyarrow.feather) modulok
+
+        Raises:
+            StorageFormatError: Ha a pyarrow nincs telepítve
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise StorageFormatError(
+                "A Parquet/Feather/Arrow formátumokhoz a pyarrow csomag szükséges"
+            ) from e
+        return pa, pq, feather
+
+    @classmethod
+    def _filter_columns(cls, filters: list) -> list[str]:
+        """A szűrőkben hivatkozott oszlopok listája.
+
+        Args:
+            filters: A szűrők
+
+        Returns:
+            Az oszlopnevek listája (ismétlés nélkül)
+        """
+        names = [name for conj in normalize_filters(filters) for name, _, _ in conj]
+        return list(dict.fromkeys(names))
+
+    @classmethod
+    def _apply_filters(cls, df: pd.DataFrame, filters: list) -> pd.DataFrame:
+        """Sorszűrők alkalmazása egy pandas DataFrame-re.
+
+        A pyarrow szűrő szintaxisát követi, így a pushdown-t nem támogató
+        formátumok (CSV, Excel) ugyanazokkal a szűrőkkel használhatók.
+
+        Args:
+            df: A szűrendő DataFrame
+            filters: Egyszerű vagy DNF szűrők ('=', '==', '!=', '<', '<=', '>',
+                '>=', 'in', 'not in' operátorokkal)
+
+        Returns:
+            A szűrt DataFrame
+
+        Raises:
+            StorageFormatError: Ha a szűrő operátora ismeretlen
+        """
+        operators: dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+            "=": lambda col, val: col == val,
+            "==": lambda col, val: col == val,
+            "!=": lambda col, val: col != val,
+            "<": lambda col, val: col < val,
+            "<=": lambda col, val: col <= val,
+            ">": lambda col, val: col > val,
+            ">=": lambda col, val: col >= val,
+            "in": lambda col, val: col.isin(val),
+            "not in": lambda col, val: ~col.isin(val),
         }
 
+        mask = pd.Series(False, index=df.index)
+        for conjunction in normalize_filters(filters):
+            conj_mask = pd.Series(True, index=df.index)
+            for name, op, value in conjunction:
+                if op not in operators:
+                    raise StorageFormatError(f"Nem támogatott szűrő operátor: {op}")
+                conj_mask &= operators[op](df[name], value)
+            mask |= conj_mask
+        return df[mask]
+
+    def _get_capability(self, directory: Path) -> _DirectoryCapability:
+        """Visszaadja (szükség esetén létrehozza) a könyvtár cache bejegyzését.
+
+        A hívónak a _capabilities_lock-ot birtokolnia kell.
+
+        Args:
+            directory: A célkönyvtár
+
+        Returns:
+            _DirectoryCapability: A könyvtár cache bejegyzése
+        """
+        capability = self._capabilities.get(directory)
+        if capability is None:
+            capability = _DirectoryCapability()
+            self._capabilities[directory] = capability
+        return capability
+
+    def invalidate_capability_cache(self, directory: str | Path | None = None) -> None:
+        """Érvényteleníti a könyvtáranként cache-elt jogosultság- és helyinformációkat.
+
+        Args:
+            directory: A könyvtár, amelynek bejegyzését törölni kell
+                (ha None, akkor az összes bejegyzés törlődik)
+        """
+        with self._capabilities_lock:
+            if directory is None:
+                self._capabilities.clear()
+            else:
+                self._capabilities.pop(self._get_full_path(directory), None)
+
     def _check_disk_space(self, file_path: Path, required_bytes: int) -> None:
         """Check if there's enough disk space for the operation.
 
+        The free space of the target directory is cached for capability_ttl
+        seconds and decremented locally by every successful check, so hot
+        write paths do not issue a statvfs call per save. If the cached value
+        looks insufficient, it is refreshed once before failing.
+
         Args:
             file_path: The target file path
             required_bytes: Required bytes for the operation
@@ -107,20 +467,43 @@ class FileStorage(StorageInterface):
         Raises:
             InsufficientDiskSpaceError: If there's not enough disk space
         """
-        try:
-            stat = os.statvfs(file_path.parent)
-            free_bytes = stat.f_bavail * stat.f_frsize
+        directory = file_path.parent
+        now = time.monotonic()
+
+        with self._capabilities_lock:
+            capability = self._get_capability(directory)
+            needs_refresh = (
+                capability.free_bytes is None
+                or now - capability.space_checked_at > self._capability_ttl
+                or capability.free_bytes < required_bytes
+            )
+
+            if needs_refresh:
+                try:
+                    stat = os.statvfs(directory)
+                except OSError as e:
+                    self._capabilities.pop(directory, None)
+                    raise StorageIOError(f"Failed to check disk space: {e}") from e
+                capability.free_bytes = stat.f_bavail * stat.f_frsize
+                capability.space_checked_at = now
+
+            free_bytes = cast(int, capability.free_bytes)
             if free_bytes < required_bytes:
                 raise InsufficientDiskSpaceError(
                     f"Insufficient disk space: {free_bytes / 1024 / 1024:.2f} MB available, "
                     f"{required_bytes / 1024 / 1024:.2f} MB required"
                 )
-        except OSError as e:
-            raise StorageIOError(f"Failed to check disk space: {e}") from e
+
+            # A következő frissítésig helyben tartjuk nyilván a lefoglalt helyet
+            capability.free_bytes = free_bytes - required_bytes
 
     def _check_permissions(self, file_path: Path, check_write: bool = True) -> None:
         """Ellenőrzi a fájl/könyvtár jogosultságokat.
 
+        A szülőkönyvtár létezését és írhatóságát capability_ttl másodpercig
+        cache-eljük. Csak a sikeres ellenőrzések kerülnek a cache-be, így egy
+        hibás könyvtár minden hívásnál újra ellenőrzésre kerül.
+
         Args:
             file_path: A célfájl útvonala
             check_write: Ha True, ellenőrzi az írási jogosultságot is
@@ -129,16 +512,34 @@ class FileStorage(StorageInterface):
             PermissionDeniedError: Ha a jogosultságok nem megfelelőek
             StorageIOError: Ha az útvonal ellenőrzése sikertelen
         """
-        try:
-            if not file_path.parent.exists():
-                raise PermissionDeniedError(f"Parent directory does not exist: {file_path.parent}")
+        directory = file_path.parent
+        now = time.monotonic()
 
-            if check_write and not os.access(str(file_path.parent), os.W_OK):
-                raise PermissionDeniedError(
-                    f"No write permission for directory: {file_path.parent}"
+        try:
+            with self._capabilities_lock:
+                capability = self._capabilities.get(directory)
+                is_fresh = (
+                    capability is not None
+                    and capability.writable is not None
+                    and now - capability.permissions_checked_at <= self._capability_ttl
+                    and (capability.writable or not check_write)
                 )
 
-            if file_path.exists() and not os.access(str(file_path), os.R_OK):
+            if not is_fresh:
+                if not directory.exists():
+                    raise PermissionDeniedError(f"Parent directory does not exist: {directory}")
+
+                writable = os.access(str(directory), os.W_OK)
+                if check_write and not writable:
+                    raise PermissionDeniedError(f"No write permission for directory: {directory}")
+
+                with self._capabilities_lock:
+                    capability = self._get_capability(directory)
+                    capability.writable = writable
+                    capability.permissions_checked_at = now
+
+            # Egy hívás a gyakori esetben (létező, olvasható fájl vagy új fájl írása)
+            if not os.access(str(file_path), os.R_OK) and file_path.exists():
                 raise PermissionDeniedError(f"No read permission for file: {file_path}")
         except OSError as e:
             raise StorageIOError(f"Failed to check permissions: {e}") from e
@@ -183,6 +584,25 @@ class FileStorage(StorageInterface):
         path = Path(path)
         return path if path.is_absolute() else self._base_path / path
 
+    def _detect_format(self, full_path: Path) -> str:
+        """A formátum meghatározása a fájl kiterjesztéséből.
+
+        Tömörített fájloknál a két utolsó kiterjesztés együtt adja a formátumot
+        (pl. 'data.csv.zst' -> 'csv.zst').
+
+        Args:
+            full_path: A fájl útvonala
+
+        Returns:
+            str: A formátum neve (üres, ha a fájlnak nincs kiterjesztése)
+        """
+        suffixes = [suffix.lower().lstrip(".") for suffix in full_path.suffixes[-2:]]
+        if len(suffixes) == 2 and suffixes[1] in COMPRESSION_CODECS:
+            compound = ".".join(suffixes)
+            if compound in self._DATAFRAME_FORMATS or compound in self._OBJECT_FORMATS:
+                return compound
+        return full_path.suffix.lower().lstrip(".")
+
     def _atomic_write(
         self,
         file_path: Path,
@@ -256,6 +676,8 @@ class FileStorage(StorageInterface):
         df: pd.DataFrame,
         path: str,
         fmt: str | None = None,
+        columns: list[str] | None = None,
+        filters: list | None = None,
         **kwargs: Any,
     ) -> None:
         """Menti a DataFrame objektumot.
@@ -264,6 +686,8 @@ class FileStorage(StorageInterface):
             df: A mentendő DataFrame
             path: A mentés útvonala
             fmt: A mentés formátuma (ha None, akkor a kiterjesztésből)
+            columns: Csak ezen oszlopok mentése (opcionális)
+            filters: Sorszűrők pyarrow szintaxisban, pl. [('symbol', '=', 'EURUSD')]
             **kwargs: További formátum-specifikus paraméterek
 
         Raises:
@@ -275,7 +699,7 @@ class FileStorage(StorageInterface):
         full_path = self._get_full_path(path)
 
         if fmt is None:
-            fmt = full_path.suffix.lower().lstrip(".")
+            fmt = self._detect_format(full_path)
             if not fmt:
                 raise StorageFormatError("Nem sikerült meghatározni a fájl formátumát")
 
@@ -288,20 +712,73 @@ class FileStorage(StorageInterface):
         # Ellenőrizzük a jogosultságokat
         self._check_permissions(full_path, check_write=True)
 
+        # Csak a kért sorok és oszlopok kerülnek mentésre
+        if filters:
+            df = self._apply_filters(df, filters)
+        if columns is not None:
+            df = df[columns]
+
         # Ellenőrizzük a lemezterületet (becsült méret alapján)
-        try:
-            estimated_size = df.memory_usage(deep=True).sum()
+        estimated_size = self._estimate_dataframe_size(df)
+        if estimated_size is not None:
             self._check_disk_space(full_path, int(estimated_size * 1.1))
-        except (InsufficientDiskSpaceError, StorageIOError):
-            raise
+
+        self._write_dataframe(df, full_path, fmt, **kwargs)
+
+    def _estimate_dataframe_size(self, df: pd.DataFrame) -> int | None:
+        """Becsüli a DataFrame mentéséhez szükséges lemezterületet.
+
+        A numerikus oszlopok mérete a sekély memory_usage()-ből jön, a szöveges
+        (object/string) oszlopoké pedig legfeljebb _SIZE_SAMPLE_ROWS elem
+        mintájából extrapolálva. Így nem kell minden Python stringet bejárni,
+        mint a memory_usage(deep=True) esetén.
+
+        Args:
+            df: A mentendő DataFrame
+
+        Returns:
+            A becsült méret bájtban, vagy None, ha nem becsülhető
+        """
+        try:
+            size = int(df.memory_usage(index=True, deep=False).sum())
+            rows = len(df)
+            if rows == 0:
+                return size
+
+            step = max(1, rows // self._SIZE_SAMPLE_ROWS)
+            for name, dtype in df.dtypes.items():
+                if not pd.api.types.is_object_dtype(dtype) and not isinstance(
+                    dtype, pd.StringDtype
+                ):
+                    continue
+                sample = df[name].iloc[::step].iloc[: self._SIZE_SAMPLE_ROWS]
+                average = sum(len(str(value)) for value in sample) / max(1, len(sample))
+                size += int(average * rows)
+            return size
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"Could not estimate DataFrame size: {e}")
+            return None
+
+    def _write_dataframe(self, df: pd.DataFrame, full_path: Path, fmt: str, **kwargs: Any) -> None:
+        """DataFrame kiírása az ellenőrzések után.
 
+        Args:
+            df: A mentendő DataFrame
+            full_path: A célfájl teljes útvonala
+            fmt: A már ellenőrzött formátum
+            **kwargs: További formátum-specifikus paraméterek
+
+        Raises:
+            StorageIOError: Ha a mentés sikertelen
+        """
         try:
             full_path.parent.mkdir(parents=True, exist_ok=True)
             self._DATAFRAME_FORMATS[fmt]["save"](df, str(full_path), **kwargs)
+            self.invalidate_dir_index(full_path.parent)
         except OSError as e:
+            # A cache-elt könyvtárinformáció valószínűleg elavult
+            self.invalidate_capability_cache(full_path.parent)
             if self.logger:
                 self.logger.error(f"IO hiba a DataFrame mentése során: {full_path}")
             raise StorageIOError(f"Hiba a DataFrame mentése során: {str(e)}") from e
@@ -316,13 +793,21 @@ class FileStorage(StorageInterface):
         self,
         path: str,
         fmt: str | None = None,
+        columns: list[str] | None = None,
+        filters: list | None = None,
         **kwargs: Any,
     ) -> pd.DataFrame:
         """Betölti a DataFrame objektumot.
 
+        Parquet és Feather/Arrow IPC formátum esetén a fájl memory-mapped módon
+        nyílik meg, és a columns/filters paraméterek már olvasáskor szűkítik a
+        dekódolt adatot. A többi formátumnál a szűrés betöltés után történik.
+
         Args:
             path: A betöltendő fájl útvonala
             fmt: A fájl formátuma (ha None, akkor a kiterjesztésből)
+            columns: Csak ezen oszlopok betöltése (opcionális)
+            filters: Sorszűrők pyarrow szintaxisban, pl. [('bid', '>', 1.1)]
             **kwargs: További formátum-specifikus paraméterek
 
         Returns:
@@ -342,7 +827,7 @@ class FileStorage(StorageInterface):
         self._check_permissions(full_path, check_write=False)
 
         if fmt is None:
-            fmt = full_path.suffix.lower().lstrip(".")
+            fmt = self._detect_format(full_path)
             if not fmt:
                 raise StorageFormatError("Nem sikerült meghatározni a fájl formátumát")
 
@@ -353,10 +838,19 @@ class FileStorage(StorageInterface):
             )
 
         try:
-            return cast(
-                pd.DataFrame,
-                self._DATAFRAME_FORMATS[fmt]["load"](str(full_path), **kwargs),
-            )
+            loader = self._DATAFRAME_FORMATS[fmt]["load"]
+            if fmt in self._PUSHDOWN_FORMATS:
+                return cast(
+                    pd.DataFrame,
+                    loader(str(full_path), columns=columns, filters=filters, **kwargs),
+                )
+
+            df = cast(pd.DataFrame, loader(str(full_path), **kwargs))
+            if filters:
+                df = self._apply_filters(df, filters)
+            if columns is not None:
+                df = df[columns]
+            return df
         except OSError as e:
             if self.logger:
                 self.logger.error(f"IO hiba a DataFrame betöltése során: {full_path}")
@@ -391,7 +885,7 @@ class FileStorage(StorageInterface):
         full_path = self._get_full_path(path)
 
         if fmt is None:
-            fmt = full_path.suffix.lower().lstrip(".")
+            fmt = self._detect_format(full_path)
             if not fmt:
                 raise StorageFormatError("Nem sikerült meghatározni a fájl formátumát")
 
@@ -404,23 +898,134 @@ class FileStorage(StorageInterface):
         # Ellenőrizzük a jogosultságokat
         self._check_permissions(full_path, check_write=True)
 
-        # Ellenőrizzük a lemezterületet (becsült méret alapján)
-        try:
-            import sys
+        # Előre kódolható formátumnál a pontos méretet ellenőrizzük,
+        # és a már kódolt bájtokat írjuk ki (nincs kétszeres szerializáció)
+        if self.can_encode(fmt):
+            payload = self.encode_object(obj, fmt, **kwargs)
+            self._check_disk_space(full_path, int(len(payload) * 1.1))
+            self._write_payload(payload, full_path)
+            return
 
-            estimated_size = sys.getsizeof(str(obj))
+        # Ellenőrizzük a lemezterületet (becsült méret alapján)
+        estimated_size = self._estimate_object_size(obj)
+        if estimated_size is not None:
             self._check_disk_space(full_path, int(estimated_size * 1.1))
-        except (InsufficientDiskSpaceError, StorageIOError):
-            raise
+
+        self._write_object(obj, full_path, fmt, **kwargs)
+
+    def _estimate_object_size(self, obj: Any) -> int | None:
+        """Becsüli az objektum mentéséhez szükséges lemezterületet.
+
+        Numpy tömböknél a bináris méret háromszorosával számolunk (szöveges
+        formátumok esetén ennyi egy float tipikus hossza). Sorozatoknál és
+        mapping-eknél (dict) legfeljebb _SIZE_SAMPLE_ROWS elem, illetve
+        kulcs-érték pár kódolt méretéből extrapolálunk, így a teljes objektumot
+        nem kell a becsléshez szerializálni. Tömörített formátumnál (json.zst,
+        json.gz) ez a tömörítetlen méret, tehát felső becslés.
+
+        Args:
+            obj: A mentendő objektum
+
+        Returns:
+            A becsült méret bájtban, vagy None, ha nem becsülhető
+        """
+        try:
+            if isinstance(obj, np.ndarray):
+                return int(obj.nbytes * 3)
+            if isinstance(obj, Sequence) and not isinstance(obj, str | bytes) and obj:
+                sample = obj[: self._SIZE_SAMPLE_ROWS]
+                encoded = sum(len(self._json_codec.dumps(item)) + 1 for item in sample)
+                return int(encoded / len(sample) * len(obj))
+            if isinstance(obj, Mapping) and obj:
+                pairs = list(itertools.islice(obj.items(), self._SIZE_SAMPLE_ROWS))
+                encoded = sum(len(self._json_codec.dumps(dict([pair]))) for pair in pairs)
+                return int(encoded / len(pairs) * len(obj))
+            return sys.getsizeof(obj)
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"Could not estimate object size: {e}")
+            return None
+
+    def can_encode(self, fmt: str) -> bool:
+        """Előre, a memóriában kódolható objektum formátum-e (lásd encode_object()).
 
+        Args:
+            fmt: A formátum
+
+        Returns:
+            bool: True, ha az objektum formátum bájtokká kódolható fájlírás nélkül
+        """
+        handlers = self._OBJECT_FORMATS.get(fmt)
+        return handlers is not None and "encode" in handlers
+
+    def encode_object(self, obj: Any, fmt: str, **kwargs: Any) -> bytes:
+        """Objektum kódolása egy előre kódolható formátumba.
+
+        A kimenet bájtra megegyezik azzal, amit a save_object() ugyanezzel a
+        formátummal és paraméterekkel kiírna.
+
+        Args:
+            obj: A kódolandó objektum
+            fmt: A formátum (lásd can_encode())
+            **kwargs: További formátum-specifikus paraméterek
+
+        Returns:
+            bytes: A kódolt tartalom
+
+        Raises:
+            StorageFormatError: Ha a formátum nem kódolható előre
+            StorageSerializationError: Ha az objektum nem szerializálható
+        """
+        if not self.can_encode(fmt):
+            raise StorageFormatError(f"A(z) {fmt} formátum nem kódolható előre")
+        try:
+            return cast(bytes, self._OBJECT_FORMATS[fmt]["encode"](obj, **kwargs))
+        except (TypeError, ValueError) as e:
+            raise StorageSerializationError(f"Az objektum nem szerializálható: {str(e)}") from e
+
+    def _write_payload(self, payload: bytes, full_path: Path) -> None:
+        """Már kódolt tartalom kiírása.
+
+        Args:
+            payload: A kiírandó bájtok
+            full_path: A célfájl teljes útvonala
+
+        Raises:
+            StorageIOError: Ha a mentés sikertelen
+        """
+        try:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(full_path, "wb") as f:
+                f.write(payload)
+            self.invalidate_dir_index(full_path.parent)
+        except OSError as e:
+            # A cache-elt könyvtárinformáció valószínűleg elavult
+            self.invalidate_capability_cache(full_path.parent)
+            raise StorageIOError(f"Hiba az objektum mentése során: {str(e)}") from e
+
+    def _write_object(self, obj: Any, full_path: Path, fmt: str, **kwargs: Any) -> None:
+        """Objektum kiírása az ellenőrzések után.
+
+        Args:
+            obj: A mentendő objektum
+            full_path: A célfájl teljes útvonala
+            fmt: A már ellenőrzött formátum
+            **kwargs: További formátum-specifikus paraméterek
+
+        Raises:
+            StorageSerializationError: Ha az objektum nem szerializálható
+            StorageIOError: Ha a mentés sikertelen
+        """
         try:
             full_path.parent.mkdir(parents=True, exist_ok=True)
             self._OBJECT_FORMATS[fmt]["save"](obj, str(full_path), **kwargs)
+            self.invalidate_dir_index(full_path.parent)
         except (TypeError, ValueError) as e:
             raise StorageSerializationError(f"Az objektum nem szerializálható: {str(e)}") from e
+        except OSError as e:
+            # A cache-elt könyvtárinformáció valószínűleg elavult
+            self.invalidate_capability_cache(full_path.parent)
+            raise StorageIOError(f"Hiba az objektum mentése során: {str(e)}") from e
         except Exception as e:
             raise StorageIOError(f"Hiba az objektum mentése során: {str(e)}") from e
 
@@ -455,7 +1060,7 @@ class FileStorage(StorageInterface):
         self._check_permissions(full_path, check_write=False)
 
         if fmt is None:
-            fmt = full_path.suffix.lower().lstrip(".")
+            fmt = self._detect_format(full_path)
             if not fmt:
                 raise StorageFormatError("Nem sikerült meghatározni a fájl formátumát")
 
@@ -493,7 +1098,10 @@ class FileStorage(StorageInterface):
         Returns:
             bool: True, ha létezik, False ha nem
         """
-        return self._get_full_path(path).exists()
+        full_path = self._get_full_path(path)
+        if self._dir_index is not None:
+            return self._dir_index.lookup(full_path) is not None
+        return full_path.exists()
 
     def get_metadata(self, path: str) -> dict[str, Any]:
         """Lekéri a fájl vagy könyvtár metaadatait.
@@ -509,6 +1117,12 @@ class FileStorage(StorageInterface):
             StorageIOError: Ha a lekérés sikertelen
         """
         full_path = self._get_full_path(path)
+        if self._dir_index is not None:
+            info = self._dir_index.lookup(full_path)
+            if info is None:
+                raise StorageNotFoundError(f"Fájl nem található: {full_path}")
+            return info.to_metadata()
+
         try:
             if not full_path.exists():
                 raise StorageNotFoundError(f"Fájl nem található: {full_path}")
@@ -548,6 +1162,8 @@ class FileStorage(StorageInterface):
                 full_path.unlink()
             else:
                 full_path.rmdir()  # Csak üres könyvtárakat törlünk
+            self.invalidate_dir_index(full_path.parent)
+            self.invalidate_dir_index(full_path)
 
         except Exception as e:
             raise StorageIOError(f"Hiba a törlés során: {str(e)}") from e
@@ -559,6 +1175,10 @@ class FileStorage(StorageInterface):
     ) -> Sequence[Path]:
         """Listázza egy könyvtár tartalmát.
 
+        Egyszerű (útvonal-elválasztót nem tartalmazó) minták esetén a listázás
+        os.scandir alapon történik, összetett glob mintáknál (pl. '**/*.csv')
+        a Path.glob() fut.
+
         Args:
             path: A könyvtár útvonala
             pattern: Szűrő minta a fájlnevekre
@@ -570,14 +1190,541 @@ class FileStorage(StorageInterface):
             StorageNotFoundError: Ha a könyvtár nem található
             StorageIOError: Ha a listázás sikertelen
         """
+        pattern = pattern or "*"
+        if "/" not in pattern and os.sep not in pattern and "**" not in pattern:
+            return [info.path for info in self.scan_dir(path, pattern)]
+
+        full_path = self._resolve_directory(path)
+        try:
+            return list(full_path.glob(pattern))
+        except Exception as e:
+            raise StorageIOError(f"Hiba a könyvtár listázása során: {str(e)}") from e
+
+    def scan_dir(
+        self,
+        path: str,
+        pattern: str | None = None,
+        recursive: bool = False,
+    ) -> Iterator[DirEntryInfo]:
+        """Könyvtár bejegyzéseinek folyamatos listázása stat adatokkal.
+
+        A bejegyzések típusa a scandir eredményéből, a méret és az időbélyegek
+        bejegyzésenként egyetlen stat hívásból származnak, így a hívónak nem
+        kell külön exists()/get_metadata() hívásokat tennie. Indexelt módban
+        a változatlan mtime-ú könyvtárak a memóriából szolgálódnak ki.
+
+        Args:
+            path: A könyvtár útvonala
+            pattern: fnmatch minta a bejegyzések nevére (a rekurziót nem szűri)
+            recursive: Az alkönyvtárak bejárása is
+
+        Returns:
+            Iterator[DirEntryInfo]: A bejegyzések (indexelt módban könyvtáranként
+            név szerint rendezve)
+
+        Raises:
+            StorageNotFoundError: Ha a könyvtár nem található
+            StorageIOError: Ha az útvonal nem könyvtár, vagy a listázás sikertelen
+        """
+        full_path = self._resolve_directory(path)
+        return self._scan_dir(full_path, pattern, recursive)
+
+    def _scan_dir(
+        self, root: Path, pattern: str | None, recursive: bool, after: Path | None = None
+    ) -> Iterator[DirEntryInfo]:
+        """A scan_dir() generátor törzse.
+
+        Args:
+            root: A bejárás gyökérkönyvtára
+            pattern: fnmatch minta a bejegyzések nevére
+            recursive: Az alkönyvtárak bejárása is
+            after: Folytatás ezután a bejegyzés után (lapozási kurzor)
+
+        Yields:
+            A mintának megfelelő bejegyzések
+
+        Raises:
+            StorageValidationError: Ha a kurzor bejegyzése már nem létezik
+        """
+        cursor = str(after) if after is not None else None
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            subdirectories: list[Path] = []
+            try:
+                entries: Iterator[DirEntryInfo]
+                if cursor is not None:
+                    entries, cursor = self._skip_to_cursor(
+                        directory, cursor, recursive, subdirectories
+                    )
+                elif self._dir_index is not None:
+                    entries = iter(self._dir_index.get(directory).values())
+                else:
+                    entries = scan_entries(directory)
+
+                for info in entries:
+                    # A könyvtárra mutató linkeket nem követjük (ciklusok elkerülése)
+                    if recursive and info.is_dir and not info.is_symlink:
+                        subdirectories.append(info.path)
+                    if pattern is None or fnmatch.fnmatch(info.name, pattern):
+                        yield info
+            except OSError as e:
+                if directory == root:
+                    raise StorageIOError(f"Hiba a könyvtár listázása során: {str(e)}") from e
+                # Az olvashatatlan alkönyvtárakat kihagyjuk
+                if self.logger:
+                    self.logger.warning(f"Könyvtár kihagyva a listázás során: {directory} ({e})")
+                continue
+
+            # Fordított sorrend, hogy a bejárás a listázási sorrendet kövesse
+            stack.extend(reversed(subdirectories))
+
+        if cursor is not None:
+            raise StorageValidationError(
+                f"A lapozási kurzor bejegyzése már nem létezik: {cursor}"
+            )
+
+    def _skip_to_cursor(
+        self, directory: Path, cursor: str, recursive: bool, subdirectories: list[Path]
+    ) -> tuple[Iterator[DirEntryInfo], str | None]:
+        """Egy könyvtár bejegyzéseinek átlépése a lapozási kurzorig.
+
+        Az átlépett bejegyzésekhez nem kell stat hívás, csak a bejárási
+        sorrend (a scandir típusinformációja), így a folytatás költsége nem a
+        már visszaadott oldalak stat hívásaival nő.
+
+        Args:
+            directory: A könyvtár
+            cursor: A kurzor bejegyzés teljes útvonala
+            recursive: Az alkönyvtárak bejárása is
+            subdirectories: Az átlépett alkönyvtárak ide kerülnek (a bejáráshoz)
+
+        Returns:
+            tuple: A kurzor utáni bejegyzések és a megmaradt kurzor (None, ha
+            a kurzor ebben a könyvtárban volt)
+
+        Raises:
+            OSError: Ha a könyvtár nem olvasható
+        """
+        if self._dir_index is not None:
+            infos = list(self._dir_index.get(directory).values())
+            for position, info in enumerate(infos):
+                if recursive and info.is_dir and not info.is_symlink:
+                    subdirectories.append(info.path)
+                if str(info.path) == cursor:
+                    return iter(infos[position + 1 :]), None
+            return iter(()), cursor
+
+        with os.scandir(directory) as iterator:
+            dir_entries = list(iterator)
+        for position, entry in enumerate(dir_entries):
+            if recursive and entry.is_dir() and not entry.is_symlink():
+                subdirectories.append(Path(entry.path))
+            if entry.path == cursor:
+                return self._entry_infos(dir_entries[position + 1 :]), None
+        return iter(()), cursor
+
+    @staticmethod
+    def _entry_infos(dir_entries: list[os.DirEntry[str]]) -> Iterator[DirEntryInfo]:
+        """Scandir bejegyzések stat adatainak folyamatos lekérdezése.
+
+        Args:
+            dir_entries: A bejegyzések
+
+        Yields:
+            A bejegyzések adatai (a közben törölteket kihagyja)
+        """
+        for entry in dir_entries:
+            try:
+                yield DirEntryInfo.from_dir_entry(entry)
+            except FileNotFoundError:
+                continue
+
+    def list_dir_page(
+        self,
+        path: str,
+        pattern: str | None = None,
+        recursive: bool = False,
+        offset: int = 0,
+        limit: int = 1000,
+        cursor: str | None = None,
+    ) -> DirListingPage:
+        """Könyvtár bejegyzéseinek lapozott listázása.
+
+        A lapozás a scan_dir() sorrendjét követi; stabil (név szerinti)
+        sorrend a dir_index=True beállítással érhető el.
+
+        Teljes bejáráshoz a next_cursor értékét érdemes a következő hívás
+        cursor paraméterének átadni. Az offset szerinti lapozás minden oldalnál
+        az elejétől bejárja (index nélkül stat-olja is) az előző oldalak
+        bejegyzéseit, így a teljes lapozás O(n²); a kurzor a bejárásban folytat,
+        az előző bejegyzéseket stat nélkül lépi át.
+
+        Args:
+            path: A könyvtár útvonala
+            pattern: fnmatch minta a bejegyzések nevére
+            recursive: Az alkönyvtárak bejárása is
+            offset: Az első visszaadott bejegyzés sorszáma (kurzor esetén 0)
+            limit: Az oldal maximális mérete
+            cursor: Az előző oldal next_cursor értéke (folytatás utána)
+
+        Returns:
+            DirListingPage: Az oldal bejegyzései, a következő oldal kezdete és kurzora
+
+        Raises:
+            StorageNotFoundError: Ha a könyvtár nem található
+            StorageIOError: Ha a listázás sikertelen
+            StorageValidationError: Ha az offset, a limit vagy a kurzor érvénytelen
+                (pl. a kurzor bejegyzését azóta törölték)
+        """
+        if offset < 0 or limit <= 0 or (cursor is not None and offset):
+            raise StorageValidationError(
+                f"Érvénytelen lapozási paraméterek: offset={offset}, limit={limit}, "
+                f"cursor={cursor}"
+            )
+
+        full_path = self._resolve_directory(path)
+        after = full_path / cursor if cursor is not None else None
+
+        # Egy plusz bejegyzés jelzi, hogy van-e következő oldal
+        iterator = self._scan_dir(full_path, pattern, recursive, after)
+        entries = list(itertools.islice(iterator, offset, offset + limit + 1))
+        if len(entries) > limit:
+            entries = entries[:limit]
+            return DirListingPage(
+                entries=entries,
+                next_offset=offset + limit,
+                next_cursor=entries[-1].path.relative_to(full_path).as_posix(),
+            )
+        return DirListingPage(entries=entries, next_offset=None)
+
+    def invalidate_dir_index(self, directory: str | Path | None = None) -> None:
+        """Érvényteleníti a könyvtárindexet.
+
+        A FileStorage saját írásai automatikusan érvénytelenítik az érintett
+        könyvtárat; külső folyamatok helyben történő fájlmódosításai után
+        (amelyek a könyvtár mtime-ját nem változtatják) kell kézzel hívni.
+
+        Args:
+            directory: A könyvtár (ha None, a teljes index törlődik)
+        """
+        if self._dir_index is None:
+            return
+        if directory is None:
+            self._dir_index.invalidate()
+        else:
+            self._dir_index.invalidate(self._get_full_path(directory))
+
+    def _resolve_directory(self, path: str) -> Path:
+        """Listázandó könyvtár teljes útvonala, ellenőrzéssel.
+
+        Args:
+            path: A könyvtár útvonala
+
+        Returns:
+            Path: A teljes útvonal
+
+        Raises:
+            StorageNotFoundError: Ha a könyvtár nem található
+            StorageIOError: Ha az útvonal nem könyvtár
+        """
         full_path = self._get_full_path(path)
         if not full_path.exists():
             raise StorageNotFoundError(f"Könyvtár nem található: {full_path}")
         if not full_path.is_dir():
             raise StorageIOError(f"Az útvonal nem könyvtár: {full_path}")
+        return full_path
 
-        try:
-            pattern = pattern or "*"
-            return list(full_path.glob(pattern))
-        except Exception as e:
-            raise StorageIOError(f"Hiba a könyvtár listázása során: {str(e)}") from e
+    def iter_jsonl(self, path: str, **kwargs: Any) -> Iterator[Any]:
+        """JSON-lines fájl soronkénti, folyamatos beolvasása.
+
+        Nagy tömbök vagy rekordlisták esetén a teljes tartalom sosem kerül
+        egyszerre a memóriába.
+
+        Args:
+            path: A .jsonl fájl útvonala
+            **kwargs: json.loads paraméterek (ilyenkor a standard codec fut)
+
+        Returns:
+            Iterator[Any]: A dekódolt sorok
+
+        Raises:
+            StorageNotFoundError: Ha a fájl nem található
+        """
+        full_path = self._get_full_path(path)
+        if not full_path.exists():
+            raise StorageNotFoundError(f"Fájl nem található: {full_path}")
+        self._check_permissions(full_path, check_write=False)
+        return self._iter_jsonl(str(full_path), codec_from_path(full_path), **kwargs)
+
+    def _iter_jsonl(self, path: str, codec: str | None, **kwargs: Any) -> Iterator[Any]:
+        """Az iter_jsonl() generátor törzse.
+
+        Args:
+            path: A .jsonl fájl teljes útvonala
+            codec: A fájl tömörítése ('zst', 'gz' vagy None)
+            **kwargs: json.loads paraméterek
+
+        Yields:
+            A dekódolt sorok
+        """
+        if kwargs:
+            loads = functools.partial(self._stdlib_json_codec.loads, **kwargs)
+        else:
+            loads = self._json_codec.loads
+        with open_compressed(path, "rb", codec) as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
+    # --- Aszinkron és kötegelt API ---
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Visszaadja (szükség esetén létrehozza) a korlátos szálkészletet.
+
+        Returns:
+            ThreadPoolExecutor: A FileStorage saját executora
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="file-storage"
+            )
+        return self._executor
+
+    async def _run_in_executor(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Szinkron függvény futtatása a szálkészletben.
+
+        Args:
+            func: A futtatandó függvény
+            *args: Pozicionális argumentumok
+            **kwargs: Kulcsszavas argumentumok
+
+        Returns:
+            Any: A függvény visszatérési értéke
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Leállítja az aszinkron műveletek szálkészletét.
+
+        Args:
+            wait: Ha True, megvárja a folyamatban lévő műveleteket
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    async def asave_dataframe(
+        self, df: pd.DataFrame, path: str, fmt: str | None = None, **kwargs: Any
+    ) -> None:
+        """A save_dataframe() aszinkron változata."""
+        await self._run_in_executor(self.save_dataframe, df, path, fmt, **kwargs)
+
+    async def aload_dataframe(
+        self, path: str, fmt: str | None = None, **kwargs: Any
+    ) -> pd.DataFrame:
+        """A load_dataframe() aszinkron változata."""
+        return cast(
+            pd.DataFrame, await self._run_in_executor(self.load_dataframe, path, fmt, **kwargs)
+        )
+
+    async def asave_object(
+        self, obj: Any, path: str, fmt: str | None = None, **kwargs: Any
+    ) -> None:
+        """A save_object() aszinkron változata."""
+        await self._run_in_executor(self.save_object, obj, path, fmt, **kwargs)
+
+    async def aload_object(self, path: str, fmt: str | None = None, **kwargs: Any) -> Any:
+        """A load_object() aszinkron változata."""
+        return await self._run_in_executor(self.load_object, path, fmt, **kwargs)
+
+    async def aexists(self, path: str) -> bool:
+        """Az exists() aszinkron változata."""
+        return cast(bool, await self._run_in_executor(self.exists, path))
+
+    async def aget_metadata(self, path: str) -> dict[str, Any]:
+        """A get_metadata() aszinkron változata."""
+        return cast(dict[str, Any], await self._run_in_executor(self.get_metadata, path))
+
+    async def adelete(self, path: str) -> None:
+        """A delete() aszinkron változata."""
+        await self._run_in_executor(self.delete, path)
+
+    async def alist_dir(self, path: str, pattern: str | None = None) -> Sequence[Path]:
+        """A list_dir() aszinkron változata."""
+        return cast(Sequence[Path], await self._run_in_executor(self.list_dir, path, pattern))
+
+    async def alist_dir_page(
+        self,
+        path: str,
+        pattern: str | None = None,
+        recursive: bool = False,
+        offset: int = 0,
+        limit: int = 1000,
+        cursor: str | None = None,
+    ) -> DirListingPage:
+        """A list_dir_page() aszinkron változata."""
+        return cast(
+            DirListingPage,
+            await self._run_in_executor(
+                self.list_dir_page, path, pattern, recursive, offset, limit, cursor
+            ),
+        )
+
+    def resolve_format(self, path: Path, fmt: str | None = None, data: Any = None) -> str:
+        """Meghatározza és ellenőrzi egy mentendő vagy betöltendő elem formátumát.
+
+        Args:
+            path: Az elem útvonala (a kiterjesztés számít)
+            fmt: A megadott formátum (ha None, akkor a kiterjesztésből)
+            data: Mentésnél az adat; DataFrame esetén DataFrame, egyébként
+                objektum formátum kell (None: bármelyik)
+
+        Returns:
+            str: Az ellenőrzött formátum
+
+        Raises:
+            StorageFormatError: Ha a formátum nem határozható meg vagy nem támogatott
+        """
+        if fmt is None:
+            fmt = self._detect_format(path)
+            if not fmt:
+                raise StorageFormatError("Nem sikerült meghatározni a fájl formátumát")
+
+        if isinstance(data, pd.DataFrame):
+            supported = self._DATAFRAME_FORMATS
+        elif data is not None:
+            supported = self._OBJECT_FORMATS
+        else:
+            supported = {**self._DATAFRAME_FORMATS, **self._OBJECT_FORMATS}
+
+        if fmt not in supported:
+            raise StorageFormatError(
+                f"Nem támogatott formátum: {fmt}. Támogatott formátumok: {list(supported.keys())}"
+            )
+        return fmt
+
+    async def save_many(
+        self,
+        items: Mapping[str, Any],
+        fmt: str | None = None,
+        **kwargs: Any,
+    ) -> list[BatchItemResult]:
+        """Több DataFrame és/vagy objektum párhuzamos mentése.
+
+        A jogosultság- és lemezterület-ellenőrzés célkönyvtáranként egyszer
+        fut le, az összes oda kerülő elem becsült méretére. Az elemek ezután
+        párhuzamosan, a szálkészlet méretéig korlátozva íródnak ki. A hibák
+        nem szakítják meg a köteget, hanem az adott elem eredményébe kerülnek.
+
+        Args:
+            items: Útvonal -> mentendő adat (DataFrame vagy objektum) leképezés
+            fmt: Közös formátum (ha None, akkor elemenként a kiterjesztésből)
+            **kwargs: További formátum-specifikus paraméterek
+
+        Returns:
+            list[BatchItemResult]: Elemenkénti eredmények a bemenet sorrendjében
+
+        Example:
+            >>> results = await storage.save_many({
+            ...     "features/eurusd.parquet": features_df,
+            ...     "features/eurusd.json": {"window": 20},
+            ... })
+            >>> failed = [r for r in results if not r.success]
+        """
+        results: dict[str, BatchItemResult] = {}
+        payloads: dict[str, bytes] = {}
+        by_directory: dict[Path, list[tuple[str, Path, str, Any]]] = {}
+
+        for path, data in items.items():
+            try:
+                full_path = self._get_full_path(path)
+                item_fmt = self.resolve_format(full_path, fmt, data)
+                by_directory.setdefault(full_path.parent, []).append(
+                    (path, full_path, item_fmt, data)
+                )
+            except Exception as e:
+                results[path] = BatchItemResult(path=path, success=False, error=e)
+
+        async def check_directory(entries: list[tuple[str, Path, str, Any]]) -> None:
+            def check() -> None:
+                self._check_permissions(entries[0][1], check_write=True)
+                total = 0
+                for path, _, item_fmt, data in entries:
+                    if isinstance(data, pd.DataFrame):
+                        size = self._estimate_dataframe_size(data)
+                    elif self.can_encode(item_fmt):
+                        payloads[path] = self.encode_object(data, item_fmt, **kwargs)
+                        size = len(payloads[path])
+                    else:
+                        size = self._estimate_object_size(data)
+                    total += size or 0
+                self._check_disk_space(entries[0][1], int(total * 1.1))
+
+            await self._run_in_executor(check)
+
+        async def write(path: str, full_path: Path, item_fmt: str, data: Any) -> None:
+            try:
+                if isinstance(data, pd.DataFrame):
+                    await self._run_in_executor(
+                        self._write_dataframe, data, full_path, item_fmt, **kwargs
+                    )
+                elif path in payloads:
+                    await self._run_in_executor(self._write_payload, payloads[path], full_path)
+                else:
+                    await self._run_in_executor(
+                        self._write_object, data, full_path, item_fmt, **kwargs
+                    )
+                results[path] = BatchItemResult(path=path, success=True)
+            except Exception as e:
+                results[path] = BatchItemResult(path=path, success=False, error=e)
+
+        async def save_directory(entries: list[tuple[str, Path, str, Any]]) -> None:
+            try:
+                await check_directory(entries)
+            except Exception as e:
+                for path, _, _, _ in entries:
+                    results[path] = BatchItemResult(path=path, success=False, error=e)
+                return
+            await asyncio.gather(*(write(*entry) for entry in entries))
+
+        await asyncio.gather(*(save_directory(entries) for entries in by_directory.values()))
+
+        return [results[path] for path in items]
+
+    async def load_many(
+        self,
+        paths: Sequence[str],
+        fmt: str | None = None,
+        **kwargs: Any,
+    ) -> list[BatchItemResult]:
+        """Több fájl párhuzamos betöltése.
+
+        Az elemek típusát (DataFrame vagy objektum) a formátum határozza meg.
+        A hibák nem szakítják meg a köteget, hanem az adott elem eredményébe
+        kerülnek.
+
+        Args:
+            paths: A betöltendő fájlok útvonalai
+            fmt: Közös formátum (ha None, akkor elemenként a kiterjesztésből)
+            **kwargs: További formátum-specifikus paraméterek
+
+        Returns:
+            list[BatchItemResult]: Elemenkénti eredmények a bemenet sorrendjében
+        """
+
+        async def load(path: str) -> BatchItemResult:
+            try:
+                item_fmt = self.resolve_format(self._get_full_path(path), fmt)
+                if item_fmt in self._DATAFRAME_FORMATS:
+                    value = await self.aload_dataframe(path, item_fmt, **kwargs)
+                else:
+                    value = await self.aload_object(path, item_fmt, **kwargs)
+                return BatchItemResult(path=path, success=True, value=value)
+            except Exception as e:
+                return BatchItemResult(path=path, success=False, error=e)
+
+        return list(await asyncio.gather(*(load(path) for path in paths)))
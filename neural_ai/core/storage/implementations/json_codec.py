@@ -0,0 +1,230 @@
+"""JSON codec-ek a FileStorage objektum formátumaihoz.
+
+A modulban található:
+    - JsonCodec: Absztrakt alaposztály a JSON kódolókhoz
+    - OrjsonCodec: orjson alapú, natív numpy és datetime támogatással
+    - MsgspecCodec: msgspec alapú codec
+    - StdlibJsonCodec: A standard json modulra épülő tartalék codec
+    - get_json_codec: A kért (vagy a leggyorsabb elérhető) codec kiválasztása
+
+A gyors codec-ek opcionális függőségek, lazy importtal töltődnek be, és
+csak kérésre (json_codec='orjson', 'msgspec' vagy 'auto') kerülnek
+használatra. Amit a gyors codec nem tud a standard json modullal azonosan
+kódolni (pl. 64 bitnél nagyobb egész), azt a standard json modul kódolja.
+A NaN és ±Inf értékeket az orjson null-ként írja, a standard json modul
+nem szabványos NaN/Infinity tokenként.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from typing import Any
+
+import numpy as np
+
+from neural_ai.core.storage.exceptions import StorageFormatError
+
+
+def _default(obj: Any) -> Any:
+    """Közös tartalék szerializáló a natívan nem támogatott típusokhoz.
+
+    Args:
+        obj: A szerializálandó objektum
+
+    Returns:
+        Any: JSON-kompatibilis reprezentáció
+
+    Raises:
+        TypeError: Ha az objektum típusa nem szerializálható
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, datetime | date | time):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JsonCodec(ABC):
+    """Absztrakt alaposztály a JSON codec-ekhez.
+
+    Attribútumok:
+        name: A codec neve (pl. 'orjson')
+        supported_options: A dumps() által értelmezett kulcsszavas paraméterek
+    """
+
+    name: str = ""
+    supported_options: frozenset[str] = frozenset({"indent", "sort_keys", "default"})
+
+    @abstractmethod
+    def dumps(self, obj: Any, **kwargs: Any) -> bytes:
+        """Objektum kódolása UTF-8 JSON bájtsorozattá.
+
+        Args:
+            obj: A kódolandó objektum (numpy tömbök és datetime értékek is)
+            **kwargs: indent, sort_keys vagy default
+
+        Returns:
+            bytes: A kódolt JSON
+        """
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """JSON dekódolása Python objektummá.
+
+        Args:
+            data: A dekódolandó JSON
+
+        Returns:
+            Any: A dekódolt objektum
+        """
+
+    def accepts(self, options: dict[str, Any]) -> bool:
+        """Ellenőrzi, hogy a codec kezeli-e az összes megadott paramétert.
+
+        Args:
+            options: A hívó által megadott kulcsszavas paraméterek
+
+        Returns:
+            bool: True, ha minden paraméter támogatott
+        """
+        return options.keys() <= self.supported_options
+
+
+class StdlibJsonCodec(JsonCodec):
+    """A standard json modulra épülő codec (mindig elérhető)."""
+
+    name = "json"
+    supported_options = frozenset()
+
+    def accepts(self, options: dict[str, Any]) -> bool:
+        """A standard json modul minden json.dumps paramétert elfogad."""
+        return True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> bytes:
+        """Objektum kódolása a json modullal."""
+        kwargs.setdefault("default", _default)
+        return json.dumps(obj, **kwargs).encode("utf-8")
+
+    def loads(self, data: bytes | str, **kwargs: Any) -> Any:
+        """JSON dekódolása a json modullal."""
+        return json.loads(data, **kwargs)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson alapú codec natív numpy és datetime szerializációval.
+
+    Az indentálás csak 2 szóközzel támogatott; más indent esetén a
+    FileStorage a standard json modult használja.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Inicializálja az OrjsonCodec-et.
+
+        Raises:
+            ImportError: Ha az orjson nincs telepítve
+        """
+        import orjson
+
+        self._orjson = orjson
+        self._fallback = StdlibJsonCodec()
+
+    def accepts(self, options: dict[str, Any]) -> bool:
+        """Ellenőrzi a paramétereket; indent csak None vagy 2 lehet."""
+        return super().accepts(options) and options.get("indent") in (None, 2)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> bytes:
+        """Objektum kódolása orjson-nal (hiba esetén a json modullal)."""
+        option = self._orjson.OPT_SERIALIZE_NUMPY | self._orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= self._orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys"):
+            option |= self._orjson.OPT_SORT_KEYS
+        try:
+            return self._orjson.dumps(obj, default=kwargs.get("default", _default), option=option)
+        except TypeError:
+            # JSONEncodeError (TypeError): pl. 64 bitnél nagyobb egész
+            return self._fallback.dumps(obj, **kwargs)
+
+    def loads(self, data: bytes | str) -> Any:
+        """JSON dekódolása orjson-nal (NaN/Infinity tokeneknél a json modullal)."""
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec alapú codec."""
+
+    name = "msgspec"
+    supported_options = frozenset({"default"})
+
+    def __init__(self) -> None:
+        """Inicializálja a MsgspecCodec-et.
+
+        Raises:
+            ImportError: Ha a msgspec nincs telepítve
+        """
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+        self._fallback = StdlibJsonCodec()
+
+    def dumps(self, obj: Any, **kwargs: Any) -> bytes:
+        """Objektum kódolása msgspec-kel (hiba esetén a json modullal)."""
+        try:
+            if "default" in kwargs:
+                return self._msgspec.json.encode(obj, enc_hook=kwargs["default"])
+            return self._encoder.encode(obj)
+        except (TypeError, ValueError, OverflowError, self._msgspec.EncodeError):
+            return self._fallback.dumps(obj, **kwargs)
+
+    def loads(self, data: bytes | str) -> Any:
+        """JSON dekódolása msgspec-kel (hiba esetén a json modullal)."""
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError:
+            return self._fallback.loads(data)
+
+
+_CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibJsonCodec,
+}
+
+
+def get_json_codec(name: str = "json") -> JsonCodec:
+    """A kért JSON codec példányosítása.
+
+    Args:
+        name: 'orjson', 'msgspec', 'json' vagy 'auto' (a leggyorsabb elérhető)
+
+    Returns:
+        JsonCodec: A codec példány
+
+    Raises:
+        StorageFormatError: Ha a codec ismeretlen vagy a függősége nincs telepítve
+    """
+    if name == "auto":
+        for codec_class in _CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+
+    if name not in _CODECS:
+        raise StorageFormatError(
+            f"Ismeretlen JSON codec: {name}. Támogatott codec-ek: {['auto', *_CODECS]}"
+        )
+
+    try:
+        return _CODECS[name]()
+    except ImportError as e:
+        raise StorageFormatError(f"A(z) {name} JSON codec nincs telepítve") from e
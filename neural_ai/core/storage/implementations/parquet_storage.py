@@ -12,6 +12,7 @@ Version: 2.0.0
 """
 
 import asyncio
+import functools
 import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -23,6 +24,7 @@ from neural_ai.core.base.implementations.singleton import SingletonMeta
 
 if TYPE_CHECKING:
     from neural_ai.core.storage.backends.base import StorageBackend
+    from neural_ai.core.storage.implementations.tick_csv_importer import TickImportStats
     from neural_ai.core.utils.interfaces.hardware_interface import HardwareInterface
 
 
@@ -104,7 +106,7 @@ class ParquetStorageService(metaclass=SingletonMeta):
             self.backend = PandasBackend()
             logger.warning("Legacy CPU detected. Running in Compatibility Mode with PandasBackend.")
 
-    def _get_path(self, symbol: str, date: datetime) -> Path:
+    def get_partition_path(self, symbol: str, date: datetime) -> Path:
         """Elérési út generálása a megadott szimbólumhoz és dátumhoz.
 
         Args:
@@ -117,7 +119,7 @@ class ParquetStorageService(metaclass=SingletonMeta):
         Example:
             >>> service = ParquetStorageService()
             >>> date = datetime(2023, 12, 23)
-            >>> path = service._get_path('EURUSD', date)
+            >>> path = service.get_partition_path('EURUSD', date)
             >>> print(path)
             /data/tick/EURUSD/tick/year=2023/month=12/day=23/data.parquet
         """
@@ -165,7 +167,7 @@ class ParquetStorageService(metaclass=SingletonMeta):
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
 
-        path = self._get_path(symbol, date)
+        path = self.get_partition_path(symbol, date)
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Adatok tárolása a kiválasztott backend-en keresztül
@@ -181,6 +183,46 @@ class ParquetStorageService(metaclass=SingletonMeta):
             backend=self.backend.name,
         )
 
+    async def import_tick_csv(
+        self, symbol: str, csv_path: str | Path, **kwargs: Any
+    ) -> "TickImportStats":
+        """Tetszőleges méretű tick CSV export importálása a napi partíciókba.
+
+        A CSV chunkokban, korlátos memóriával kerül feldolgozásra (lásd
+        TickCsvImporter); a blokkoló munka egy executor szálban fut.
+
+        Args:
+            symbol: A pénzpár szimbóluma
+            csv_path: A CSV fájl útvonala
+            **kwargs: A TickCsvImporter.run() paraméterei (column_map,
+                timestamp_format, if_exists, progress, ...) és a konstruktor
+                paraméterei (block_size, max_open_days)
+
+        Returns:
+            TickImportStats: Az import eredménye (sorok, napok, átviteli sebesség)
+
+        Example:
+            >>> service = ParquetStorageService()
+            >>> stats = await service.import_tick_csv(
+            ...     'EURUSD',
+            ...     'EURUSD_ticks.csv.gz',
+            ...     column_map={'Gmt time': 'timestamp', 'Bid': 'bid', 'Ask': 'ask'},
+            ...     timestamp_format='%d.%m.%Y %H:%M:%S',
+            ... )
+            >>> print(f"{stats.rows_written} rows, {stats.mb_per_second:.1f} MB/s")
+        """
+        from neural_ai.core.storage.implementations.tick_csv_importer import TickCsvImporter
+
+        importer_options = {
+            key: kwargs.pop(key) for key in ("block_size", "max_open_days") if key in kwargs
+        }
+        importer = TickCsvImporter(self, **importer_options)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(importer.run, csv_path, symbol, **kwargs)
+        )
+
     async def read_tick_data(self, symbol: str, start_date: datetime, end_date: datetime) -> Any:
         """Tick adatok olvasása dátumtartományból.
 
@@ -207,7 +249,7 @@ class ParquetStorageService(metaclass=SingletonMeta):
         # Összes releváns fájl megtalálása
         current_date = start_date
         while current_date <= end_date:
-            path = self._get_path(symbol, current_date)
+            path = self.get_partition_path(symbol, current_date)
             if path.exists():
                 paths.append(path)
             current_date += timedelta(days=1)
@@ -355,7 +397,7 @@ class ParquetStorageService(metaclass=SingletonMeta):
             >>> checksum = await service.calculate_checksum('EURUSD', datetime.now())
             >>> print(f"Checksum: {checksum}")
         """
-        path = self._get_path(symbol, date)
+        path = self.get_partition_path(symbol, date)
 
         if not path.exists():
             return ""
@@ -387,7 +429,7 @@ class ParquetStorageService(metaclass=SingletonMeta):
             >>> is_valid = await service.verify_data_integrity('EURUSD', datetime.now())
             >>> print(f"Data integrity: {is_valid}")
         """
-        path = self._get_path(symbol, date)
+        path = self.get_partition_path(symbol, date)
 
         if not path.exists():
             return False
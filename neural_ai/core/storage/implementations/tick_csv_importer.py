@@ -0,0 +1,588 @@
+"""Chunkolt CSV -> Parquet konverzió a napi particionált tick adattárba.
+
+A modulban található:
+    - TickImportStats: Az import haladása és eredménye (sorok, bájtok, átviteli sebesség)
+    - TickCsvImporter: Tetszőleges méretű broker CSV export folyamatos importálása
+
+A CSV pyarrow.csv streaming olvasóval, fix méretű blokkokban kerül
+feldolgozásra; minden blokk a tick sémára (timestamp, bid, ask, volume,
+source) normalizálódik, majd nap szerint szétválogatva közvetlenül a
+ParquetStorageService által használt year=/month=/day= partíciókba íródik.
+A memóriahasználatot a blokkméret és a nyitott napi írók száma korlátozza.
+
+Author: Neural AI Next Team
+Version: 2.0.0
+"""
+
+import csv
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from neural_ai.core.storage.implementations.parquet_storage import ParquetStorageService
+
+
+logger = structlog.get_logger()
+
+# A tick partíciók sémájának oszlopai
+TICK_COLUMNS: tuple[str, ...] = ("timestamp", "bid", "ask", "volume", "source")
+REQUIRED_TICK_COLUMNS: tuple[str, ...] = ("timestamp", "bid", "ask")
+
+# Fájlkiterjesztés -> pyarrow tömörítés (más kiterjesztés: tömörítetlen CSV)
+_COMPRESSION_SUFFIXES: dict[str, str] = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+    ".bz2": "bz2",
+    ".lz4": "lz4",
+}
+
+_MICROSECONDS_PER_DAY = 86_400_000_000
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class TickImportStats:
+    """Egy tick import haladása, illetve végeredménye.
+
+    Attributes:
+        symbol: A pénzpár szimbóluma
+        source_path: Az importált CSV fájl
+        total_bytes: A CSV fájl mérete a lemezen
+        bytes_read: Az eddig beolvasott bájtok (tömörített fájlnál a tömörített méret)
+        rows_read: Az eddig beolvasott sorok
+        rows_written: A partíciókba írt sorok
+        rows_dropped: Hiányzó timestamp/bid/ask miatt eldobott sorok
+        days: A megírt napok (dátum szerint rendezve)
+        elapsed_seconds: Az import kezdete óta eltelt idő
+    """
+
+    symbol: str
+    source_path: str
+    total_bytes: int
+    bytes_read: int = 0
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_dropped: int = 0
+    days: list[datetime] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def percent(self) -> float:
+        """A feldolgozott bájtok aránya százalékban."""
+        if self.total_bytes <= 0:
+            return 100.0
+        return min(100.0, 100.0 * self.bytes_read / self.total_bytes)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Átviteli sebesség sorokban."""
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        """Átviteli sebesség MB/s-ban (a lemezen lévő bájtok alapján)."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_read / (1024 * 1024) / self.elapsed_seconds
+
+
+@dataclass
+class _DayWriter:
+    """Egy nap nyitott Parquet írója.
+
+    Attributes:
+        day: A nap sorszáma 1970-01-01 óta
+        final_path: A partíció végleges fájlja
+        tmp_path: Az írás alatt álló ideiglenes fájl
+        writer: A pyarrow ParquetWriter
+        merge_existing: A véglegesítéskor a meglévő fájllal össze kell fésülni
+        last_timestamp: Az utolsó megírt időbélyeg (mikroszekundum)
+        needs_sort: A nap adatai nem időrendben érkeztek
+    """
+
+    day: int
+    final_path: Path
+    tmp_path: Path
+    writer: Any
+    merge_existing: bool
+    last_timestamp: int | None = None
+    needs_sort: bool = False
+
+
+class TickCsvImporter:
+    """Broker CSV exportok folyamatos importálása a napi particionált tick tárba.
+
+    A CSV-t pyarrow.csv streaming olvasóval, block_size méretű blokkokban
+    dolgozza fel, így a fájl mérete nem korlátozott. Időrendben érkező adat
+    esetén minden nap egyetlen menetben íródik; a már lezárt napokra később
+    érkező sorok a nap véglegesítésekor kerülnek összefésülésre (ilyenkor egy
+    nap adatai egyszerre a memóriában vannak).
+
+    Attributes:
+        storage: A cél ParquetStorageService
+        block_size: Egy beolvasott CSV blokk mérete bájtban
+        max_open_days: Az egyszerre nyitott napi írók maximális száma
+        compression: A Parquet tömörítési algoritmusa
+        progress_interval: A progress callback hívásai közötti minimális idő (s)
+    """
+
+    def __init__(
+        self,
+        storage: "ParquetStorageService",
+        block_size: int = 16 * 1024 * 1024,
+        max_open_days: int = 2,
+        compression: str | None = None,
+        progress_interval: float = 1.0,
+    ) -> None:
+        """Inicializálja a TickCsvImporter-t.
+
+        Args:
+            storage: A cél ParquetStorageService
+            block_size: Egy beolvasott CSV blokk mérete bájtban
+            max_open_days: Az egyszerre nyitott napi írók maximális száma
+            compression: A Parquet tömörítése (alapértelmezett: a storage beállítása)
+            progress_interval: A progress callback hívásai közötti minimális idő (s)
+
+        Raises:
+            ValueError: Ha a block_size vagy a max_open_days nem pozitív
+        """
+        if block_size <= 0:
+            raise ValueError(f"A block_size értékének pozitívnak kell lennie: {block_size}")
+        if max_open_days <= 0:
+            raise ValueError(f"A max_open_days értékének pozitívnak kell lennie: {max_open_days}")
+
+        self.storage = storage
+        self.block_size = block_size
+        self.max_open_days = max_open_days
+        self.compression = compression or storage.compression
+        self.progress_interval = progress_interval
+
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pc = pc
+        self._pacsv = pacsv
+        self._pq = pq
+        self._schema = pa.schema(
+            [
+                ("timestamp", pa.timestamp("us")),
+                ("bid", pa.float64()),
+                ("ask", pa.float64()),
+                ("volume", pa.float64()),
+                ("source", pa.string()),
+            ]
+        )
+
+    def run(
+        self,
+        csv_path: str | Path,
+        symbol: str,
+        column_map: dict[str, str] | None = None,
+        column_names: list[str] | None = None,
+        delimiter: str = ",",
+        timestamp_format: str | None = None,
+        timestamp_unit: str | None = None,
+        source: str = "csv_import",
+        if_exists: str = "replace",
+        progress: Callable[[TickImportStats], None] | None = None,
+    ) -> TickImportStats:
+        """CSV fájl importálása a napi partíciókba.
+
+        Ha sem a timestamp_format, sem a timestamp_unit nincs megadva, az
+        időbélyeg oszlop típusa rögzítetten zónaeltolás nélküli ISO 8601
+        (pl. '2024-01-02 03:04:05.123'), UTC-ként értelmezve; nincs blokkonkénti
+        típuskövetkeztetés. Zónaeltolást tartalmazó vagy más formátumú
+        értékekhez a timestamp_format, epoch számokhoz a timestamp_unit kell.
+
+        Args:
+            csv_path: A CSV fájl (.gz, .zst, .bz2 és .lz4 tömörítés esetén is)
+            symbol: A pénzpár szimbóluma
+            column_map: CSV oszlopnév -> tick oszlopnév megfeleltetés
+                (pl. {'Gmt time': 'timestamp', 'Bid': 'bid'})
+            column_names: Oszlopnevek fejléc nélküli CSV esetén
+            delimiter: Mezőelválasztó karakter
+            timestamp_format: Az időbélyeg strptime formátuma (ha nem ISO 8601)
+            timestamp_unit: Egész epoch időbélyeg egysége ('s', 'ms', 'us', 'ns')
+            source: A source oszlop értéke, ha a CSV nem tartalmazza
+            if_exists: Meglévő napi partíció esetén 'replace' (felülírás)
+                vagy 'merge' (összefésülés időrendben)
+            progress: Callback, amely a haladást kapja (a hívó szálában fut)
+
+        Returns:
+            TickImportStats: Az import végeredménye
+
+        Raises:
+            FileNotFoundError: Ha a CSV fájl nem létezik
+            ValueError: Ha a paraméterek érvénytelenek, kötelező oszlop hiányzik,
+                vagy egy érték nem felel meg az időbélyeg formátumának
+                (pyarrow.ArrowInvalid)
+        """
+        path = Path(csv_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"CSV fájl nem található: {path}")
+        if if_exists not in ("replace", "merge"):
+            raise ValueError(f"Érvénytelen if_exists érték: {if_exists}")
+        if timestamp_format is not None and timestamp_unit is not None:
+            raise ValueError("A timestamp_format és a timestamp_unit egyszerre nem adható meg")
+
+        # Tick oszlop -> CSV oszlop
+        sources = {target: name for name, target in (column_map or {}).items()}
+        unknown = set(sources) - set(TICK_COLUMNS)
+        if unknown:
+            raise ValueError(f"Ismeretlen tick oszlopok a column_map-ben: {sorted(unknown)}")
+        for column in TICK_COLUMNS:
+            sources.setdefault(column, column)
+
+        stats = TickImportStats(
+            symbol=symbol.upper(), source_path=str(path), total_bytes=path.stat().st_size
+        )
+        writers: OrderedDict[int, _DayWriter] = OrderedDict()
+        finished_days: set[int] = set()
+        started = time.monotonic()
+        last_report = started
+
+        header = column_names or self._read_header(path, delimiter)
+        missing = [
+            sources[column] for column in REQUIRED_TICK_COLUMNS if sources[column] not in header
+        ]
+        if missing:
+            raise ValueError(f"Hiányzó kötelező oszlopok: {missing}")
+        present = [column for column in TICK_COLUMNS if sources[column] in header]
+
+        raw = self._pa.OSFile(str(path), "rb")
+        try:
+            reader = self._open_reader(
+                raw,
+                path,
+                sources,
+                present,
+                column_names,
+                delimiter,
+                timestamp_format,
+                timestamp_unit,
+            )
+
+            for batch in reader:
+                stats.rows_read += batch.num_rows
+                normalized = self._normalize_batch(batch, sources, timestamp_unit, source)
+                stats.rows_dropped += batch.num_rows - normalized.num_rows
+                stats.rows_written += self._write_batch(
+                    normalized, stats.symbol, if_exists, writers, finished_days
+                )
+
+                stats.bytes_read = raw.tell()
+                now = time.monotonic()
+                stats.elapsed_seconds = now - started
+                if progress is not None and now - last_report >= self.progress_interval:
+                    last_report = now
+                    progress(stats)
+
+            while writers:
+                self._finalize(writers.popitem(last=False)[1], finished_days)
+        except BaseException:
+            # A félkész ideiglenes fájlok nem maradhatnak a partíciókban
+            for day_writer in writers.values():
+                day_writer.writer.close()
+                day_writer.tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            raw.close()
+
+        stats.bytes_read = stats.total_bytes
+        stats.elapsed_seconds = time.monotonic() - started
+        stats.days = [_EPOCH + timedelta(days=day) for day in sorted(finished_days)]
+        if progress is not None:
+            progress(stats)
+
+        logger.info(
+            "Tick CSV import finished",
+            symbol=stats.symbol,
+            source_path=stats.source_path,
+            rows_written=stats.rows_written,
+            rows_dropped=stats.rows_dropped,
+            days=len(stats.days),
+            elapsed_seconds=round(stats.elapsed_seconds, 3),
+            rows_per_second=round(stats.rows_per_second),
+            mb_per_second=round(stats.mb_per_second, 2),
+        )
+        return stats
+
+    def _read_header(self, path: Path, delimiter: str) -> list[str]:
+        """A CSV fejlécsorának beolvasása (tömörített fájl esetén is).
+
+        Args:
+            path: A CSV fájl útvonala
+            delimiter: Mezőelválasztó karakter
+
+        Returns:
+            list[str]: Az oszlopnevek
+
+        Raises:
+            ValueError: Ha a fájl üres
+        """
+        with self._pa.input_stream(str(path)) as stream:
+            first_line = b""
+            while b"\n" not in first_line:
+                chunk = stream.read(64 * 1024)
+                if not chunk:
+                    break
+                first_line += chunk
+        line = first_line.split(b"\n", 1)[0].decode("utf-8-sig").rstrip("\r")
+        if not line:
+            raise ValueError(f"Üres CSV fájl: {path}")
+        return next(csv.reader([line], delimiter=delimiter))
+
+    def _open_reader(
+        self,
+        raw: Any,
+        path: Path,
+        sources: dict[str, str],
+        present: list[str],
+        column_names: list[str] | None,
+        delimiter: str,
+        timestamp_format: str | None,
+        timestamp_unit: str | None,
+    ) -> Any:
+        """A pyarrow streaming CSV olvasó megnyitása.
+
+        Az oszloptípusok előre rögzítettek, így a típuskövetkeztetés nem
+        térhet el az egyes blokkok között; az időbélyeg formátum nélkül is
+        rögzített (ISO 8601, lásd run()).
+
+        Args:
+            raw: A nyers (esetleg tömörített) bemeneti fájl
+            path: A CSV fájl útvonala (a tömörítés felismeréséhez)
+            sources: Tick oszlop -> CSV oszlop megfeleltetés
+            present: A CSV-ben megtalálható tick oszlopok
+            column_names: Oszlopnevek fejléc nélküli CSV esetén
+            delimiter: Mezőelválasztó karakter
+            timestamp_format: Az időbélyeg strptime formátuma
+            timestamp_unit: Egész epoch időbélyeg egysége
+
+        Returns:
+            pyarrow.csv.CSVStreamingReader: Az olvasó
+        """
+        pa = self._pa
+        stream = raw
+        compression = _COMPRESSION_SUFFIXES.get(path.suffix.lower())
+        if compression is not None:
+            stream = pa.CompressedInputStream(raw, compression)
+
+        column_types: dict[str, Any] = {
+            sources["bid"]: pa.float64(),
+            sources["ask"]: pa.float64(),
+            sources["volume"]: pa.float64(),
+            sources["source"]: pa.string(),
+        }
+        if timestamp_unit is not None:
+            column_types[sources["timestamp"]] = pa.int64()
+            timestamp_parsers = None
+        else:
+            column_types[sources["timestamp"]] = pa.timestamp("us")
+            timestamp_parsers = [timestamp_format or self._pacsv.ISO8601]
+
+        return self._pacsv.open_csv(
+            stream,
+            read_options=self._pacsv.ReadOptions(
+                block_size=self.block_size, column_names=column_names
+            ),
+            parse_options=self._pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=self._pacsv.ConvertOptions(
+                column_types=column_types,
+                include_columns=[sources[column] for column in present],
+                timestamp_parsers=timestamp_parsers,
+            ),
+        )
+
+    def _normalize_batch(
+        self, batch: Any, sources: dict[str, str], timestamp_unit: str | None, source: str
+    ) -> Any:
+        """Egy CSV blokk átalakítása a tick sémára.
+
+        Az időbélyegek naiv UTC mikroszekundumos értékekké alakulnak; a hiányzó
+        timestamp/bid/ask értékű sorok eldobásra kerülnek.
+
+        Args:
+            batch: A beolvasott RecordBatch
+            sources: Tick oszlop -> CSV oszlop megfeleltetés
+            timestamp_unit: Egész epoch időbélyeg egysége
+            source: A source oszlop értéke, ha a CSV nem tartalmazza
+
+        Returns:
+            pyarrow.RecordBatch: A normalizált blokk
+        """
+        pa, pc = self._pa, self._pc
+        columns = dict(zip(batch.schema.names, batch.columns, strict=True))
+        timestamps = columns[sources["timestamp"]]
+
+        if timestamp_unit is not None:
+            timestamps = timestamps.cast(pa.timestamp(timestamp_unit))
+        if timestamps.type.tz is not None:
+            # Időzónás érték: a tárolt egész már UTC, csak a típust cseréljük
+            timestamps = timestamps.cast(pa.int64()).cast(pa.timestamp(timestamps.type.unit))
+        timestamps = pc.cast(timestamps, pa.timestamp("us"), safe=False)
+
+        volumes = columns.get(sources["volume"])
+        if volumes is None:
+            volumes = pa.nulls(batch.num_rows, pa.float64())
+        source_values = columns.get(sources["source"])
+        if source_values is None:
+            source_values = pa.repeat(pa.scalar(source, pa.string()), batch.num_rows)
+
+        normalized = pa.RecordBatch.from_arrays(
+            [
+                timestamps,
+                columns[sources["bid"]],
+                columns[sources["ask"]],
+                volumes,
+                source_values,
+            ],
+            schema=self._schema,
+        )
+
+        valid = pc.and_(
+            pc.and_(pc.is_valid(normalized.column(0)), pc.is_valid(normalized.column(1))),
+            pc.is_valid(normalized.column(2)),
+        )
+        if valid.false_count:
+            normalized = normalized.filter(valid)
+        return normalized
+
+    def _write_batch(
+        self,
+        batch: Any,
+        symbol: str,
+        if_exists: str,
+        writers: OrderedDict[int, _DayWriter],
+        finished_days: set[int],
+    ) -> int:
+        """Egy normalizált blokk szétosztása és kiírása napok szerint.
+
+        Args:
+            batch: A normalizált RecordBatch
+            symbol: A pénzpár szimbóluma
+            if_exists: 'replace' vagy 'merge'
+            writers: A nyitott napi írók (LRU sorrendben)
+            finished_days: A már véglegesített napok
+
+        Returns:
+            int: A kiírt sorok száma
+        """
+        if batch.num_rows == 0:
+            return 0
+
+        pa, pc = self._pa, self._pc
+        micros = batch.column(0).cast(pa.int64())
+        days = pc.divide(micros, _MICROSECONDS_PER_DAY)
+        unique_days = pc.unique(days).to_pylist()
+
+        for day in unique_days:
+            part = batch if len(unique_days) == 1 else batch.filter(pc.equal(days, day))
+            day_writer = writers.get(day)
+            if day_writer is None:
+                day_writer = self._open_writer(day, symbol, if_exists, finished_days)
+                writers[day] = day_writer
+                while len(writers) > self.max_open_days:
+                    self._finalize(writers.popitem(last=False)[1], finished_days)
+            writers.move_to_end(day)
+
+            # Időrend ellenőrzése a blokkon belül és az előző blokkhoz képest
+            part_micros = part.column(0).cast(pa.int64())
+            first = part_micros[0].as_py()
+            if part.num_rows > 1:
+                ordered = pc.all(pc.greater_equal(part_micros[1:], part_micros[:-1])).as_py()
+                if not ordered:
+                    day_writer.needs_sort = True
+            if day_writer.last_timestamp is not None and first < day_writer.last_timestamp:
+                day_writer.needs_sort = True
+            last = pc.max(part_micros).as_py()
+            if day_writer.last_timestamp is None or last > day_writer.last_timestamp:
+                day_writer.last_timestamp = last
+
+            day_writer.writer.write_batch(part)
+
+        return int(batch.num_rows)
+
+    def _open_writer(
+        self, day: int, symbol: str, if_exists: str, finished_days: set[int]
+    ) -> _DayWriter:
+        """Napi Parquet író megnyitása egy ideiglenes fájlba.
+
+        Args:
+            day: A nap sorszáma 1970-01-01 óta
+            symbol: A pénzpár szimbóluma
+            if_exists: 'replace' vagy 'merge'
+            finished_days: A már véglegesített napok
+
+        Returns:
+            _DayWriter: A megnyitott író
+        """
+        final_path = self.storage.get_partition_path(symbol, _EPOCH + timedelta(days=day))
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = final_path.with_name(f"{final_path.name}.importing")
+
+        # Az importban már lezárt napot mindig össze kell fésülni
+        merge_existing = final_path.exists() and (if_exists == "merge" or day in finished_days)
+        writer = self._pq.ParquetWriter(
+            str(tmp_path), self._schema, compression=self.compression
+        )
+        return _DayWriter(
+            day=day,
+            final_path=final_path,
+            tmp_path=tmp_path,
+            writer=writer,
+            merge_existing=merge_existing,
+        )
+
+    def _finalize(self, day_writer: _DayWriter, finished_days: set[int]) -> None:
+        """Napi író lezárása és a partíció atomi cseréje.
+
+        Args:
+            day_writer: A lezárandó író
+            finished_days: A már véglegesített napok (kiegészül)
+        """
+        day_writer.writer.close()
+
+        if day_writer.merge_existing or day_writer.needs_sort:
+            # Egy nap adatai egyszerre a memóriában: csak a ritka esetben fordul elő
+            tables = [self._pq.read_table(str(day_writer.tmp_path))]
+            if day_writer.merge_existing:
+                existing = self._pq.read_table(str(day_writer.final_path))
+                tables.insert(0, self._conform_table(existing))
+            table = self._pa.concat_tables(tables).sort_by("timestamp")
+            self._pq.write_table(table, str(day_writer.tmp_path), compression=self.compression)
+
+        os.replace(day_writer.tmp_path, day_writer.final_path)
+        self.storage.backend.invalidate_footer(str(day_writer.final_path))
+        finished_days.add(day_writer.day)
+
+    def _conform_table(self, table: Any) -> Any:
+        """Egy meglévő partíció táblájának igazítása a tick sémához.
+
+        Args:
+            table: A meglévő partíció pyarrow táblája
+
+        Returns:
+            pyarrow.Table: A tick sémájú tábla (a hiányzó oszlopok null értékűek)
+        """
+        pa, pc = self._pa, self._pc
+        arrays = []
+        for schema_field in self._schema:
+            if schema_field.name in table.column_names:
+                arrays.append(
+                    pc.cast(table.column(schema_field.name), schema_field.type, safe=False)
+                )
+            else:
+                arrays.append(pa.nulls(table.num_rows, schema_field.type))
+        return pa.Table.from_arrays(arrays, schema=self._schema)
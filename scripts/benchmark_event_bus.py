@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""EventBus végponttól végpontig mért késleltetés és áteresztőképesség.
+
+Offline (hálózat nélkül) futtatható mérés a publish() hívástól a callback
+meghívásáig eltelt időre és a fenntartható eseményszámra. Lefedett esetek:
+
+    - transportok: inprocess (InProcessEventBus), zmq_inproc és tcp
+      (ZeroMQ-s EventBus inproc socketen, illetve TCP loopback-en)
+    - eseménytípusonkénti üzenetméret (minden esemény modellel)
+    - fan-out: 1 / 10 / 100 feliratkozó
+    - lassú fogyasztó: egy lassú és egy gyors feliratkozó, 'block' és
+      'drop_oldest' túlcsordulási szabállyal
+
+Az eredmény JSON (p50/p99/p999/max késleltetés µs-ban, áteresztőképesség
+esemény/s-ban, kézbesített és eldobott események), regressziókövetéshez.
+A késleltetés az esemény timestamp mezőjéből számolódik, amelyet a mérés
+közvetlenül a publish() előtt állít be.
+
+Használat:
+    python scripts/benchmark_event_bus.py --output bench.json
+    python scripts/benchmark_event_bus.py --quick --transport inprocess
+    python scripts/benchmark_event_bus.py --events 50000 --rate 20000
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from neural_ai.core.base.implementations.singleton import SingletonMeta  # noqa: E402
+from neural_ai.core.events.implementations.base_bus import BaseEventBus  # noqa: E402
+from neural_ai.core.events.implementations.codecs import get_codec  # noqa: E402
+from neural_ai.core.events.implementations.inprocess_bus import InProcessEventBus  # noqa: E402
+from neural_ai.core.events.interfaces.event_bus_interface import EventBusConfig  # noqa: E402
+from neural_ai.core.events.interfaces.event_models import (  # noqa: E402
+    MarketDataEvent,
+    OrderEvent,
+    PositionEvent,
+    SignalEvent,
+    SystemLogEvent,
+    TradeEvent,
+)
+
+TRANSPORTS = ("inprocess", "zmq_inproc", "tcp")
+FANOUTS = (1, 10, 100)
+
+_NOW = datetime(2024, 1, 2, 10, 30, tzinfo=UTC)
+SAMPLE_EVENTS: dict[str, BaseModel] = {
+    "market_data": MarketDataEvent(
+        symbol="EURUSD", timestamp=_NOW, bid=1.10412, ask=1.10415, volume=1200000, source="jforex"
+    ),
+    "trade": TradeEvent(
+        symbol="EURUSD",
+        timestamp=_NOW,
+        direction="BUY",
+        price=1.10415,
+        volume=0.5,
+        order_id="ord-000123",
+        strategy_id="mean_reversion",
+    ),
+    "signal": SignalEvent(
+        symbol="EURUSD",
+        timestamp=_NOW,
+        signal_type="ENTRY_LONG",
+        confidence=0.87,
+        strategy_id="mean_reversion",
+        price=1.10415,
+        target_price=1.107,
+        stop_loss=1.102,
+    ),
+    "system_log": SystemLogEvent(
+        timestamp=_NOW,
+        level="INFO",
+        component="collector.jforex",
+        message="Kapcsolat helyreállítva",
+        extra_data={"reconnects": 3, "latency_ms": 12.5},
+    ),
+    "order": OrderEvent(
+        order_id="ord-000123",
+        timestamp=_NOW,
+        symbol="EURUSD",
+        order_type="LIMIT",
+        direction="BUY",
+        volume=0.5,
+        price=1.104,
+        status="PENDING",
+    ),
+    "position": PositionEvent(
+        position_id="pos-000042",
+        timestamp=_NOW,
+        symbol="EURUSD",
+        direction="LONG",
+        volume=0.5,
+        entry_price=1.104,
+        current_price=1.10415,
+        profit_loss=7.5,
+        status="OPEN",
+    ),
+}
+
+
+@dataclass
+class Scenario:
+    """Egy mérési eset.
+
+    Attributes:
+        name: Az eset neve (regressziókövetési kulcs)
+        transport: 'inprocess', 'zmq_inproc' vagy 'tcp'
+        event_type: A közzétett eseménytípus
+        fanout: A feliratkozók száma
+        slow_consumers: Ebből ennyi lassú feliratkozó
+        slow_delay: A lassú feliratkozók callback ideje másodpercben
+        overflow: A feliratkozói sorok túlcsordulási szabálya
+        queue_size: A feliratkozói sorok mérete
+    """
+
+    name: str
+    transport: str
+    event_type: str = "market_data"
+    fanout: int = 1
+    slow_consumers: int = 0
+    slow_delay: float = 0.0
+    overflow: str = "block"
+    queue_size: int = 10000
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Késleltetés összesítők.
+
+    Args:
+        values: A mért értékek (µs)
+
+    Returns:
+        dict[str, float]: p50, p99, p999, max és mean
+    """
+    if not values:
+        return {"p50": 0.0, "p99": 0.0, "p999": 0.0, "max": 0.0, "mean": 0.0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+
+    def at(q: float) -> float:
+        return round(ordered[min(last, int(q * len(ordered)))], 2)
+
+    return {
+        "p50": at(0.50),
+        "p99": at(0.99),
+        "p999": at(0.999),
+        "max": round(ordered[last], 2),
+        "mean": round(sum(ordered) / len(ordered), 2),
+    }
+
+
+def payload_size(scenario: Scenario, codec: str) -> int:
+    """Az esemény kódolt mérete a buszon (inprocess esetén nincs kódolás).
+
+    Args:
+        scenario: A mérési eset
+        codec: A ZeroMQ-s transportok alapértelmezett codec-je
+
+    Returns:
+        int: A payload mérete bájtban
+    """
+    if scenario.transport == "inprocess":
+        return 0
+    codec_name = "binary" if scenario.event_type == "market_data" else codec
+    return len(get_codec(codec_name).encode(SAMPLE_EVENTS[scenario.event_type]))
+
+
+def create_bus(scenario: Scenario, codec: str, port: int) -> BaseEventBus:
+    """Friss busz példány az esethez.
+
+    Args:
+        scenario: A mérési eset
+        codec: A ZeroMQ-s transportok alapértelmezett codec-je
+        port: TCP esetén a publisher port
+
+    Returns:
+        BaseEventBus: A busz (még nem elindítva)
+    """
+    config = EventBusConfig(
+        pub_port=port,
+        use_inproc=scenario.transport != "tcp",
+        codec=codec,
+        codec_overrides={"market_data": "binary"},
+        subscriber_queue_size=scenario.queue_size,
+        overflow_policy=scenario.overflow,
+    )
+    if scenario.transport == "inprocess":
+        bus_class: type[BaseEventBus] = InProcessEventBus
+    else:
+        from neural_ai.core.events.implementations.zeromq_bus import EventBus
+
+        bus_class = EventBus
+
+    # A buszok singletonok; minden eset saját konfigurációval, új példányon fut
+    SingletonMeta._instances.pop(bus_class, None)
+    return bus_class(config)
+
+
+async def run_scenario(
+    scenario: Scenario, events: int, rate: float | None, codec: str, port: int
+) -> dict[str, Any]:
+    """Egy mérési eset lefuttatása.
+
+    Args:
+        scenario: A mérési eset
+        events: A közzétett események száma
+        rate: Célzott közzétételi ráta (esemény/s, None = amilyen gyorsan lehet)
+        codec: A ZeroMQ-s transportok codec-je
+        port: TCP esetén a publisher port
+
+    Returns:
+        dict[str, Any]: Az eset eredménye
+    """
+    bus = create_bus(scenario, codec, port)
+    fast_latencies: list[float] = []
+    slow_latencies: list[float] = []
+    delivered = 0
+    last_delivery = time.perf_counter()
+
+    def make_callback(slow: bool) -> Callable[[BaseModel], Coroutine[Any, Any, None]]:
+        latencies = slow_latencies if slow else fast_latencies
+
+        async def callback(event: BaseModel) -> None:
+            nonlocal delivered, last_delivery
+            published: datetime = event.timestamp  # type: ignore[attr-defined]
+            latencies.append((time.time() - published.timestamp()) * 1e6)
+            delivered += 1
+            last_delivery = time.perf_counter()
+            if slow:
+                await asyncio.sleep(scenario.slow_delay)
+
+        return callback
+
+    for index in range(scenario.fanout):
+        bus.subscribe(
+            scenario.event_type,
+            make_callback(index < scenario.slow_consumers),
+            name=f"sub{index}",
+        )
+
+    await bus.start()
+    receiver = asyncio.create_task(bus.run_forever())
+    if scenario.transport != "inprocess":
+        # A SUB socket feliratkozásának el kell jutnia a publisher-hez
+        await asyncio.sleep(0.3)
+
+    template = SAMPLE_EVENTS[scenario.event_type]
+    interval = 1.0 / rate if rate else 0.0
+
+    started = time.perf_counter()
+    for index in range(events):
+        if interval:
+            delay = started + index * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        event = template.model_copy(update={"timestamp": datetime.now(UTC)})
+        await bus.publish(scenario.event_type, event)
+        # A fogyasztók a közzétevővel azonos eseményhurkon futnak
+        await asyncio.sleep(0)
+    publish_seconds = time.perf_counter() - started
+
+    # Várakozás, amíg minden kézbesítés megtörtént vagy nincs több előrehaladás
+    expected = events * scenario.fanout
+    idle_since = time.perf_counter()
+    seen = delivered
+    while delivered < expected and time.perf_counter() - idle_since < 1.0:
+        await asyncio.sleep(0.01)
+        if delivered != seen:
+            seen = delivered
+            idle_since = time.perf_counter()
+
+    stats = bus.get_subscriber_stats()
+    # A fogadó task-nak a stop() előtt le kell állnia: amíg a SUB socketet
+    # használja, a ZeroMQ context lezárása végtelenül blokkolna
+    receiver.cancel()
+    try:
+        await receiver
+    except (asyncio.CancelledError, Exception):
+        pass
+    await bus.stop()
+
+    duration = max(last_delivery - started, 1e-9)
+    fast_consumers = max(1, scenario.fanout - scenario.slow_consumers)
+    return {
+        **asdict(scenario),
+        "events": events,
+        "target_rate": rate,
+        "payload_bytes": payload_size(scenario, codec),
+        "delivered": delivered,
+        "dropped": sum(s.dropped for s in stats),
+        "lost": expected - delivered - sum(s.dropped + s.conflated for s in stats),
+        "publish_seconds": round(publish_seconds, 6),
+        "duration_seconds": round(duration, 6),
+        "publish_rate_eps": round(events / max(publish_seconds, 1e-9), 1),
+        # Gyors feliratkozónként kézbesített esemény/s
+        "throughput_eps": round(len(fast_latencies) / fast_consumers / duration, 1),
+        "latency_us": percentiles(fast_latencies),
+        "slow_latency_us": percentiles(slow_latencies) if scenario.slow_consumers else None,
+    }
+
+
+def build_scenarios(transports: list[str], quick: bool) -> list[Scenario]:
+    """A futtatandó mérési esetek.
+
+    Args:
+        transports: A mért transportok
+        quick: Csak a reprezentatív esetek (fan-out 100 és eseménytípusok nélkül)
+
+    Returns:
+        list[Scenario]: A mérési esetek
+    """
+    scenarios: list[Scenario] = []
+    for transport in transports:
+        event_types = ["market_data"] if quick else list(SAMPLE_EVENTS)
+        for event_type in event_types:
+            scenarios.append(
+                Scenario(
+                    name=f"{transport}/size/{event_type}",
+                    transport=transport,
+                    event_type=event_type,
+                )
+            )
+        for fanout in FANOUTS:
+            if quick and fanout > 10:
+                continue
+            scenarios.append(
+                Scenario(name=f"{transport}/fanout/{fanout}", transport=transport, fanout=fanout)
+            )
+        for overflow in ("block", "drop_oldest"):
+            scenarios.append(
+                Scenario(
+                    name=f"{transport}/slow/{overflow}",
+                    transport=transport,
+                    fanout=2,
+                    slow_consumers=1,
+                    slow_delay=0.001,
+                    overflow=overflow,
+                    queue_size=1000,
+                )
+            )
+    return scenarios
+
+
+def main() -> int:
+    """Belépési pont.
+
+    Returns:
+        int: Kilépési kód
+    """
+    parser = argparse.ArgumentParser(description="EventBus késleltetés és áteresztőképesség")
+    parser.add_argument("--events", type=int, default=10000, help="Események esetenként")
+    parser.add_argument("--rate", type=float, default=None, help="Célzott ráta (esemény/s)")
+    parser.add_argument(
+        "--transport", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS), help="Transportok"
+    )
+    parser.add_argument("--codec", default="json", help="ZeroMQ codec (json, msgpack)")
+    parser.add_argument("--port", type=int, default=5755, help="TCP publisher port")
+    parser.add_argument("--quick", action="store_true", help="Csak a reprezentatív esetek")
+    parser.add_argument("--output", type=Path, default=None, help="JSON kimenet (alap: stdout)")
+    args = parser.parse_args()
+
+    transports = list(args.transport)
+    if any(t != "inprocess" for t in transports):
+        try:
+            import zmq  # noqa: F401
+        except ImportError:
+            print("pyzmq nincs telepítve, csak az inprocess transport fut", file=sys.stderr)
+            transports = [t for t in transports if t == "inprocess"]
+
+    results = []
+    for scenario in build_scenarios(transports, args.quick):
+        print(f"{scenario.name} ...", file=sys.stderr)
+        result = asyncio.run(run_scenario(scenario, args.events, args.rate, args.codec, args.port))
+        latency = result["latency_us"]
+        print(
+            f"  {result['throughput_eps']:>12,.0f} esemény/s  p50 {latency['p50']:>9.1f} µs  "
+            f"p99 {latency['p99']:>9.1f} µs  p999 {latency['p999']:>9.1f} µs",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    report = {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "events": args.events,
+            "rate": args.rate,
+            "codec": args.codec,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Esemény dekódolási utak összehasonlító mérése.
+
+Eseménytípusonként és codec-enként méri a fogadó oldali dekódolás idejét:
+
+    - legacy:   codec.decode() + Model(**data) (a régi if/elif lánc útja)
+    - validate: a regiszteren keresztüli validált út (JSON esetén
+                model_validate_json közvetlenül a wire bájtokból)
+    - trusted:  model_construct validáció nélkül (trusted_producers)
+
+Használat:
+    python scripts/benchmark_event_decoding.py
+    python scripts/benchmark_event_decoding.py --iterations 200000 --codec json binary
+"""
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from neural_ai.core.events.implementations.codecs import EventCodec, get_codec  # noqa: E402
+from neural_ai.core.events.implementations.registry import (  # noqa: E402
+    EventRegistry,
+    default_registry,
+)
+from neural_ai.core.events.interfaces.event_models import (  # noqa: E402
+    MarketDataEvent,
+    SignalEvent,
+    TradeEvent,
+)
+
+SAMPLE_EVENTS = {
+    "market_data": MarketDataEvent(
+        symbol="EURUSD",
+        timestamp=datetime(2024, 1, 2, 10, 30, 0, 123456, tzinfo=UTC),
+        bid=1.10412,
+        ask=1.10415,
+        volume=1200000,
+        source="jforex",
+    ),
+    "trade": TradeEvent(
+        symbol="EURUSD",
+        timestamp=datetime(2024, 1, 2, 10, 30, 1, tzinfo=UTC),
+        direction="BUY",
+        price=1.10415,
+        volume=0.5,
+        order_id="ord-000123",
+        strategy_id="mean_reversion",
+    ),
+    "signal": SignalEvent(
+        symbol="EURUSD",
+        timestamp=datetime(2024, 1, 2, 10, 30, 2, tzinfo=UTC),
+        signal_type="ENTRY_LONG",
+        confidence=0.87,
+        strategy_id="mean_reversion",
+        price=1.10415,
+        target_price=1.10700,
+        stop_loss=1.10200,
+    ),
+}
+
+
+def bench(func: Callable[[], object], iterations: int) -> float:
+    """Egy dekódolási út mérése.
+
+    Args:
+        func: A mért függvény (argumentum nélkül)
+        iterations: Az ismétlések száma
+
+    Returns:
+        float: Mikroszekundum / esemény (három futás legjobbja)
+    """
+    best = min(timeit.repeat(func, number=iterations, repeat=3))
+    return best / iterations * 1e6
+
+
+def measure_event(
+    codec: EventCodec,
+    event_type: str,
+    event: BaseModel,
+    registry: EventRegistry,
+    iterations: int,
+) -> tuple[int, float, float, float] | None:
+    """Egy esemény dekódolási útjainak mérése egy codec-kel.
+
+    Args:
+        codec: A codec
+        event_type: Az eseménytípus
+        event: A minta esemény
+        registry: Az eseménytípus regiszter
+        iterations: Az ismétlések száma
+
+    Returns:
+        tuple[int, float, float, float] | None: Payload méret és a legacy,
+        validate, trusted idők (µs), vagy None, ha az utak eltérő eseményt adnak
+    """
+    payload = codec.encode(event)
+    model = registry.model_for(event_type)
+
+    # Ellenőrizzük, hogy minden út ugyanazt az eseményt adja vissza
+    validated = codec.decode_event(event_type, payload, registry)
+    trusted = codec.decode_event(event_type, payload, registry, trusted=True)
+    if validated != event or trusted.model_dump() != event.model_dump():
+        return None
+
+    legacy_us = bench(lambda: model(**codec.decode(payload)), iterations)
+    validate_us = bench(lambda: codec.decode_event(event_type, payload, registry), iterations)
+    trusted_us = bench(
+        lambda: codec.decode_event(event_type, payload, registry, trusted=True), iterations
+    )
+    return len(payload), legacy_us, validate_us, trusted_us
+
+
+def main() -> int:
+    """Belépési pont.
+
+    Returns:
+        int: Kilépési kód
+    """
+    parser = argparse.ArgumentParser(description="Esemény dekódolási utak mérése")
+    parser.add_argument("--iterations", type=int, default=50000, help="Ismétlések száma")
+    parser.add_argument(
+        "--codec",
+        nargs="+",
+        default=["json", "msgpack", "binary"],
+        help="Mért codec-ek (json, msgpack, binary)",
+    )
+    args = parser.parse_args()
+
+    registry = default_registry()
+    print(f"{'esemény':<12} {'codec':<8} {'bájt':>5} {'legacy':>9} {'validate':>9} {'trusted':>9}")
+    print(f"{'':<12} {'':<8} {'':>5} {'µs':>9} {'µs':>9} {'µs':>9}")
+
+    for codec_name in args.codec:
+        try:
+            codec = get_codec(codec_name)
+        except Exception as e:
+            print(f"{codec_name}: kihagyva ({e})")
+            continue
+
+        for event_type, event in SAMPLE_EVENTS.items():
+            if not codec.supports(event_type):
+                continue
+            result = measure_event(codec, event_type, event, registry, args.iterations)
+            if result is None:
+                print(f"{event_type}/{codec_name}: eltérő dekódolt esemény!")
+                return 1
+            size, legacy_us, validate_us, trusted_us = result
+            print(
+                f"{event_type:<12} {codec_name:<8} {size:>5} "
+                f"{legacy_us:>9.2f} {validate_us:>9.2f} {trusted_us:>9.2f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
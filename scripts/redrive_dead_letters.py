@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Dead-letter bejegyzések listázása és újraküldése az EventBus-ra.
+
+A busz a configs/events.yaml alapján jön létre, és csak broker módban
+(broker_mode: true) használható: a script saját folyamatként fut, így
+broker nélkül vagy a futó alkalmazás portját próbálná bind-olni, vagy
+feliratkozók nélkül küldene. Küldés előtt a script megvárja, hogy a broker
+az újraküldendő eseménytípusokra feliratkozást továbbítson (különben nincs,
+aki fogadja az eseményeket), majd még settle ideig vár, hogy a busz saját
+publisher socketje is megkapja a feliratkozásokat.
+
+Az újraküldött események az eseménytípus minden feliratkozójához eljutnak.
+A bejegyzések a sikeres küldés után törlődnek; a ZeroMQ nem nyugtáz, így ez
+"elküldve"-t jelent, nem "kézbesítve"-t.
+
+Használat:
+    python scripts/redrive_dead_letters.py --list
+    python scripts/redrive_dead_letters.py --event-type trade --limit 100
+    python scripts/redrive_dead_letters.py --sink file --path logs/dead_letters.jsonl
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from neural_ai.core.config.factory import ConfigManagerFactory  # noqa: E402
+from neural_ai.core.events.exceptions import EventBusError  # noqa: E402
+from neural_ai.core.events.factory import EventBusFactory  # noqa: E402
+from neural_ai.core.events.implementations.dead_letter import (  # noqa: E402
+    SINK_TYPES,
+    DeadLetterSink,
+    create_sink,
+    redrive_dead_letters,
+)
+from neural_ai.core.events.interfaces.event_bus_interface import (  # noqa: E402
+    EventBusConfig,
+    EventBusInterface,
+)
+
+
+async def list_letters(sink: DeadLetterSink, event_type: str | None, limit: int | None) -> None:
+    """A mentett bejegyzések kiírása.
+
+    Args:
+        sink: A tároló
+        event_type: Csak ez az eseménytípus
+        limit: Legfeljebb ennyi bejegyzés
+    """
+    for letter in await sink.read(event_type=event_type, limit=limit):
+        print(
+            f"{letter.letter_id}  {letter.event_type:<14} {letter.reason:<8} "
+            f"{letter.subscriber or '-':<30} {letter.exception_type}: {letter.exception_message}"
+        )
+
+
+async def wait_for_subscribers(
+    config: EventBusConfig, event_types: set[str], timeout: float
+) -> set[str]:
+    """Várakozás, amíg a broker feliratkozást továbbít az eseménytípusokra.
+
+    Egy ideiglenes XPUB socket csatlakozik a broker publisher végpontjára: a
+    broker az összes aktív feliratkozást továbbítja neki.
+
+    Args:
+        config: Az EventBus konfigurációja (broker cím és port)
+        event_types: Az újraküldendő eseménytípusok
+        timeout: A várakozás felső korlátja másodpercben
+
+    Returns:
+        set[str]: Azok az eseménytípusok, amelyekre nem érkezett feliratkozás
+    """
+    import zmq
+    import zmq.asyncio
+
+    context = zmq.asyncio.Context.instance()
+    probe = context.socket(zmq.XPUB)
+    probe.setsockopt(zmq.LINGER, 0)
+    probe.connect(f"tcp://{config.broker_host}:{config.pub_port}")
+    missing = set(event_types)
+    deadline = time.monotonic() + timeout
+    try:
+        while missing:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                message = await asyncio.wait_for(probe.recv(), timeout=remaining)
+            except TimeoutError:
+                break
+            # Feliratkozási üzenet: 0x01, majd a témakör prefix
+            if message[:1] == b"\x01":
+                topic = message[1:].decode("utf-8", errors="replace")
+                missing = {event_type for event_type in missing if not event_type.startswith(topic)}
+    finally:
+        probe.close()
+    return missing
+
+
+async def redrive(
+    bus: EventBusInterface,
+    sink: DeadLetterSink,
+    event_type: str | None,
+    limit: int | None,
+    timeout: float,
+    settle: float,
+) -> int:
+    """Újraküldés a konfigurált (broker módú) buszra.
+
+    Args:
+        bus: A broker módú EventBus (még nem elindítva)
+        sink: A tároló
+        event_type: Csak ez az eseménytípus
+        limit: Legfeljebb ennyi bejegyzés
+        timeout: Várakozás a feliratkozókra másodpercben
+        settle: További várakozás a feliratkozások megérkezése után
+
+    Returns:
+        int: Kilépési kód (1, ha nem volt feliratkozó vagy sikertelen volt az újraküldés)
+    """
+    letters = await sink.read(event_type=event_type, limit=limit)
+    if not letters:
+        print("Nincs újraküldendő bejegyzés")
+        return 0
+
+    await bus.start()
+    try:
+        missing = await wait_for_subscribers(
+            bus.config, {letter.event_type for letter in letters}, timeout
+        )
+        if missing:
+            logging.error(
+                f"Nincs feliratkozó a brokeren ({sorted(missing)}); a bejegyzések megmaradnak"
+            )
+            return 1
+        # A busz saját publisher socketje is megkapja a továbbított feliratkozásokat
+        await asyncio.sleep(settle)
+        redriven, failed = await redrive_dead_letters(
+            sink, bus=bus, event_type=event_type, limit=limit
+        )
+        await bus.flush()
+    finally:
+        await bus.stop()
+    print(f"Elküldve: {redriven}, sikertelen: {failed}")
+    return 1 if failed else 0
+
+
+def main() -> int:
+    """Belépési pont.
+
+    Returns:
+        int: Kilépési kód
+    """
+    defaults = EventBusConfig()
+    parser = argparse.ArgumentParser(description="Dead-letter bejegyzések újraküldése")
+    parser.add_argument(
+        "--sink", choices=SINK_TYPES, default=defaults.dead_letter_sink, help="A tároló típusa"
+    )
+    parser.add_argument(
+        "--path", default=defaults.dead_letter_path, help="A JSON Lines fájl ('file' tárolónál)"
+    )
+    parser.add_argument("--event-type", help="Csak ez az eseménytípus")
+    parser.add_argument("--limit", type=int, help="Legfeljebb ennyi bejegyzés")
+    parser.add_argument("--list", action="store_true", help="Csak listázás, újraküldés nélkül")
+    parser.add_argument(
+        "--timeout", type=float, default=10.0, help="Várakozás a feliratkozókra (s)"
+    )
+    parser.add_argument(
+        "--settle", type=float, default=1.0, help="Várakozás a feliratkozások után (s)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    try:
+        sink = create_sink(args.sink, args.path)
+        if args.list:
+            asyncio.run(list_letters(sink, args.event_type, args.limit))
+            return 0
+
+        config = ConfigManagerFactory.create_manager("yaml")
+        config.load_directory(str(PROJECT_ROOT / "configs"))
+        bus = EventBusFactory.create_from_config(config)
+        if not bus.config.broker_mode or bus.config.use_inproc:
+            logging.error(
+                "Az újraküldéshez broker módú busz szükséges (events.broker_mode: true, "
+                "use_inproc: false); külön folyamatból más módban az események elvesznének"
+            )
+            return 1
+        return asyncio.run(
+            redrive(bus, sink, args.event_type, args.limit, args.timeout, args.settle)
+        )
+    except EventBusError as e:
+        logging.error(str(e))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
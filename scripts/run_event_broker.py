@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""EventBus XPUB/XSUB broker önálló folyamatként.
+
+A broker módban (broker_mode: true) futó EventBus-ok ehhez csatlakoznak: a
+collectorok és más publisher-ek a pub_port-ra, a stratégiák és más
+subscriber-ek a sub_port-ra.
+
+Használat:
+    python scripts/run_event_broker.py
+    python scripts/run_event_broker.py --pub-port 5555 --sub-port 5556
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from neural_ai.core.events.exceptions import EventBusError  # noqa: E402
+from neural_ai.core.events.implementations.broker import EventBroker  # noqa: E402
+from neural_ai.core.events.interfaces.event_bus_interface import EventBusConfig  # noqa: E402
+
+
+def main() -> int:
+    """Belépési pont.
+
+    Returns:
+        int: Kilépési kód
+    """
+    defaults = EventBusConfig()
+    parser = argparse.ArgumentParser(description="EventBus XPUB/XSUB broker")
+    parser.add_argument(
+        "--pub-port", type=int, default=defaults.pub_port, help="Publisher-ek portja (XSUB)"
+    )
+    parser.add_argument(
+        "--sub-port", type=int, default=defaults.sub_port, help="Subscriber-ek portja (XPUB)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    broker = EventBroker(EventBusConfig(pub_port=args.pub_port, sub_port=args.sub_port))
+    try:
+        broker.run_forever()
+    except EventBusError as e:
+        logging.error(str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Közös pytest fixture-ök.
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def tick_storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
+    """ParquetStorageService a tmp_path alatt, PandasBackend-del.
+
+    A ParquetStorageService singleton, ezért a teszt idejére üres példánytárat kap.
+    """
+    pytest.importorskip("structlog")
+    from neural_ai.core.base.implementations.singleton import SingletonMeta
+    from neural_ai.core.storage.implementations.parquet_storage import ParquetStorageService
+
+    monkeypatch.setattr(SingletonMeta, "_instances", {})
+    hardware = MagicMock()
+    hardware.has_avx2.return_value = False
+    return ParquetStorageService(base_path=tmp_path, hardware=hardware)
@@ -0,0 +1,117 @@
+"""A bi5_decoder modul tesztjei.
+
+A tests/fixtures/bi5 könyvtár egy kis Dukascopy szerkezetű EURUSD mintát
+tartalmaz (a hónap 0-tól számozott):
+
+    2024/00/15/23h_ticks.bi5: 3 tick (0, 1500 és 3599999 ms eltolással)
+    2024/00/16/00h_ticks.bi5: 1 tick (250 ms eltolással)
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import lzma
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("structlog")
+
+from neural_ai.core.storage.implementations.bi5_decoder import (  # noqa: E402
+    Bi5Importer,
+    decode_bi5,
+    decode_bi5_file,
+    get_point_value,
+    hour_from_path,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "bi5" / "EURUSD"
+HOUR_FILE = FIXTURES / "2024" / "00" / "15" / "23h_ticks.bi5"
+NEXT_DAY_FILE = FIXTURES / "2024" / "00" / "16" / "00h_ticks.bi5"
+
+# 2024-01-15 23:00 UTC mikroszekundumban
+HOUR_MICROS = 1_705_359_600_000_000
+
+
+def test_hour_from_path_uses_zero_based_month() -> None:
+    """A könyvtárszerkezet hónapja 0-tól számozott."""
+    assert hour_from_path(HOUR_FILE) == datetime(2024, 1, 15, 23)
+    assert hour_from_path(NEXT_DAY_FILE) == datetime(2024, 1, 16, 0)
+
+
+def test_hour_from_path_rejects_other_layouts(tmp_path: Path) -> None:
+    """A nem Dukascopy útvonal ValueError-t ad."""
+    with pytest.raises(ValueError):
+        hour_from_path(tmp_path / "ticks.bi5")
+
+
+def test_get_point_value() -> None:
+    """Három tizedes a JPY kereszteknél és a nemesfémeknél, egyébként öt."""
+    assert get_point_value("eurusd") == 1e5
+    assert get_point_value("USDJPY") == 1e3
+    assert get_point_value("XAUUSD") == 1e3
+
+
+def test_decode_bi5_file_prices_and_offsets() -> None:
+    """A fixture árai, időbélyegei és volumenei."""
+    ticks = decode_bi5_file(str(HOUR_FILE), get_point_value("EURUSD"))
+
+    assert len(ticks) == 3
+    assert (ticks["timestamp"] - HOUR_MICROS).tolist() == [0, 1_500_000, 3_599_999_000]
+    assert ticks["bid"].tolist() == pytest.approx([1.08500, 1.08501, 1.08507])
+    assert ticks["ask"].tolist() == pytest.approx([1.08502, 1.08505, 1.08510])
+    assert ticks["volume"].tolist() == pytest.approx([3.5, 1.0, 2.0])
+
+
+def test_decode_bi5_uncompressed_and_empty() -> None:
+    """A kitömörített tartalom ugyanazt adja; az üres fájl tick nélküli óra."""
+    hour = datetime(2024, 1, 15, 23)
+    raw = lzma.decompress(HOUR_FILE.read_bytes())
+
+    compressed = decode_bi5(HOUR_FILE.read_bytes(), hour, 1e5)
+    uncompressed = decode_bi5(raw, hour, 1e5, compressed=False)
+
+    assert np.array_equal(compressed, uncompressed)
+    assert len(decode_bi5(b"", hour, 1e5)) == 0
+
+
+def test_decode_bi5_rejects_truncated_records() -> None:
+    """A nem egész számú rekordból álló tartalom ValueError-t ad."""
+    raw = lzma.decompress(HOUR_FILE.read_bytes())
+    with pytest.raises(ValueError):
+        decode_bi5(raw[:-1], datetime(2024, 1, 15, 23), 1e5, compressed=False)
+
+
+async def test_import_directory_writes_day_partitions(tmp_path: Path, tick_storage: Any) -> None:
+    """Az éjfélen átnyúló órák külön napi partícióba kerülnek."""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("fastparquet")
+    storage = tick_storage
+
+    stats = await Bi5Importer(storage, max_workers=1).import_directory("eurusd", FIXTURES)
+
+    assert stats.symbol == "EURUSD"
+    assert stats.files == 2
+    assert stats.rows_written == 4
+    assert stats.days == [datetime(2024, 1, 15), datetime(2024, 1, 16)]
+
+    first_day = storage.get_partition_path("EURUSD", datetime(2024, 1, 15))
+    second_day = storage.get_partition_path("EURUSD", datetime(2024, 1, 16))
+    assert first_day == tmp_path / "EURUSD/tick/year=2024/month=01/day=15/data.parquet"
+    assert sorted(tmp_path.rglob("*.parquet")) == [first_day, second_day]
+
+    first = pd.read_parquet(first_day)
+    assert first["timestamp"].tolist() == [
+        pd.Timestamp("2024-01-15 23:00:00"),
+        pd.Timestamp("2024-01-15 23:00:01.500"),
+        pd.Timestamp("2024-01-15 23:59:59.999"),
+    ]
+    assert first["bid"].tolist() == pytest.approx([1.08500, 1.08501, 1.08507])
+    assert set(first["source"]) == {"jforex"}
+
+    second = pd.read_parquet(second_day)
+    assert second["timestamp"].tolist() == [pd.Timestamp("2024-01-16 00:00:00.250")]
+    assert second["ask"].tolist() == pytest.approx([1.08520])
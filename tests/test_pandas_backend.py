@@ -0,0 +1,47 @@
+"""A PandasBackend tesztjei.
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("fastparquet")
+
+from neural_ai.core.storage.backends.pandas_backend import PandasBackend  # noqa: E402
+
+
+def test_iter_batches_applies_filters_per_row(tmp_path: Path) -> None:
+    """A szűrő a row group-on belül is érvényesül, az oszlopszűkítés mellett is."""
+    path = str(tmp_path / "ticks.parquet")
+    data = pd.DataFrame({"bid": [i / 1000 for i in range(1000)], "ask": range(1000)})
+    backend = PandasBackend()
+    backend.write(data, path)
+
+    batches = list(
+        backend.iter_batches(path, batch_size=300, columns=["ask"], filters=[("bid", ">=", 0.5)])
+    )
+
+    assert [len(batch) for batch in batches] == [300, 200]
+    assert list(batches[0].columns) == ["ask"]
+    assert pd.concat(batches)["ask"].tolist() == list(range(500, 1000))
+
+
+def test_get_info_returns_datetimes_and_copies_row_groups(tmp_path: Path) -> None:
+    """A timestamp_min/max datetime, a row_groups módosítása nem hat a cache-re."""
+    path = str(tmp_path / "ticks.parquet")
+    timestamps = pd.date_range("2024-01-15 10:00", periods=3, freq="s")
+    backend = PandasBackend()
+    backend.write(pd.DataFrame({"timestamp": timestamps, "bid": [1.0, 1.1, 1.2]}), path)
+
+    info = backend.get_info(path)
+    assert info["timestamp_min"] == datetime(2024, 1, 15, 10, 0, 0)
+    assert info["timestamp_max"] == datetime(2024, 1, 15, 10, 0, 2)
+    assert type(info["timestamp_min"]) is datetime
+
+    info["row_groups"].clear()
+    assert len(backend.get_info(path)["row_groups"]) == 1
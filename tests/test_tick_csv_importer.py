@@ -0,0 +1,65 @@
+"""A tick_csv_importer modul tesztjei.
+
+Author: Neural AI Next Team
+Version: 1.0.0
+"""
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+CSV_CONTENT = (
+    "timestamp,bid,ask,volume\n"
+    "2024-01-15 23:59:58.500,1.08500,1.08502,1.5\n"
+    "2024-01-15 23:59:59.999,1.08501,1.08505,\n"
+    "2024-01-16 00:00:00.250,1.08518,1.08520,3.0\n"
+)
+
+
+@pytest.mark.parametrize("file_name", ["ticks.csv", "ticks.csv.gz"])
+async def test_import_tick_csv_writes_day_partitions(
+    tmp_path: Path, tick_storage: Any, file_name: str
+) -> None:
+    """A tömörítetlen és a gzip CSV ugyanazokat a napi partíciókat adja."""
+    csv_path = tmp_path / "input" / file_name
+    csv_path.parent.mkdir()
+    if file_name.endswith(".gz"):
+        csv_path.write_bytes(gzip.compress(CSV_CONTENT.encode()))
+    else:
+        csv_path.write_text(CSV_CONTENT)
+
+    stats = await tick_storage.import_tick_csv("eurusd", csv_path)
+
+    assert stats.symbol == "EURUSD"
+    assert stats.rows_read == 3
+    assert stats.rows_written == 3
+    assert stats.rows_dropped == 0
+    assert stats.days == [datetime(2024, 1, 15), datetime(2024, 1, 16)]
+
+    first = pq.read_table(tick_storage.get_partition_path("EURUSD", datetime(2024, 1, 15)))
+    assert first.column("timestamp").to_pylist() == [
+        datetime(2024, 1, 15, 23, 59, 58, 500_000),
+        datetime(2024, 1, 15, 23, 59, 59, 999_000),
+    ]
+    assert first.column("bid").to_pylist() == pytest.approx([1.08500, 1.08501])
+    assert first.column("volume").to_pylist()[0] == pytest.approx(1.5)
+    assert set(first.column("source").to_pylist()) == {"csv_import"}
+
+    second = pq.read_table(tick_storage.get_partition_path("EURUSD", datetime(2024, 1, 16)))
+    assert second.column("ask").to_pylist() == pytest.approx([1.08520])
+
+
+async def test_import_tick_csv_missing_required_column(tmp_path: Path, tick_storage: Any) -> None:
+    """Kötelező oszlop hiányában ValueError, partíció nem jön létre."""
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_text("timestamp,bid\n2024-01-15 10:00:00,1.085\n")
+
+    with pytest.raises(ValueError):
+        await tick_storage.import_tick_csv("EURUSD", csv_path)
+    assert not list(tmp_path.rglob("*.parquet"))